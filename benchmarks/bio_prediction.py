@@ -0,0 +1,201 @@
+### Bio prediction benchmark and golden predictions
+# Generates systems of stars and planets with biological signals, covering every planet type with every atmosphere type, and
+# times the bio predictions: one genus at a time as Genus.list_possible_species, one planet at a time with the rule table,
+# a whole system at once with the predictor, and a repeated report through the prediction cache.
+# The predictions of every path are checked against bio_prediction_golden.json, so a rewrite of src.bios can be shown to
+# predict exactly the same species and worth. The golden file holds the predictions of the bio rules as they were before
+# src.bios was rewritten (see bio_prediction_baseline), followed by every intended change to the predictions since, each
+# with the planets it changed. The predictions are expected to be the baseline with the changes applied in order.
+# Run from the EDSST root folder: uv run python -m benchmarks.bio_prediction [--check | --update "what changed"]
+
+from benchmarks.synthetic import body_signals, planet_scan, star_scan
+from src.bios import BioWorth, PredictionCache, Species, get_taxonomy
+from src.bios.batch import planet_worth
+from src.modules.core import Bodies, Body, BodyAttribute, body_event_attributes
+from src.util import AtmosphereType, PlanetType
+from pathlib import Path
+from typing import Any, Callable
+import argparse
+import json
+import random
+import sys
+import time
+
+GOLDEN_FILE = Path(__file__).with_name("bio_prediction_golden.json")
+SEED = 0
+NUM_SYSTEMS = 200
+COMBINATIONS: list[tuple[str, str]] = [(planet_type.value, atmosphere.value) for planet_type in PlanetType if planet_type != PlanetType.NONE
+                                       for atmosphere in AtmosphereType if atmosphere != AtmosphereType.ANY]
+# Every star class and luminosity the taxonomy has rules for, and some it does not
+STAR_TYPES: list[str] = ["O", "B", "A", "F", "G", "K", "M", "L", "T", "Y", "TTS", "AeBe", "DA", "DB", "DC", "N", "W", "C", "MS", "H"]
+LUMINOSITIES: list[str] = ["0", "Ia0", "Ia", "Iab", "Ib", "II", "IIab", "III", "IIIb", "IV", "IVa", "V", "Va", "Vab", "Vb", "Vz", "VI", "VII"]
+VOLCANISMS: list[str] = ["", "", "", "minor water geysers volcanism", "water magma volcanism", "major silicate vapour geysers volcanism",
+                         "carbon dioxide geysers volcanism", "minor rocky magma volcanism", "nitrogen magma volcanism", "ammonia magma volcanism",
+                         "methane magma volcanism", "major metallic magma volcanism", "helium geysers volcanism", "iron magma volcanism"]
+REPEATS = 3
+
+Prediction = tuple[int, int, int, list[list[str]]]    # (minimum, maximum, average, species codes of each genus)
+Golden = dict[str, Prediction | None]   # "system/body" -> prediction, None where the prediction failed
+Change = tuple[str, Golden]             # what changed, the planets it changed
+
+
+def system_events(rng: random.Random, address: int, first_planet: int) -> list[dict[str, Any]]:
+    # The stars, then planets in the bio temperature and gravity ranges taking turns at the planet and atmosphere types
+    events: list[dict[str, Any]] = []
+    num_stars = rng.randint(1, 3)
+    for body_id in range(1, num_stars + 1):
+        event = star_scan(rng, address, body_id)
+        event.update(StarType=rng.choice(STAR_TYPES), Luminosity=rng.choice(LUMINOSITIES))
+        events.append(event)
+    for i, body_id in enumerate(range(num_stars + 1, num_stars + 1 + rng.randint(4, 16))):
+        planet_class, atmosphere_type = COMBINATIONS[(first_planet + i) % len(COMBINATIONS)]
+        event = planet_scan(rng, address, body_id, rng.randint(1, num_stars), planet_class, atmosphere_type)
+        temperature = rng.choice([rng.uniform(20, 600), float(rng.randint(140, 200))])
+        event.update(SurfaceTemperature=temperature, SurfaceGravity=rng.uniform(0.2, 6.0), Volcanism=rng.choice(VOLCANISMS),
+                     DistanceFromArrivalLS=rng.uniform(10, 6000), SemiMajorAxis=rng.uniform(1e9, 8e12), Eccentricity=rng.uniform(0, 0.5))
+        events.append(event)
+        events.append(body_signals(address, body_id, rng.randint(1, 6), 0))
+    rng.shuffle(events)
+    return events
+
+def corpus_events(seed: int, num_systems: int) -> list[tuple[int, list[dict[str, Any]]]]:
+    # (SystemAddress, body events) of every system
+    rng = random.Random(seed)
+    systems: list[tuple[int, list[dict[str, Any]]]] = []
+    first_planet = 0
+    for address in range(1, num_systems + 1):
+        events = system_events(rng, address, first_planet)
+        systems.append((address, events))
+        first_planet += sum(1 for event in events if event["event"] == "FSSBodySignals")    # every planet has biological signals
+    return systems
+
+def corpus(seed: int, num_systems: int) -> list[tuple[int, Bodies, list[Body], list[int]]]:
+    # (SystemAddress, bodies, planets with biological signals, number of signals of each) of every system
+    systems: list[tuple[int, Bodies, list[Body], list[int]]] = []
+    for address, events in corpus_events(seed, num_systems):
+        bodies = Bodies()
+        for event in events:
+            bodies.add_body_signal(event)
+            for attribute in body_event_attributes(event):
+                bodies.record_attribute(attribute, event["BodyID"])
+        planets = list(bodies.query(BodyAttribute.bios))
+        counts = [sum(signal.count for signal in planet.signals if signal.type == "$SAA_SignalType_Biological;") for planet in planets]
+        systems.append((address, bodies, planets, counts))
+    return systems
+
+def by_genus(bodies: Bodies, planet: Body) -> list[list[Species]]:
+    return [possible for possible in (genus.list_possible_species(bodies, planet) for genus in get_taxonomy().genera) if possible]
+
+def by_rule_table(bodies: Bodies, planet: Body) -> list[list[Species]]:
+    return get_taxonomy().rule_table.possible_species(bodies, planet)
+
+def predict_by_planet(systems: list[tuple[int, Bodies, list[Body], list[int]]], possible_species: Callable[[Bodies, Body], list[list[Species]]]) -> list[list[BioWorth]]:
+    return [[planet_worth(possible_species(bodies, planet), count) for planet, count in zip(planets, counts)] for _, bodies, planets, counts in systems]
+
+def predict_by_system(systems: list[tuple[int, Bodies, list[Body], list[int]]]) -> list[list[BioWorth]]:
+    predictor = get_taxonomy().predictor
+    return [predictor.estimate_worth(bodies, planets, counts) for _, bodies, planets, counts in systems]
+
+def predict_cached(systems: list[tuple[int, Bodies, list[Body], list[int]]], cache: PredictionCache) -> list[list[BioWorth]]:
+    return [cache.estimate_worth(get_taxonomy().predictor, address, bodies, planets, counts) for address, bodies, planets, counts in systems]
+
+def golden_of(systems: list[tuple[int, Bodies, list[Body], list[int]]], worths: list[list[BioWorth]]) -> Golden:
+    return {f"{address}/{planet.body_id}": (minimum, maximum, average, [[organism.code for organism in genus] for genus in possible])
+            for (address, _, planets, _), system_worths in zip(systems, worths) for planet, (minimum, maximum, average, possible) in zip(planets, system_worths)}
+
+def decode_golden(planets: dict[str, Any]) -> Golden:
+    return {key: None if prediction is None else (prediction[0], prediction[1], prediction[2], prediction[3]) for key, prediction in planets.items()}
+
+def read_golden() -> tuple[Golden, list[Change]]:
+    # The baseline predictions and the intended changes since
+    golden = json.loads(GOLDEN_FILE.read_text())
+    return decode_golden(golden["baseline"]), [(change["change"], decode_golden(change["planets"])) for change in golden["changes"]]
+
+def expected_golden(baseline: Golden, changes: list[Change]) -> Golden:
+    expected = dict(baseline)
+    for _, planets in changes:
+        expected.update(planets)
+    return expected
+
+def format_planets(planets: Golden, indent: str) -> str:
+    # One planet per line, so a change in the predictions shows as a readable diff
+    return f",\n".join(f"{indent}{json.dumps(key)}: {json.dumps(None if prediction is None else list(prediction))}" for key, prediction in planets.items())
+
+def write_golden(baseline: Golden, changes: list[Change]) -> None:
+    formatted_changes = [f'    {{"change": {json.dumps(change)}, "planets": {{\n{format_planets(planets, "        ")}\n    }}}}' for change, planets in changes]
+    GOLDEN_FILE.write_text(f'{{"seed": {SEED}, "systems": {NUM_SYSTEMS},\n"baseline": {{\n{format_planets(baseline, "    ")}\n}},\n'
+                           f'"changes": [\n{",\n".join(formatted_changes)}\n]}}\n')
+
+def differences(expected: Golden, actual: Golden) -> list[str]:
+    return [f"{key}: expected {expected.get(key)}, predicted {actual.get(key)}" for key in sorted(expected.keys() | actual.keys()) if expected.get(key) != actual.get(key)]
+
+def timed(function: Callable[[], list[list[BioWorth]]]) -> tuple[float, list[list[BioWorth]]]:
+    best = float("inf")
+    result: list[list[BioWorth]] = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bio prediction benchmark")
+    parser.add_argument("--check", action="store_true", help="only check the predictions against the golden file, without timing them")
+    parser.add_argument("--update", metavar="CHANGE", help="add the planets whose predictions differ from the golden file to it, as an intended change described by CHANGE")
+    parser.add_argument("--events", action="store_true", help="print the events and bio planets of the corpus as JSON, for bio_prediction_baseline")
+    parser.add_argument("--baseline", metavar="FILE", type=Path, help="replace the golden file with the predictions bio_prediction_baseline printed to FILE")
+    arguments = parser.parse_args()
+
+    systems = corpus(SEED, NUM_SYSTEMS)
+    num_planets = sum(len(planets) for _, _, planets, _ in systems)
+    covered = {(planet.planet_class, planet.atmosphere_type) for _, _, planets, _ in systems for planet in planets}
+    assert covered == set(COMBINATIONS), "the corpus misses some planet and atmosphere types"
+    if arguments.events:
+        json.dump([{"address": address, "events": events, "planets": [[planet.body_id, count] for planet, count in zip(planets, counts)]}
+                   for (address, events), (_, _, planets, counts) in zip(corpus_events(SEED, NUM_SYSTEMS), systems)], sys.stdout)
+        return
+    if arguments.baseline:
+        generated = json.loads(arguments.baseline.read_text())
+        write_golden(decode_golden(generated["baseline"]), [(change, decode_golden(planets)) for change, planets in generated["changes"]])
+        print(f"Wrote the baseline predictions and {len(generated["changes"])} changes to {GOLDEN_FILE}")
+        return
+    baseline, changes = read_golden()
+    golden = expected_golden(baseline, changes)
+    if arguments.update:
+        predicted = golden_of(systems, predict_by_planet(systems, by_genus))
+        changed: Golden = {key: prediction for key, prediction in predicted.items() if golden.get(key) != prediction}
+        if not changed:
+            print("The predictions are those of the golden file, nothing to add")
+            return
+        write_golden(baseline, changes + [(arguments.update, changed)])
+        print(f"Added the changed predictions of {len(changed)} planets to {GOLDEN_FILE}")
+        return
+
+    print(f"Predicting the bios of {num_planets} planets in {NUM_SYSTEMS} systems, every planet type with every atmosphere type")
+    warm_cache = PredictionCache(num_planets)
+    predict_cached(systems, warm_cache)
+    paths: list[tuple[str, Callable[[], list[list[BioWorth]]]]] = [
+        ("by genus", lambda: predict_by_planet(systems, by_genus)),
+        ("rule table", lambda: predict_by_planet(systems, by_rule_table)),
+        ("predictor", lambda: predict_by_system(systems)),
+        ("cached", lambda: predict_cached(systems, warm_cache)),
+    ]
+    failed = False
+    for label, predict in paths:
+        if arguments.check:
+            seconds, worths = 0.0, predict()
+        else:
+            seconds, worths = timed(predict)
+            print(f"  {label:12} {seconds / NUM_SYSTEMS * 1e6:9.1f} us per system  {seconds / num_planets * 1e6:8.1f} us per planet")
+        wrong = differences(golden, golden_of(systems, worths))
+        if wrong:
+            failed = True
+            print(f"  {label} differs from the golden predictions on {len(wrong)} planets, the first ones:")
+            for line in wrong[:5]:
+                print(f"    {line}")
+    print(f"Predictions identical to the golden file: {"NO" if failed else "yes"}")
+    if failed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
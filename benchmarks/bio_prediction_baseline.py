@@ -0,0 +1,163 @@
+### Baseline of the golden bio predictions
+# Predicts the bio planets of the bio_prediction corpus with the bio rules as they were before src.bios was rewritten (EDSST
+# commit edc841d), that commit's Species.check_viability and FSSReporter.get_estimated_bio_worth, then again after each
+# change to the predictions the rewrite made on purpose, applied one after another on top of the old rules. The golden file
+# lists the planets each change changed, so every difference from the old predictions is one of CHANGES.
+# Run next to a checkout of the old src, from the EDSST root folder:
+#   git worktree add ../edsst-baseline edc841d && cp config.default.toml ../edsst-baseline/config.toml && mkdir ../edsst-baseline/modules_data
+#   uv run python -m benchmarks.bio_prediction --events | (cd ../edsst-baseline && uv run python ../EDSST/benchmarks/bio_prediction_baseline.py) > baseline.json
+#   uv run python -m benchmarks.bio_prediction --baseline baseline.json
+
+from typing import Any, Callable
+import asyncio
+import contextlib
+import json
+import os
+import sys
+
+sys.path.insert(0, os.getcwd())     # the old src, not the one next to this file
+from src.bios import taxon     # pyright: ignore
+from src.bios.electricae import Pluma     # pyright: ignore
+from src.bios.species import Species     # pyright: ignore
+from src.modules.core import BodyAttribute, Bodies, CoreModule, StarSystem     # pyright: ignore
+from src.modules.fssreporter import FSSReporter     # pyright: ignore
+
+Golden = dict[str, Any]
+
+
+def luminosity_class(luminosity: str) -> str:     # as src.util.luminosity_class
+    return luminosity.rstrip("0abz") or luminosity
+
+def parent_stars(star_system: Bodies, planet: dict[str, Any]) -> list[dict[str, Any]]:
+    # As Bodies.parent_stars: the nearest star up the planet's Parents chain, or the stars orbiting the nearest barycentre
+    stars = star_system.get_bodies_by_attribute(BodyAttribute.star)
+    for parent in planet.get("Parents", []):
+        for kind, parent_id in parent.items():
+            if kind == "Star":
+                return [star for star in stars if star["BodyID"] == parent_id]
+            if kind == "Null":
+                around = [star for star in stars if star.get("Parents") and star["Parents"][0].get("Null") == parent_id]
+                if around:
+                    return around
+    return []
+
+class Rules:
+    # Which of CHANGES are applied
+    any_subclass = False
+    luminosity_classes = False
+    parent_stars_only = False
+
+    def stars(self, star_system: Bodies, planet: dict[str, Any]) -> list[dict[str, Any]]:
+        if self.parent_stars_only:
+            return parent_stars(star_system, planet) or star_system.get_bodies_by_attribute(BodyAttribute.star)
+        return star_system.get_bodies_by_attribute(BodyAttribute.star)
+
+    def star_matches(self, species: Species, star_system: Bodies, planet: dict[str, Any]) -> bool:
+        # The star loop of the old Species.check_viability with the changes applied
+        for star_type in species.star_types:
+            for star in self.stars(star_system, planet):
+                luminosity = luminosity_class(star["Luminosity"]) if self.luminosity_classes else star["Luminosity"]
+                if star_type.spectral_class == star["StarType"] and star_type.luminosity in (luminosity, "All"):
+                    if self.any_subclass and (star_type.subclass < 0 or star_type.subclass == star["Subclass"]):
+                        return True
+                    if not self.any_subclass and (star_type.subclass == star["Subclass"] if star_type.subclass < 0 else True):
+                        return True
+        return False
+
+RULES = Rules()
+old_check_viability = Species.check_viability
+old_get_estimated_bio_worth = FSSReporter.get_estimated_bio_worth
+
+def check_viability(self: Species, star_system: Bodies, planet: dict[str, Any]) -> bool:
+    # The old checks, with the star types left to RULES.star_matches
+    if not self.star_types:
+        return old_check_viability(self, star_system, planet)
+    if not RULES.star_matches(self, star_system, planet):
+        return False
+    self.star_types = []
+    try:
+        return old_check_viability(self, star_system, planet)
+    finally:
+        del self.star_types
+
+def check_pluma(self: Species, star_system: Bodies, planet: dict[str, Any]) -> bool:
+    if not Species.check_viability(self, star_system, planet):
+        return False
+    allowed = ["h" if star_type == "black hole" else star_type for star_type in self.allowed_startypes]
+    return any(luminosity_class(star["Luminosity"]).lower() not in self.disallowed_luminosities and star["StarType"].lower() in allowed
+               for star in RULES.stars(star_system, planet))
+
+def get_estimated_bio_worth(self: FSSReporter, planet: dict[str, Any], num_signatures: int) -> Any:
+    try:
+        return old_get_estimated_bio_worth(self, planet, num_signatures)
+    except ZeroDivisionError:
+        return (0, 0, 0, [])
+
+def any_subclass() -> None:
+    Species.check_viability = check_viability
+    RULES.any_subclass = True
+
+def luminosity_classes() -> None:
+    RULES.luminosity_classes = True
+
+def parent_stars_only() -> None:
+    RULES.parent_stars_only = True
+
+def pluma() -> None:
+    Pluma.check_viability = check_pluma
+
+def worthless_planets() -> None:
+    FSSReporter.get_estimated_bio_worth = get_estimated_bio_worth
+
+CHANGES: list[tuple[str, Callable[[], None]]] = [
+    ("A subclass of -1 in a species' star types matches a star of any subclass. It only matched a star of subclass -1, so no "
+     "species with star types was ever predicted.", any_subclass),
+    ("Star luminosities are compared by their class, so a Vab star matches a species' V. They were compared as the journal "
+     "writes them.", luminosity_classes),
+    ("Only the stars a planet orbits count for its species' star types, every star of the system until those are scanned. "
+     "Every star of the system counted.", parent_stars_only),
+    ("Electricae Pluma (ELEPLU) compares journal star types regardless of case, names black holes H, looks at every star that "
+     "counts rather than the first star of the system and checks the planet type, atmosphere and temperature like every "
+     "species. It was never predicted.", pluma),
+    ("A planet with no possible genus is worth 0. Its average raised ZeroDivisionError.", worthless_planets),
+]
+
+
+def predict(core: CoreModule, reporter: FSSReporter, systems: list[dict[str, Any]]) -> Golden:
+    golden: Golden = {}
+    async def run() -> None:
+        async with asyncio.TaskGroup() as tg:
+            for system in systems:
+                core.state.current_system = StarSystem(address=system["address"])
+                for event in system["events"]:
+                    await core.process_event(event, tg)
+                for body_id, count in system["planets"]:
+                    planet = core.state.current_system.bodies.get_body_by_id(body_id)
+                    key = f"{system["address"]}/{body_id}"
+                    try:
+                        minimum, maximum, average, possible = reporter.get_estimated_bio_worth(planet, count)
+                    except ZeroDivisionError:
+                        golden[key] = None
+                    else:
+                        golden[key] = (minimum, maximum, average, [[organism.code for organism in genus] for genus in possible])
+    asyncio.run(run())
+    return golden
+
+def main() -> None:
+    systems: list[dict[str, Any]] = json.load(sys.stdin)
+    with contextlib.redirect_stdout(sys.stderr):    # the modules report their versions as they load
+        core = CoreModule()
+        reporter = FSSReporter(core)
+    assert len(taxon) == 20
+    baseline = predict(core, reporter, systems)
+    changes: list[tuple[str, Golden]] = []
+    previous = baseline
+    for change, apply in CHANGES:
+        apply()
+        predicted = predict(core, reporter, systems)
+        changes.append((change, {key: prediction for key, prediction in predicted.items() if previous[key] != prediction}))
+        previous = predicted
+    print(json.dumps({"baseline": baseline, "changes": changes}))
+
+if __name__ == "__main__":
+    main()
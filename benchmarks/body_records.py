@@ -0,0 +1,85 @@
+### Body record benchmark
+# Compares keeping every body as its merged journal payload (how the core state used to store bodies) with the typed Body records:
+# memory per body, and the time to encode and decode a system with 150 bodies the way the state file is saved and loaded.
+# Run from the EDSST root folder: uv run python -m benchmarks.body_records
+
+from benchmarks.synthetic import body_signals, journal_line, planet_scan, star_scan
+from src.modules.core import Bodies
+from typing import Any, Callable
+import gc
+import msgspec
+import random
+import time
+import tracemalloc
+
+NUM_BODIES = 150
+NUM_SYSTEMS = 20
+REPEATS = 200
+
+_line_decoder = msgspec.json.Decoder(dict[str, Any])
+
+
+def system_lines(rng: random.Random, address: int) -> list[bytes]:
+    events: list[dict[str, Any]] = []
+    for body_id in range(1, NUM_BODIES + 1):
+        if body_id <= 3:
+            events.append(star_scan(rng, address, body_id))
+        else:
+            events.append(planet_scan(rng, address, body_id, 1))
+            if rng.random() < 0.3:
+                events.append(body_signals(address, body_id, rng.randint(0, 6), rng.randint(0, 4)))
+    return [journal_line(event) for event in events]
+
+def payload_bodies(lines: list[bytes]) -> dict[int, dict[str, Any]]:
+    bodies: dict[int, dict[str, Any]] = {}
+    for line in lines:
+        event = _line_decoder.decode(line)
+        bodies.setdefault(event["BodyID"], {}).update(event)
+    return bodies
+
+def record_bodies(lines: list[bytes]) -> Bodies:
+    bodies = Bodies()
+    for line in lines:
+        bodies.add_body_signal(_line_decoder.decode(line))
+    return bodies
+
+def retained_bytes(build: Callable[[], Any]) -> tuple[int, list[Any]]:
+    # Memory still held once the events the bodies were built from are gone
+    gc.collect()
+    tracemalloc.start()
+    kept = [build() for _ in range(NUM_SYSTEMS)]
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size, kept
+
+def time_per_call(function: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        function()
+    return (time.perf_counter() - start) / REPEATS
+
+def main() -> None:
+    rng = random.Random(0)
+    systems = [system_lines(rng, 1000 + index) for index in range(NUM_SYSTEMS)]
+    lines_iterator = iter(systems * 2)
+    payload_size, payloads = retained_bytes(lambda: payload_bodies(next(lines_iterator)))
+    record_size, records = retained_bytes(lambda: record_bodies(next(lines_iterator)))
+    num_bodies = sum(len(bodies) for bodies in payloads)
+
+    payload = payloads[0]
+    record = records[0]
+    encoded_payload = msgspec.json.encode(payload)
+    encoded_record = msgspec.json.encode(record)
+    payload_decoder = msgspec.json.Decoder(dict[int, dict[str, Any]])
+    record_decoder = msgspec.json.Decoder(Bodies)
+    print(f"{NUM_SYSTEMS} systems of {NUM_BODIES} bodies")
+    for label, size, encoded, encode, decode in (
+        ("payload dicts", payload_size, encoded_payload, lambda: msgspec.json.encode(payload), lambda: payload_decoder.decode(encoded_payload)),
+        ("Body records", record_size, encoded_record, lambda: msgspec.json.encode(record), lambda: record_decoder.decode(encoded_record)),
+    ):
+        print(f"  {label:14} {size / num_bodies:8.0f} bytes/body in memory  {len(encoded) / len(payload):7.0f} bytes/body saved  "
+              f"encode {time_per_call(encode) * 1e6:7.1f} us  decode {time_per_call(decode) * 1e6:7.1f} us per system")
+
+if __name__ == "__main__":
+    main()
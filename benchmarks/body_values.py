@@ -0,0 +1,76 @@
+### Body value benchmark
+# Time to have the bodies of a system ranked by estimated value after every Scan while the system is being scanned:
+# working out every body again each time, and the incrementally updated SystemValues.
+# Then the time to rank a fully scanned system for a report. The values are checked against a separate version of the formulae.
+# Run from the EDSST root folder: uv run python -m benchmarks.body_values
+
+from benchmarks.synthetic import planet_scan, star_scan
+from src.modules.core import Bodies, Body
+from src.values import (EFFICIENT_MAPPING_MULTIPLIER, FIRST_DISCOVERY_MAP_MULTIPLIER, FIRST_DISCOVERY_MULTIPLIER, FIRST_MAP_MULTIPLIER, MAP_MULTIPLIER,
+                        MAPPING_BONUS_MINIMUM, MAPPING_BONUS_SHARE, MASS_FACTOR, MINIMUM_VALUE, STAR_MASS_DIVISOR, SystemValues, estimate_value, planet_k, star_k)
+from typing import Any, Callable
+import random
+import time
+
+NUM_BODIES = 150
+REPEATS = 5
+
+def body_value(body: Body) -> int:
+    # The value once mapped of a single body, written out separately from src.values as a check
+    if body.star_type:
+        value = star_k(body.star_type) * (1 + body.stellar_mass / STAR_MASS_DIVISOR)
+    elif body.planet_class:
+        if body.was_mapped:
+            multiplier = MAP_MULTIPLIER
+        else:
+            multiplier = FIRST_MAP_MULTIPLIER if body.was_discovered else FIRST_DISCOVERY_MAP_MULTIPLIER
+        k = planet_k(body.planet_class, bool(body.terraform_state))
+        value = (k + k * MASS_FACTOR * body.mass_em ** 0.2) * multiplier * EFFICIENT_MAPPING_MULTIPLIER
+        value += max(value * MAPPING_BONUS_SHARE, MAPPING_BONUS_MINIMUM)
+    else:
+        return 0
+    return round(max(value, MINIMUM_VALUE) * (1 if body.was_discovered else FIRST_DISCOVERY_MULTIPLIER))
+
+def system_events(rng: random.Random) -> list[dict[str, Any]]:
+    return [star_scan(rng, 1000, body_id) if body_id <= 3 else planet_scan(rng, 1000, body_id, 1) for body_id in range(1, NUM_BODIES + 1)]
+
+def rank_every_body(bodies: Bodies) -> list[int]:
+    return [body.body_id for body in SystemValues(bodies).ranked()]
+
+def rank_incrementally(bodies: Bodies) -> list[int]:
+    return [body.body_id for body in bodies.estimated_values.ranked()]
+
+def scan_system(events: list[dict[str, Any]], rank: Callable[[Bodies], list[int]]) -> tuple[float, list[int]]:
+    bodies = Bodies()
+    ranking: list[int] = []
+    start = time.perf_counter()
+    for event in events:
+        bodies.add_body_signal(event)
+        ranking = rank(bodies)
+    return time.perf_counter() - start, ranking
+
+def main() -> None:
+    events = system_events(random.Random(0))
+    bodies = Bodies()
+    for event in events:
+        bodies.add_body_signal(event)
+    assert all(estimate_value(body).mapped == body_value(body) for body in bodies.bodies.values()), "the values differ from the check"
+
+    print(f"Ranking a system of {NUM_BODIES} bodies after each of its scans")
+    rankings: list[list[int]] = []
+    for label, rank in (("every body", rank_every_body), ("incremental", rank_incrementally)):
+        seconds = min(scan_system(events, rank)[0] for _ in range(REPEATS))
+        rankings.append(scan_system(events, rank)[1])
+        print(f"  {label:14} {seconds * 1000:8.2f} ms per system  {seconds / NUM_BODIES * 1e6:8.1f} us per scan")
+    print(f"Rankings identical: {"yes" if all(ranking == rankings[0] for ranking in rankings) else "NO"}")
+
+    print(f"Ranking a scanned system of {NUM_BODIES} bodies for a report, after one more signal")
+    for label, rank in (("every body", rank_every_body), ("incremental", rank_incrementally)):
+        start = time.perf_counter()
+        for _ in range(REPEATS * 20):
+            bodies.estimated_values.mark_changed(NUM_BODIES)
+            rank(bodies)
+        print(f"  {label:14} {(time.perf_counter() - start) / (REPEATS * 20) * 1000:8.2f} ms per system")
+
+if __name__ == "__main__":
+    main()
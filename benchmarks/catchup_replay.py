@@ -0,0 +1,78 @@
+### Catch-up replay benchmark
+# Replays a synthetic 50k-line journal through the modules, one line at a time (as catch-up used to) and in batches.
+# Run from the EDSST root folder: uv run python -m benchmarks.catchup_replay
+
+from benchmarks.synthetic import journal_lines
+from src.dispatcher import EventDispatcher
+from src.modules.module import Module, MODULES_DATA_PATH
+from src.modules.core import CoreModule
+from src.modules.eddn.eddn import EDDN
+from src.modules.chatboxrelay import ChatboxRelay
+from src.modules.fssreporter import FSSReporter
+from src.modules.boxelsurvey import BoxelSurvey
+from src.modules.dw3densitycolumnsurvey import DW3DensityColumnSurvey
+from src.modules.densitynavroutesurvey import DensityNavRouteSurvey
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Any
+import asyncio
+import io
+import msgspec
+import os
+import tempfile
+import time
+
+NUM_LINES = 50000
+BATCH_SIZE = 2048
+CAUGHT_UP_LINE = b'{"event":"CaughtUp"}'
+
+
+async def push_nothing(tg: asyncio.TaskGroup, user_input: str) -> Any:
+    pass
+
+def make_modules() -> tuple[CoreModule, list[Module]]:
+    # EDSM is left out, it talks to the network when created
+    with redirect_stdout(io.StringIO()):
+        core = CoreModule()
+        modules: list[Module] = [core, EDDN(core), ChatboxRelay(push_nothing), FSSReporter(core), BoxelSurvey(core, None), DW3DensityColumnSurvey(core), DensityNavRouteSurvey()]   # pyright: ignore[reportArgumentType]
+    for module in modules:
+        module.caught_up = False
+    return core, modules
+
+async def replay(lines: list[bytes], batched: bool) -> tuple[float, bytes]:
+    core, modules = make_modules()
+    dispatcher = EventDispatcher(modules)
+    async with asyncio.TaskGroup() as tg:
+        start = time.perf_counter()
+        if batched:
+            for index in range(0, len(lines), BATCH_SIZE):
+                await dispatcher.dispatch_batch(lines[index:index + BATCH_SIZE], tg)
+        else:
+            for line in lines:
+                await dispatcher.dispatch(line, tg)
+        seconds = time.perf_counter() - start
+        with redirect_stdout(io.StringIO()):
+            await dispatcher.dispatch(CAUGHT_UP_LINE, tg)
+    return seconds, msgspec.json.encode(core.state)
+
+def main() -> None:
+    lines = journal_lines(NUM_LINES)
+    print(f"{len(lines)} journal lines, {sum(len(line) for line in lines) / 1e6:.1f} MB")
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)    # module state files go to a throwaway modules_data folder
+        results: dict[str, float] = {}
+        states: list[bytes] = []
+        for label, batched in (("line by line", False), (f"batches of {BATCH_SIZE}", True)):
+            MODULES_DATA_PATH.mkdir()
+            seconds, state = asyncio.run(replay(lines, batched))
+            results[label] = seconds
+            states.append(state)
+            for path in sorted(Path(directory).rglob("*"), reverse=True):
+                path.rmdir() if path.is_dir() else path.unlink()
+        baseline = results["line by line"]
+        for label, seconds in results.items():
+            print(f"  {label:18} {seconds * 1000:8.1f} ms  {seconds / len(lines) * 1e6:6.2f} us/line  {baseline / seconds:5.2f}x")
+        print("Core state identical: " + ("yes" if states[0] == states[1] else "NO"))
+
+if __name__ == "__main__":
+    main()
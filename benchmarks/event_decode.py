@@ -0,0 +1,40 @@
+### Journal event decode benchmark
+# Compares json.loads against the msgspec dict decoder and the typed src.events structs.
+# Run from the EDSST root folder: uv run python -m benchmarks.event_decode
+
+from benchmarks.synthetic import journal_lines
+from src.events import EVENT_TYPES, decode_event, decode_typed_event, event_name
+from typing import Any, Callable
+import json
+import time
+
+NUM_LINES = 50000
+ROUNDS = 5
+
+
+def best_of(rounds: int, function: Callable[[], Any]) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main() -> None:
+    lines = journal_lines(NUM_LINES)
+    hot_lines = [line for line in lines if event_name(line) in EVENT_TYPES]
+    print(f"{len(lines)} journal lines, {len(hot_lines)} of them typed events, {sum(len(line) for line in lines) / 1e6:.1f} MB")
+
+    for label, sample in (("all lines", lines), ("typed events only", hot_lines)):
+        baseline = best_of(ROUNDS, lambda: [json.loads(line) for line in sample])
+        results = {
+            "json.loads": baseline,
+            "msgspec dict": best_of(ROUNDS, lambda: [decode_event(line) for line in sample]),
+            "msgspec typed": best_of(ROUNDS, lambda: [decode_typed_event(line) for line in sample]),
+        }
+        print(f"\n{label}:")
+        for name, seconds in results.items():
+            print(f"  {name:14} {seconds * 1000:8.1f} ms  {seconds / len(sample) * 1e6:6.2f} us/line  {baseline / seconds:5.2f}x")
+
+if __name__ == "__main__":
+    main()
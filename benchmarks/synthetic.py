@@ -0,0 +1,122 @@
+### Synthetic journal lines for the benchmarks
+# The payloads mirror what the game writes, including the fields EDSST never reads, so decode costs are realistic.
+
+from typing import Any, Iterator
+import json
+import random
+
+PLANET_CLASSES: list[str] = [
+    "Icy body", "Rocky ice body", "Rocky body", "Metal rich body", "High metal content body", "Earthlike body", "Ammonia world", "Water world",
+    "Sudarsky class I gas giant", "Sudarsky class II gas giant", "Sudarsky class III gas giant", "Gas giant with water based life", "Water giant",
+]
+ATMOSPHERE_TYPES: list[str] = ["None", "CarbonDioxide", "Ammonia", "Neon", "Argon", "Methane", "SulphurDioxide", "Water", "Nitrogen", "Helium", "Oxygen"]
+VOLCANISMS: list[str] = ["", "", "minor water geysers volcanism", "major silicate vapour geysers volcanism", "carbon dioxide geysers volcanism", "minor rocky magma volcanism", "nitrogen magma volcanism"]
+STAR_TYPES: list[tuple[str, str]] = [("G", "V"), ("K", "Va"), ("M", "Vab"), ("F", "V"), ("B", "IV"), ("A", "III"), ("DA", "VII"), ("N", "VII")]
+TIMESTAMP = "2026-01-01T00:00:00Z"
+
+
+def system_name(address: int) -> str:
+    return f"Synth AB-C d{address % 1000}-{address % 97}"
+
+def fsd_jump(rng: random.Random, address: int) -> dict[str, Any]:
+    return {
+        "timestamp": TIMESTAMP, "event": "FSDJump", "Taxi": False, "Multicrew": False,
+        "StarSystem": system_name(address), "SystemAddress": address,
+        "StarPos": [rng.uniform(-40000, 40000), rng.uniform(-2000, 2000), rng.uniform(-10000, 65000)],
+        "SystemAllegiance": "", "SystemEconomy": "$economy_None;", "SystemEconomy_Localised": "None",
+        "SystemSecondEconomy": "$economy_None;", "SystemSecondEconomy_Localised": "None",
+        "SystemGovernment": "$government_None;", "SystemGovernment_Localised": "None",
+        "SystemSecurity": "$GAlAXY_MAP_INFO_state_anarchy;", "SystemSecurity_Localised": "Anarchy", "Population": 0,
+        "Body": f"{system_name(address)} A", "BodyID": 1, "BodyType": "Star",
+        "JumpDist": rng.uniform(10, 80), "FuelUsed": rng.uniform(1, 8), "FuelLevel": rng.uniform(8, 32),
+    }
+
+def star_scan(rng: random.Random, address: int, body_id: int) -> dict[str, Any]:
+    star_type, luminosity = rng.choice(STAR_TYPES)
+    return {
+        "timestamp": TIMESTAMP, "event": "Scan", "ScanType": "AutoScan",
+        "BodyName": f"{system_name(address)} {chr(65 + body_id % 26)}", "BodyID": body_id,
+        "Parents": [{"Null": 0}] if body_id else [],
+        "StarSystem": system_name(address), "SystemAddress": address, "DistanceFromArrivalLS": 0.0 if body_id == 1 else rng.uniform(1000, 90000),
+        "StarType": star_type, "Subclass": rng.randint(0, 9), "StellarMass": rng.uniform(0.1, 8.0), "Radius": rng.uniform(1e8, 2e9),
+        "AbsoluteMagnitude": rng.uniform(-2, 12), "Age_MY": rng.randint(10, 13000), "SurfaceTemperature": rng.uniform(2000, 20000),
+        "Luminosity": luminosity, "RotationPeriod": rng.uniform(1e4, 1e7), "AxialTilt": 0.0,
+        "WasDiscovered": rng.random() < 0.5, "WasMapped": False, "WasFootfalled": False,
+    }
+
+def planet_scan(rng: random.Random, address: int, body_id: int, parent_id: int, planet_class: str | None = None, atmosphere_type: str | None = None) -> dict[str, Any]:
+    planet_class = planet_class if planet_class is not None else rng.choice(PLANET_CLASSES)
+    atmosphere_type = atmosphere_type if atmosphere_type is not None else rng.choice(ATMOSPHERE_TYPES)
+    event: dict[str, Any] = {
+        "timestamp": TIMESTAMP, "event": "Scan", "ScanType": "Detailed",
+        "BodyName": f"{system_name(address)} A {body_id}", "BodyID": body_id,
+        "Parents": [{"Star": parent_id}, {"Null": 0}],
+        "StarSystem": system_name(address), "SystemAddress": address, "DistanceFromArrivalLS": rng.uniform(5, 90000),
+        "TidalLock": rng.random() < 0.5, "TerraformState": "Terraformable" if rng.random() < 0.1 else "",
+        "PlanetClass": planet_class,
+        "Atmosphere": "" if atmosphere_type == "None" else f"thin {atmosphere_type.lower()} atmosphere",
+        "AtmosphereType": atmosphere_type,
+        "AtmosphereComposition": [] if atmosphere_type == "None" else [{"Name": atmosphere_type, "Percent": 96.5}, {"Name": "Nitrogen", "Percent": 3.5}],
+        "Volcanism": rng.choice(VOLCANISMS), "MassEM": rng.uniform(0.001, 5.0), "Radius": rng.uniform(1e6, 3e7),
+        "SurfaceGravity": rng.uniform(0.3, 25.0), "SurfaceTemperature": rng.uniform(20, 1200), "SurfacePressure": rng.uniform(0, 1e6),
+        "Landable": rng.random() < 0.6,
+        "Materials": [{"Name": name, "Percent": rng.uniform(0.1, 20)} for name in ("iron", "nickel", "sulphur", "carbon", "chromium", "manganese", "phosphorus", "zinc", "selenium", "tin")],
+        "Composition": {"Ice": rng.random(), "Rock": rng.random(), "Metal": rng.random()},
+        "SemiMajorAxis": rng.uniform(1e9, 1e13), "Eccentricity": rng.uniform(0, 0.3), "OrbitalInclination": rng.uniform(-10, 10),
+        "Periapsis": rng.uniform(0, 360), "OrbitalPeriod": rng.uniform(1e5, 1e9), "AscendingNode": rng.uniform(-180, 180),
+        "MeanAnomaly": rng.uniform(0, 360), "RotationPeriod": rng.uniform(1e4, 1e7), "AxialTilt": rng.uniform(-1, 1),
+        "WasDiscovered": rng.random() < 0.5, "WasMapped": False, "WasFootfalled": False,
+    }
+    if rng.random() < 0.15:
+        event["Rings"] = [{"Name": f"{event["BodyName"]} A Ring", "RingClass": "eRingClass_Icy", "MassMT": 1e10, "InnerRad": 3e7, "OuterRad": 6e7}]
+    return event
+
+def body_signals(address: int, body_id: int, biological: int, geological: int) -> dict[str, Any]:
+    signals: list[dict[str, Any]] = []
+    if biological:
+        signals.append({"Type": "$SAA_SignalType_Biological;", "Type_Localised": "Biological", "Count": biological})
+    if geological:
+        signals.append({"Type": "$SAA_SignalType_Geological;", "Type_Localised": "Geological", "Count": geological})
+    return {"timestamp": TIMESTAMP, "event": "FSSBodySignals", "BodyName": f"{system_name(address)} A {body_id}", "BodyID": body_id, "SystemAddress": address, "Signals": signals}
+
+def filler(rng: random.Random) -> dict[str, Any]:
+    return rng.choice([
+        {"timestamp": TIMESTAMP, "event": "Music", "MusicTrack": "Exploration"},
+        {"timestamp": TIMESTAMP, "event": "ReceiveText", "From": "", "Message": "$COMMS_entered:#name=Synth;", "Message_Localised": "Entered Channel: Synth", "Channel": "npc"},
+        {"timestamp": TIMESTAMP, "event": "FuelScoop", "Scooped": 5.0, "Total": 32.0},
+        {"timestamp": TIMESTAMP, "event": "ReservoirReplenished", "FuelMain": 32.0, "FuelReservoir": 0.63},
+        {"timestamp": TIMESTAMP, "event": "FSDTarget", "Name": "Synth AB-C d1-1", "SystemAddress": 1, "StarClass": "K", "RemainingJumpsInRoute": 3},
+    ])
+
+def journal_events(num_lines: int, seed: int = 0, bodies_per_system: int = 25) -> Iterator[dict[str, Any]]:
+    # An exploration session: jump, a few filler events, then a full system of scans and signals
+    rng = random.Random(seed)
+    produced = 0
+    yield {"timestamp": TIMESTAMP, "event": "Fileheader", "part": 1, "language": "English/UK", "Odyssey": True, "gameversion": "4.0.0.1904", "build": "r308767/r0 "}
+    yield {"timestamp": TIMESTAMP, "event": "LoadGame", "FID": "F0000000", "Commander": "Synth", "Horizons": True, "Odyssey": True, "gameversion": "4.0.0.1904", "build": "r308767/r0 "}
+    produced += 2
+    address = 1000
+    while produced < num_lines:
+        address += rng.randint(1, 5000)
+        yield fsd_jump(rng, address)
+        produced += 1
+        for _ in range(rng.randint(1, 4)):
+            yield filler(rng)
+            produced += 1
+        for body_id in range(1, bodies_per_system + 1):
+            if produced >= num_lines:
+                return
+            if body_id <= 2:
+                yield star_scan(rng, address, body_id)
+            else:
+                yield planet_scan(rng, address, body_id, 1)
+                if rng.random() < 0.2:
+                    yield body_signals(address, body_id, rng.randint(0, 6), rng.randint(0, 4))
+                    produced += 1
+            produced += 1
+
+def journal_line(event: dict[str, Any]) -> bytes:    # formatted the way the game writes its journal lines
+    return b"{ " + json.dumps(event, separators=(", ", ":")).encode()[1:-1] + b" }\r\n"
+
+def journal_lines(num_lines: int, seed: int = 0) -> list[bytes]:
+    return [journal_line(event) for event in journal_events(num_lines, seed)]
@@ -0,0 +1,52 @@
+### System history query benchmark
+# Fills a throwaway system history with 300k systems and times radius and nearest-neighbour queries.
+# Run from the EDSST root folder: uv run python -m benchmarks.system_history
+
+from src.history import SystemHistory
+from typing import Any, Callable
+import random
+import tempfile
+import time
+from pathlib import Path
+
+NUM_SYSTEMS = 300000
+NUM_QUERIES = 2000
+
+
+def average_time(queries: list[tuple[float, float, float]], function: Callable[[tuple[float, float, float]], Any]) -> tuple[float, float]:
+    found = 0
+    start = time.perf_counter()
+    for center in queries:
+        found += len(function(center))
+    return (time.perf_counter() - start) / len(queries), found / len(queries)
+
+def main() -> None:
+    rng = random.Random(0)
+    # Systems along a few long expedition routes through a slab of the galaxy, which is how a commander's history looks
+    routes = [((rng.uniform(-20000, 20000), rng.uniform(-500, 500), rng.uniform(0, 40000)), (rng.uniform(-20000, 20000), rng.uniform(-500, 500), rng.uniform(0, 40000))) for _ in range(20)]
+    def random_position() -> tuple[float, float, float]:
+        (ax, ay, az), (bx, by, bz) = rng.choice(routes)
+        t = rng.random()
+        return (ax + (bx - ax) * t + rng.gauss(0, 200), ay + (by - ay) * t + rng.gauss(0, 100), az + (bz - az) * t + rng.gauss(0, 200))
+
+    with tempfile.TemporaryDirectory() as directory:
+        history = SystemHistory(Path(directory) / "system_history.sqlite")
+        start = time.perf_counter()
+        for address in range(NUM_SYSTEMS):
+            history.record_system(address, f"Synth {address}", random_position(), "2026-01-01T00:00:00Z")
+        history.commit()
+        print(f"Recorded {NUM_SYSTEMS} systems in {time.perf_counter() - start:.1f}s")
+
+        queries = [random_position() for _ in range(NUM_QUERIES)]
+        for label, function in (
+            ("within 20Ly", lambda center: history.systems_within(center, 20.0)),
+            ("within 100Ly", lambda center: history.systems_within(center, 100.0)),
+            ("nearest 1", lambda center: history.nearest_systems(center, 1)),
+            ("nearest 10", lambda center: history.nearest_systems(center, 10)),
+        ):
+            seconds, found = average_time(queries, function)
+            print(f"  {label:14} {seconds * 1e6:8.1f} us/query  {found:8.1f} systems/query")
+        history.close()
+
+if __name__ == "__main__":
+    main()
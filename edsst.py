@@ -5,32 +5,40 @@ from src.modules.boxelsurvey import BoxelSurvey
 from src.modules.fssreporter import FSSReporter
 from src.modules.core import CoreModule
 from src.modules.module import Module
+from src.modules.registry import ModuleRegistry
 from src.modules.dw3densitycolumnsurvey import DW3DensityColumnSurvey
 from src.modules.chatboxrelay import ChatboxRelay
 from src.modules.eddn.eddn import EDDN
 from src.modules.edsm import EDSM
 from src.modules.densitynavroutesurvey import DensityNavRouteSurvey
+from src.modules.exobiology import Exobiology
 import src.version
 from pathlib import Path
 from typing import Iterator
 import toml
 from watchfiles import awatch # pyright: ignore[reportUnknownVariableType]
-import json
 import asyncio
 from prompt_toolkit import PromptSession
 from prompt_toolkit.patch_stdout import patch_stdout
-import traceback
 from src.version import TESTING_MODE, TestingMode
 from prompt_toolkit.formatted_text import HTML
 from prompt_toolkit.styles import Style
 from prompt_toolkit import print_formatted_text
 from src.util import LOGS_DIRECTORY
+from src.journal import JournalCheckpoint, LineFramer, replay_journal
+from src.events import event_name
+from src.dispatcher import EventDispatcher
+from src.backfill import backfill
+import argparse
 
 
 config = toml.load("config.toml")
 
 log_directory = LOGS_DIRECTORY
 
+CAUGHT_UP_LINE = b'{"event":"CaughtUp"}'
+CATCH_UP_BATCH_SIZE = 2048   # replayed lines handed to the modules at once
+
 edsst_style = Style.from_dict({
     "edsst_color": "#ff8000",
 })
@@ -46,18 +54,23 @@ def get_latest_journal_file_path() -> None | Path:
     
     return latest_journal_file_path
 
-async def listen_for_events():
+async def listen_for_events(checkpoint: JournalCheckpoint, framer: LineFramer):
     initial_journal_file_path = get_latest_journal_file_path()
 
     if initial_journal_file_path:
         latest_journal_file_path = initial_journal_file_path
-        with open(initial_journal_file_path) as file:
-            file_by_lines = file.read().strip().split("\n")
-            for line in file_by_lines:
-                if not line: 
-                    continue
-                event = json.loads(line)
-                yield event
+        if checkpoint.matches(initial_journal_file_path):
+            print_formatted_text(HTML(f"<edsst_color>EDSST</edsst_color>: Resuming journal replay from byte {checkpoint.offset}"), style=edsst_style)
+        batch: list[bytes] = []
+        for line in replay_journal(initial_journal_file_path, checkpoint):
+            if not line.strip(): 
+                continue
+            batch.append(line)
+            if len(batch) >= CATCH_UP_BATCH_SIZE:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
     else:
         latest_journal_file_path = None
 
@@ -67,46 +80,59 @@ async def listen_for_events():
         print_formatted_text(HTML("<edsst_color>EDSST</edsst_color>: Did not find journal file.  Please confirm journal directory is set correctly in the config.toml file."), style=edsst_style)
         exit()
 
-    yield {"event": "CaughtUp"}
-
-    file = open(latest_journal_file_path)
+    yield [CAUGHT_UP_LINE]
 
-    if latest_journal_file_path == initial_journal_file_path:
-        file.read()
+    file = open(latest_journal_file_path, "rb")
+    file.seek(checkpoint.offset)
     ##start listening to the logfile
     async for changes in awatch(latest_journal_file_path, log_directory):
         for change, path in changes:
             del change
             if path == str(latest_journal_file_path):
-                for line in file.read().strip().split("\n"):
-                    if not line: 
+                lines: list[bytes] = []
+                for line in framer.read_lines(file):
+                    checkpoint.advance(line)
+                    if not line.strip(): 
                         continue
-                    event = json.loads(line)
-                    if event["event"] == "Shutdown":
+                    if event_name(line) == "Shutdown":
                         print_formatted_text(HTML("<edsst_color>EDSST</edsst_color>: Detected shutdown."), style=edsst_style)
-                    yield event
+                    lines.append(line)
+                if lines:
+                    yield lines
+                if TESTING_MODE == TestingMode.Testing:
+                    bytes_per_second, lines_per_second = framer.rates()
+                    print_formatted_text(HTML(f"<edsst_color>EDSST</edsst_color>: Ingest rate: {bytes_per_second:.0f} B/s, {lines_per_second:.1f} lines/s"), style=edsst_style)
             else:
                 new_latest_journal_file_path = get_latest_journal_file_path()
                 if new_latest_journal_file_path and latest_journal_file_path != new_latest_journal_file_path:
                     print_formatted_text(HTML(f"<edsst_color>EDSST</edsst_color>: Synchronized to journal log file: {new_latest_journal_file_path.name}"), style=edsst_style)
                     latest_journal_file_path = new_latest_journal_file_path
+                    checkpoint.reset(latest_journal_file_path.name)
+                    framer.reset()
                     file.close()
-                    file = open(latest_journal_file_path)
+                    file = open(latest_journal_file_path, "rb")
 
-async def event_loop(modules: list[Module], tg: asyncio.TaskGroup):
+async def event_loop(dispatcher: EventDispatcher, tg: asyncio.TaskGroup, checkpoint: JournalCheckpoint, framer: LineFramer):
     event_count: int = 0
-    async for event in listen_for_events():
-        if TESTING_MODE == TestingMode.Testing:
-            print_formatted_text(HTML(f"<edsst_color>EDSST</edsst_color>: Journal line: <edsst_color>{event_count}</edsst_color>"))
-        event_count = event_count + 1
-        for module in modules:
-            if module.state.enabled or not module.caught_up:
-                try:
-                    await module.process_event(event, tg)
-                except Exception:
-                    module.print(f"Encountered an unrecoverable error:")
-                    print(traceback.format_exc())
-                    module.disable()
+    async for lines in listen_for_events(checkpoint, framer):
+        if not dispatcher.caught_up:
+            await dispatcher.dispatch_batch(lines, tg)
+            event_count = event_count + len(lines)
+            if TESTING_MODE == TestingMode.Testing:
+                print_formatted_text(HTML(f"<edsst_color>EDSST</edsst_color>: Journal lines replayed: <edsst_color>{event_count}</edsst_color>"))
+            continue
+        for line in lines:
+            if TESTING_MODE == TestingMode.Testing:
+                print_formatted_text(HTML(f"<edsst_color>EDSST</edsst_color>: Journal line: <edsst_color>{event_count}</edsst_color>"))
+            event_count = event_count + 1
+            await dispatcher.dispatch(line, tg)
+
+async def run_event_loop(dispatcher: EventDispatcher, tg: asyncio.TaskGroup, checkpoint: JournalCheckpoint, framer: LineFramer):
+    dispatcher.start(tg)
+    try:
+        await event_loop(dispatcher, tg, checkpoint, framer)
+    finally:
+        dispatcher.stop()
 
 async def process_user_input(modules: list[Module], tg: asyncio.TaskGroup, user_input: str):
     arguments = user_input.lower().split()
@@ -124,43 +150,64 @@ async def input_loop(modules: list[Module], event_loop_task: asyncio.Task, tg: a
             assert isinstance(result, str)
             if str(result).lower() == "exit":
                 for module in modules:
-                    module.save_state()
+                    module.save_state(immediately=True)
                 event_loop_task.cancel()
                 return
         await process_user_input(modules=modules, tg=tg, user_input=result)
 
-async def main():
+async def main(print_timings: bool = False):
     print("\nElite: Dangerous Stellar Survey Tools " + src.version.EDSST_VERSION + " booting...\n")
 
     #TODO: Make loading of modules dynamic
 
-    modules: list[Module] = []
-    core_module = CoreModule()
-    edsm_module = EDSM(core_module)
-    modules.append(core_module)
-    modules.append(EDDN(core_module))
-    modules.append(edsm_module)
-    modules.append(ChatboxRelay(partial(process_user_input, modules)))
-    modules.append(FSSReporter(core_module))
-    modules.append(BoxelSurvey(core_module, edsm_module))
-    modules.append(DW3DensityColumnSurvey(core_module))
-    modules.append(DensityNavRouteSurvey())
-    #modules.append(ExampleModule())
+    registry = ModuleRegistry()
+    modules: list[Module] = registry.modules
+    core_module = registry.add(CoreModule)
+    registry.add(EDDN, core_module)
+    edsm_module = registry.add(EDSM, core_module)
+    registry.add(ChatboxRelay, partial(process_user_input, modules))
+    registry.add(FSSReporter, core_module)
+    registry.add(Exobiology)
+    registry.add(BoxelSurvey, core_module, edsm_module)
+    registry.add(DW3DensityColumnSurvey, core_module)
+    registry.add(DensityNavRouteSurvey)
+    #registry.add(ExampleModule)
+    registry.finish_startup(print_timings)
     for module in modules:
         module.caught_up = False 
     
 
-    async with asyncio.TaskGroup() as tg:
-        event_loop_task = tg.create_task(event_loop(modules, tg))
-        input_loop_task = tg.create_task(input_loop(modules, event_loop_task, tg)) # pyright: ignore[reportUnusedVariable]
-        print("\n╔════════════════════════════════════════════════════════════╗\n" +
-                "║ Elite: Dangerous Stellar Survey Tools successfully booted! ║\n" +
-                "╚════════════════════════════════════════════════════════════╝\n")
-        if TESTING_MODE == TestingMode.Testing:
-            print_formatted_text(HTML("<edsst_color>      ╔════════════════════════════════════════════════╗</edsst_color>\n" +
-                                            "<edsst_color>      ║      !Booted in TESTING / DEBUGGING mode!      ║</edsst_color>\n" +
-                                            "<edsst_color>      ╚════════════════════════════════════════════════╝</edsst_color>\n"), style=edsst_style)
+    try:
+        async with asyncio.TaskGroup() as tg:
+            dispatcher = EventDispatcher(modules)
+            core_module.dispatcher = dispatcher
+            event_loop_task = tg.create_task(run_event_loop(dispatcher, tg, core_module.state.journal_checkpoint, core_module.journal_framer))
+            input_loop_task = tg.create_task(input_loop(modules, event_loop_task, tg)) # pyright: ignore[reportUnusedVariable]
+            print("\n╔════════════════════════════════════════════════════════════╗\n" +
+                    "║ Elite: Dangerous Stellar Survey Tools successfully booted! ║\n" +
+                    "╚════════════════════════════════════════════════════════════╝\n")
+            if TESTING_MODE == TestingMode.Testing:
+                print_formatted_text(HTML("<edsst_color>      ╔════════════════════════════════════════════════╗</edsst_color>\n" +
+                                                "<edsst_color>      ║      !Booted in TESTING / DEBUGGING mode!      ║</edsst_color>\n" +
+                                                "<edsst_color>      ╚════════════════════════════════════════════════╝</edsst_color>\n"), style=edsst_style)
+    finally:
+        for module in modules:    # whatever is still waiting for a debounced save is written before exiting
+            module.flush_state()
+        for module in modules:
+            await module.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Elite: Dangerous Stellar Survey Tools")
+    parser.add_argument("command", nargs="?", choices=["run", "backfill"], default="run", help="'run' (default) starts EDSST, 'backfill' loads every journal file into the system history")
+    parser.add_argument("--workers", type=int, default=None, help="backfill: number of worker processes, defaults to the number of CPU cores")
+    parser.add_argument("--restart", action="store_true", help="backfill: start over instead of continuing an earlier backfill")
+    parser.add_argument("--timings", action="store_true", help="run: print how long each module took to start")
+    arguments = parser.parse_args()
+
+    if arguments.command == "backfill":
+        backfill(log_directory, workers=arguments.workers, restart=arguments.restart)
+        exit()
 
-asyncio.run(main())
+    asyncio.run(main(arguments.timings))
 
-exit("Elite: Dangerous Stellar Survey Tools spooling down...\nFarewell, Commander!")
\ No newline at end of file
+    exit("Elite: Dangerous Stellar Survey Tools spooling down...\nFarewell, Commander!")
\ No newline at end of file
@@ -0,0 +1,149 @@
+### Journal backfill
+# Parses every journal file in the journal directory across worker processes and merges the results into the system history, oldest file first.
+# Progress is saved after every merged file, so an interrupted backfill continues where it stopped.
+# Run from the EDSST root folder: uv run python edsst.py backfill
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from src.events import SystemArrival, decode_event, decode_typed_event, event_name
+from src.history import SYSTEM_HISTORY_FILE_NAME, SystemHistory
+from src.modules.core import CoreModule, body_event_attributes
+from src.modules.module import MODULES_DATA_PATH
+from src.util import write_atomic
+from prompt_toolkit import print_formatted_text
+from prompt_toolkit.formatted_text import HTML
+from prompt_toolkit.styles import Style
+import msgspec
+import os
+import re
+import time
+
+PROGRESS_FILE_NAME = "backfill_progress.json"
+OLD_JOURNAL_NAME = re.compile(r"Journal\.(\d\d)(\d\d)(\d\d)(\d\d)(\d\d)(\d\d)\.(\d+)\.log")  # Journal.YYMMDDHHMMSS.01.log, used before game update 4.0
+
+backfill_style = Style.from_dict({
+    "edsst_color": "#ff8000",
+})
+
+
+class JournalSummary(msgspec.Struct, array_like=True):
+    # What one journal file contributes to the system history, passed back from the worker processes as msgpack
+    visits: list[tuple[int, str, tuple[float, float, float], str]]     # (address, name, coordinates, timestamp)
+    bodies: list[tuple[int, int, str, str]]                             # (address, body_id, body JSON, attributes JSON)
+    lines: int
+
+_summary_decoder = msgspec.msgpack.Decoder(JournalSummary)
+
+
+def journal_sort_key(path: Path) -> str:
+    # Old journal names sort after the current "Journal.2025-01-01T000000.01.log" ones, so they are rewritten into the same form
+    match = OLD_JOURNAL_NAME.fullmatch(path.name)
+    if match:
+        year, month, day, hour, minute, second, part = match.groups()
+        return f"Journal.20{year}-{month}-{day}T{hour}{minute}{second}.{part}.log"
+    return path.name
+
+def find_journal_files(directory: Path) -> list[Path]:
+    return sorted(directory.glob("Journal.*.log"), key=journal_sort_key)
+
+def parse_journal_file(path: str) -> bytes:
+    # Runs in a worker process: keeps the system arrivals, and merges the body events into one record per body
+    visits: list[tuple[int, str, tuple[float, float, float], str]] = []
+    bodies: dict[tuple[int, int], tuple[dict[str, object], set[str]]] = {}
+    current_address = 0
+    lines = 0
+    for line in Path(path).read_bytes().splitlines():
+        if not line.strip():
+            continue
+        lines += 1
+        try:
+            name = event_name(line)
+            if name in CoreModule.SYSTEM_ARRIVAL_EVENTS:
+                arrival = decode_typed_event(line, name)
+                if isinstance(arrival, SystemArrival):
+                    current_address = arrival.system_address
+                    visits.append((arrival.system_address, arrival.star_system, arrival.star_pos, arrival.timestamp))
+            elif name in CoreModule.BODY_EVENTS:
+                event = decode_event(line)
+                if "BodyID" not in event:
+                    continue
+                key = (int(event.get("SystemAddress", current_address)), int(event["BodyID"]))
+                body, attributes = bodies.setdefault(key, ({}, set()))
+                body.update(event)
+                attributes.update(attribute.name for attribute in body_event_attributes(event))
+        except (msgspec.DecodeError, KeyError, TypeError, ValueError):
+            continue    # a malformed or truncated line, for example the last line of a journal the game crashed on
+    summary = JournalSummary(
+        visits=visits,
+        bodies=[(address, body_id, msgspec.json.encode(body).decode(), msgspec.json.encode(sorted(attributes)).decode()) for (address, body_id), (body, attributes) in bodies.items()],
+        lines=lines,
+    )
+    return msgspec.msgpack.encode(summary)
+
+
+def print_progress(text: str) -> None:
+    print_formatted_text(HTML(f"<edsst_color>EDSST</edsst_color>: {text}"), style=backfill_style)
+
+def format_duration(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h {minutes:02}m {seconds:02}s" if hours else f"{minutes}m {seconds:02}s"
+
+def load_progress(path: Path) -> dict[str, int]:     # journal file name -> size it had when it was merged
+    if not path.exists():
+        return {}
+    try:
+        return msgspec.json.decode(path.read_bytes(), type=dict[str, int])
+    except msgspec.DecodeError:
+        return {}
+
+def save_progress(path: Path, progress: dict[str, int]) -> None:
+    write_atomic(path, msgspec.json.encode(progress))
+
+def backfill(journal_directory: Path, workers: int | None = None, restart: bool = False) -> None:
+    core_directory = MODULES_DATA_PATH / CoreModule.MODULE_NAME.lower()
+    core_directory.mkdir(parents=True, exist_ok=True)
+    progress_path = core_directory / PROGRESS_FILE_NAME
+    progress = {} if restart else load_progress(progress_path)
+    journal_files = find_journal_files(journal_directory)
+    if not journal_files:
+        print_progress("Did not find any journal files. Please confirm journal directory is set correctly in the config.toml file.")
+        return
+    # A journal that grew since it was merged (the game was still writing it) is merged again, merging is idempotent
+    sizes = {path.name: path.stat().st_size for path in journal_files}
+    pending = [path for path in journal_files if progress.get(path.name) != sizes[path.name]]
+    total_bytes = sum(sizes[path.name] for path in pending)
+    workers = workers or os.process_cpu_count() or 1
+    print_progress(f"Backfilling {len(pending)} of {len(journal_files)} journal files ({total_bytes / 1e6:.1f} MB) with {workers} worker processes")
+    if not pending:
+        return
+
+    history = SystemHistory(core_directory / SYSTEM_HISTORY_FILE_NAME)
+    start = time.perf_counter()
+    done_bytes = 0
+    systems = 0
+    bodies = 0
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # map hands the results back in submission order, so the files are merged oldest first while the workers run ahead
+            for index, (path, encoded_summary) in enumerate(zip(pending, pool.map(parse_journal_file, [str(path) for path in pending])), start=1):
+                summary = _summary_decoder.decode(encoded_summary)
+                history.record_systems(summary.visits)
+                history.merge_bodies(summary.bodies)
+                history.commit()
+                size = sizes[path.name]
+                progress[path.name] = size
+                save_progress(progress_path, progress)
+                done_bytes += size
+                systems += len(summary.visits)
+                bodies += len(summary.bodies)
+                elapsed = time.perf_counter() - start
+                rate = done_bytes / elapsed if elapsed else 0.0
+                remaining = (total_bytes - done_bytes) / rate if rate else 0.0
+                print_progress(f"[{index:>{len(str(len(pending)))}}/{len(pending)}] {path.name} - {summary.lines} lines | {rate / 1e6:.1f} MB/s | ETA {format_duration(remaining)}")
+    except KeyboardInterrupt:
+        print_progress("Backfill interrupted, run it again to continue where it stopped.")
+        return
+    finally:
+        history.close()
+    print_progress(f"Backfill complete: {done_bytes / 1e6:.1f} MB in {format_duration(time.perf_counter() - start)}, {systems} system visits and {bodies} bodies merged into the system history.")
@@ -1,47 +1,20 @@
-from src.bios.aleoida import *
-from src.bios.amphoraplant import *
-from src.bios.anemone import *
-from src.bios.bacterium import *
-from src.bios.barkmound import *
-from src.bios.braintrees import *
-from src.bios.cactoida import *
-from src.bios.clypeus import *
-from src.bios.concha import *
-from src.bios.crystalline import *
-from src.bios.electricae import *
-from src.bios.fonticula import *
-from src.bios.frutexa import *
-from src.bios.fumerola import *
-from src.bios.fungoida import *
-from src.bios.genus import *
-from src.bios.osseus import *
-from src.bios.recepta import *
-from src.bios.sinuoustuber import *
-from src.bios.species import *
-from src.bios.stratum import *
-from src.bios.tubas import *
-from src.bios.tussock import *
+from pathlib import Path
+from src.bios.batch import BioWorth
+from src.bios.cache import PredictionCache
+from src.bios.genus import Genus
+from src.bios.species import Species
+from src.bios.taxonomy import TAXONOMY_FILE, Taxonomy, load_taxonomy
 
-taxon: list[Genus] = [
-    Aleoida(),
-    Amphora(),
-    Anemone(),
-    Bacterium(),
-    BrainTrees(),
-    Cactoida(),
-    Clypeus(),
-    Concha(),
-    Crystalline(),
-    Electricae(),
-    Fonticula(),
-    Frutexa(),
-    Fumerola(),
-    Fungoida(),
-    Osseus(),
-    Recepta(),
-    SinuousTuber(),
-    Stratum(),
-    Tubus(),
-    Tussock(),
-]
+_current_taxonomy: Taxonomy = load_taxonomy()
+prediction_cache: PredictionCache = PredictionCache(1024)   # planets
 
+def get_taxonomy() -> Taxonomy:
+    # Always asked for again rather than kept, so that a reload reaches every user
+    return _current_taxonomy
+
+def reload_taxonomy(path: Path = TAXONOMY_FILE) -> Taxonomy:
+    # Raises as load_taxonomy, then the current taxonomy stays
+    global _current_taxonomy
+    _current_taxonomy = load_taxonomy(path)
+    prediction_cache.clear()
+    return _current_taxonomy
@@ -0,0 +1,40 @@
+### System bio prediction
+# The possible species and estimated worth of all bio planets of a system in one call, one planet at a time through the
+# compiled RuleTable. The planets of a system share the star and needed planet rules, which the system's Bodies memoize,
+# so the later planets of a system only pay for their own rules.
+# A vectorized version over numpy arrays was measured against this one: its fixed cost only paid off from about 40 bio
+# planets in one system, far more than real systems have, so the predictions stay in plain Python.
+
+from src.modules.core import Bodies, Body, BodyQuery
+from src.bios.rules import RuleTable
+from src.bios.species import Species
+
+BioWorth = tuple[int, int, int, list[list[Species]]]    # (minimum, maximum, average, possible species of each genus)
+
+
+def planet_worth(possible: list[list[Species]], num_signatures: int) -> BioWorth:
+    # The total of the num_signatures cheapest and most valuable genera, the average of the genera's average species value
+    # and the possible species of each genus. A planet with no possible genus is worth 0.
+    taken = max(num_signatures, 0)
+    minimums = sorted(min(organism.value for organism in genus) for genus in possible)
+    maximums = sorted((max(organism.value for organism in genus) for genus in possible), reverse=True)
+    averages = [int(sum(organism.value for organism in genus) / len(genus)) for genus in possible]
+    return sum(minimums[:taken]), sum(maximums[:taken]), int(sum(averages) / len(averages)) if averages else 0, possible
+
+
+class BatchPredictor:
+    rule_table: RuleTable
+    needed_planets: list[BodyQuery]         # every distinct needed planets rule of the taxon
+
+    def __init__(self, rule_table: RuleTable) -> None:
+        self.rule_table = rule_table
+        self.needed_planets = []
+        for genus_rules in rule_table.rules.values():
+            for genus_rule in genus_rules:
+                for rule in genus_rule.species:
+                    if rule.needed_planets is not None and rule.needed_planets not in self.needed_planets:
+                        self.needed_planets.append(rule.needed_planets)
+
+    def estimate_worth(self, star_system: Bodies, planets: list[Body], num_signatures: list[int]) -> list[BioWorth]:
+        # The worth of each planet, see planet_worth
+        return [planet_worth(self.rule_table.possible_species(star_system, planet), count) for planet, count in zip(planets, num_signatures)]
@@ -0,0 +1,107 @@
+### Bio prediction cache
+# The estimated bio worth of planets, kept for the next report. There is one entry per (SystemAddress, BodyID), holding the
+# prediction together with the planet fields it was made from, so an entry only answers for the planet exactly as it was.
+# The stars and planets elsewhere in the system also count, so all entries of a system are dropped when its stars or the
+# needed planets of a species change. A body event for the planet drops its entry right away through Bodies.watch.
+
+from collections import OrderedDict
+from functools import partial
+from typing import Any
+from src.modules.core import Bodies, Body, BodyAttribute
+from src.bios.batch import BatchPredictor, BioWorth
+
+CacheKey = tuple[int, int]      # (SystemAddress, BodyID)
+Fingerprint = tuple[Any, ...]   # compared as it is, never by its hash, so two different inputs can not share an entry
+
+
+def planet_fingerprint(planet: Body, num_signatures: int) -> Fingerprint:
+    # Every field of the planet the rules or the worth estimate look at
+    return (planet.planet_class, planet.atmosphere_type, planet.atmosphere, planet.volcanism, planet.surface_temperature, planet.surface_gravity,
+            planet.distance_from_arrival_ls, planet.semi_major_axis, planet.eccentricity, planet.mean_anomaly,
+            tuple(tuple(parent.items()) for parent in planet.parents), num_signatures)
+
+def system_fingerprint(predictor: BatchPredictor, star_system: Bodies) -> Fingerprint:
+    # The stars of the system, where they orbit, and which needed planets of a species the system has
+    return (tuple((star.body_id, star.star_type, star.subclass, star.luminosity, tuple(tuple(parent.items()) for parent in star.parents))
+                  for star in star_system.query(BodyAttribute.star)),
+            tuple(bool(star_system.query(query)) for query in predictor.needed_planets))
+
+
+class PredictionCache:
+    capacity: int
+    entries: OrderedDict[CacheKey, tuple[Fingerprint, BioWorth]]    # least recently used first
+    systems: dict[int, tuple[Fingerprint, set[CacheKey]]]   # SystemAddress -> (system fingerprint, keys of its entries)
+    hits: int
+    misses: int
+    invalidations: int                          # entries dropped because their planet or system changed
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.entries = OrderedDict()
+        self.systems = {}
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.systems.clear()
+
+    def estimate_worth(self, predictor: BatchPredictor, address: int, star_system: Bodies, planets: list[Body], num_signatures: list[int]) -> list[BioWorth]:
+        # As BatchPredictor.estimate_worth, predicting only the planets with no entry
+        star_system.watch(self, partial(self.drop_body, address))
+        fingerprint = system_fingerprint(predictor, star_system)
+        system = self.systems.get(address)
+        if system is None or system[0] != fingerprint:
+            self.drop_system(address)
+            system = self.systems[address] = (fingerprint, set())
+        keys = [(address, planet.body_id) for planet in planets]
+        fingerprints = [planet_fingerprint(planet, count) for planet, count in zip(planets, num_signatures)]
+        result: list[BioWorth | None] = []
+        for key, planet_print in zip(keys, fingerprints):
+            entry = self.entries.get(key)
+            if entry is not None and entry[0] == planet_print:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                result.append(entry[1])
+            else:
+                self.misses += 1
+                result.append(None)
+        missing = [i for i, worth in enumerate(result) if worth is None]
+        if missing:
+            predicted = predictor.estimate_worth(star_system, [planets[i] for i in missing], [num_signatures[i] for i in missing])
+            for i, worth in zip(missing, predicted):
+                result[i] = worth
+                self.put(keys[i], fingerprints[i], worth, system[1])
+        return [worth for worth in result if worth is not None]
+
+    def put(self, key: CacheKey, fingerprint: Fingerprint, worth: BioWorth, system_keys: set[CacheKey]) -> None:
+        self.entries[key] = (fingerprint, worth)
+        self.entries.move_to_end(key)
+        system_keys.add(key)
+        while len(self.entries) > self.capacity:
+            evicted, _ = self.entries.popitem(last=False)
+            system = self.systems.get(evicted[0])
+            if system is not None:
+                system[1].discard(evicted)
+                if not system[1] and system[1] is not system_keys:
+                    del self.systems[evicted[0]]
+
+    def drop_body(self, address: int, body_id: int) -> None:
+        key = (address, body_id)
+        if self.entries.pop(key, None) is not None:
+            self.invalidations += 1
+            system = self.systems.get(address)
+            if system is not None:
+                system[1].discard(key)
+                if not system[1]:
+                    del self.systems[address]
+
+    def drop_system(self, address: int) -> None:
+        _, keys = self.systems.pop(address, ((), set()))
+        for key in keys:
+            if self.entries.pop(key, None) is not None:
+                self.invalidations += 1
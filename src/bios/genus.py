@@ -1,24 +1,37 @@
-from typing import Any
-from src.modules.core import Bodies
+from src.modules.core import Bodies, Body
 from src.bios.species import Species
-#from src.util import AtmosphereType, StarType, PlanetType
+from src.util import AtmosphereType
+import msgspec
 
 
-class Genus:
-    name: str = "UNKNOWN GENUS"
+class Genus(msgspec.Struct, frozen=True, kw_only=True, forbid_unknown_fields=True):
+    # A [[genera]] of the taxonomy file. Its rules apply to every species of the genus, src.bios.rules compiles them for the predictions.
+    name: str
     code: str
-    species: list[Species]
-    colony_range: int
+    colony_range: int                                       # in m
+    journal_name: str = ""                                  # the Genus of ScanOrganic events, "$Codex_Ent_Bacterial_Genus_Name;"
+    species: tuple[Species, ...] = ()
+    max_gravity: float | None = None                        # in g, the planet's gravity must be less
+    atmosphere_types: tuple[AtmosphereType, ...] = ()       # the planet's atmosphere must be one of these
+    needs_volcanism: bool = False
+    airless_only: bool = False                              # the planet's atmosphere description must be empty or "None"
 
-    def list_possible_species(self, star_system: Bodies, planet: dict[str, Any]) -> list[Species]:
+    def list_possible_species(self, star_system: Bodies, planet: Body) -> list[Species]:
+        if not self.accepts_planet(planet):
+            return []
         result: list[Species] = []
         for organism in self.species:
             if organism.check_viability(star_system, planet):
                 result.append(organism)
         return result
-    
-    def check_if_gravity_less_than(self, planet: dict[str, Any], g: float) -> bool:
-        if (float(planet["SurfaceGravity"]) / 9.8) < g:
-            return True
-        else:
+
+    def accepts_planet(self, planet: Body) -> bool:
+        if self.max_gravity is not None and not planet.gravity_g < self.max_gravity:
+            return False
+        if self.atmosphere_types and planet.atmosphere_kind not in self.atmosphere_types:
+            return False
+        if self.needs_volcanism and not planet.volcanism:
+            return False
+        if self.airless_only and planet.atmosphere not in ("", "None"):
             return False
+        return True
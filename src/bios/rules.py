@@ -0,0 +1,123 @@
+### Compiled species rules
+# The rules of every genus and species of the taxon compiled once into a table keyed by (planet type, atmosphere type).
+# Each key lists only the genera and species that can live on such a planet at all, with the rest of their rules as plain
+# values, so predicting the species of a planet is one dict lookup and a few comparisons per candidate.
+# The results are the same as from Genus.list_possible_species, which interprets the same rules one species at a time.
+
+from src.modules.core import Bodies, Body, BodyQuery
+from src.bios.genus import Genus
+from src.bios.species import Species
+from src.stars import StarKey
+from src.util import AtmosphereType, PlanetType, distance_from_parent_ls
+import math
+import msgspec
+
+
+class SpeciesRule(msgspec.Struct, frozen=True):
+    species: Species
+    min_temperature: float = -math.inf      # the planet's integer surface temperature t must be min <= t < max
+    max_temperature: float = math.inf
+    max_gravity: float = math.inf
+    min_distance_from_arrival_ls: float = -math.inf
+    volcanism_kinds: tuple[frozenset[str], ...] = ()   # the words of each kind, see Body.has_volcanism
+    needs_volcanism: bool = False
+    star_types: frozenset[StarKey] = frozenset()       # empty when any star will do
+    disallowed_luminosities: frozenset[str] = frozenset()
+    min_distance_from_parent_ls: float = -math.inf
+    needed_planets: BodyQuery | None = None
+
+
+class GenusRule(msgspec.Struct, frozen=True):
+    genus: Genus
+    species: tuple[SpeciesRule, ...]
+    max_gravity: float = math.inf
+    needs_volcanism: bool = False
+    airless_only: bool = False
+
+
+class RuleTable:
+    rules: dict[tuple[PlanetType, AtmosphereType], tuple[GenusRule, ...]]
+
+    def __init__(self, rules: dict[tuple[PlanetType, AtmosphereType], tuple[GenusRule, ...]]) -> None:
+        self.rules = rules
+
+    def candidates(self, planet: Body) -> tuple[GenusRule, ...]:
+        return self.rules.get((planet.planet_type, planet.atmosphere_kind), ())
+
+    def possible_species(self, star_system: Bodies, planet: Body) -> list[list[Species]]:
+        # The possible species of each genus in taxon order, leaving out genera with none
+        result: list[list[Species]] = []
+        gravity = planet.gravity_g
+        temperature = int(planet.surface_temperature)
+        distance_from_parent: float | None = None
+        for genus_rule in self.candidates(planet):
+            if not gravity < genus_rule.max_gravity:
+                continue
+            if genus_rule.needs_volcanism and not planet.volcanism:
+                continue
+            if genus_rule.airless_only and planet.atmosphere not in ("", "None"):
+                continue
+            possible: list[Species] = []
+            for rule in genus_rule.species:
+                if not gravity < rule.max_gravity or not planet.distance_from_arrival_ls > rule.min_distance_from_arrival_ls:
+                    continue
+                if not rule.min_temperature <= temperature < rule.max_temperature:
+                    continue
+                if rule.volcanism_kinds and not any(planet.volcanism_tokens.issuperset(kind) for kind in rule.volcanism_kinds):
+                    continue
+                if rule.needs_volcanism and not planet.volcanism:
+                    continue
+                if rule.min_distance_from_parent_ls > -math.inf:
+                    if distance_from_parent is None:
+                        distance_from_parent = distance_from_parent_ls(planet.semi_major_axis, planet.eccentricity, planet.mean_anomaly)
+                    if not distance_from_parent > rule.min_distance_from_parent_ls:
+                        continue
+                if rule.star_types and not star_system.stars_match(planet, rule.star_types, rule.disallowed_luminosities):
+                    continue
+                if rule.needed_planets is not None and not star_system.query(rule.needed_planets):
+                    continue
+                possible.append(rule.species)
+            if possible:
+                result.append(possible)
+        return result
+
+
+def compile_species(species: Species, planet_type: PlanetType, atmosphere: AtmosphereType) -> SpeciesRule | None:
+    # The rule of the species on planets of the type and atmosphere, None when it can never live there
+    max_gravity = math.inf if species.max_gravity is None else species.max_gravity
+    min_distance_from_arrival_ls = -math.inf if species.min_distance_from_arrival_ls is None else species.min_distance_from_arrival_ls
+    if atmosphere in species.always_viable_atmospheres:
+        return SpeciesRule(species, max_gravity=max_gravity, min_distance_from_arrival_ls=min_distance_from_arrival_ls)
+    if not species.accepts_planet_type(planet_type) or not species.accepts_atmosphere(atmosphere):
+        return None
+    return SpeciesRule(
+        species,
+        min_temperature=species.min_temperature,
+        max_temperature=species.max_temperature,
+        max_gravity=max_gravity,
+        min_distance_from_arrival_ls=min_distance_from_arrival_ls,
+        volcanism_kinds=tuple(frozenset(kind.split()) for kind in species.volcanism_kinds),
+        needs_volcanism=species.needs_volcanism,
+        star_types=species.star_keys(),
+        disallowed_luminosities=frozenset(species.disallowed_luminosities),
+        min_distance_from_parent_ls=-math.inf if species.min_distance_from_parent_ls is None else species.min_distance_from_parent_ls,
+        needed_planets=species.needed_planets_query() if species.needed_planets else None,
+    )
+
+def compile_genus(genus: Genus, planet_type: PlanetType, atmosphere: AtmosphereType) -> GenusRule | None:
+    if genus.atmosphere_types and atmosphere not in genus.atmosphere_types:
+        return None
+    species_rules = tuple(rule for rule in (compile_species(species, planet_type, atmosphere) for species in genus.species) if rule is not None)
+    if not species_rules:
+        return None
+    return GenusRule(genus, species_rules, max_gravity=math.inf if genus.max_gravity is None else genus.max_gravity,
+                     needs_volcanism=genus.needs_volcanism, airless_only=genus.airless_only)
+
+def compile_taxon(taxon: tuple[Genus, ...]) -> RuleTable:
+    rules: dict[tuple[PlanetType, AtmosphereType], tuple[GenusRule, ...]] = {}
+    for planet_type in PlanetType:
+        for atmosphere in AtmosphereType:
+            genus_rules = tuple(rule for rule in (compile_genus(genus, planet_type, atmosphere) for genus in taxon) if rule is not None)
+            if genus_rules:
+                rules[(planet_type, atmosphere)] = genus_rules
+    return RuleTable(rules)
@@ -1,80 +1,80 @@
-from src.modules.core import Bodies
-from typing import Any
-from src.util import AtmosphereType, StarType, PlanetType
-from src.modules.core import BodyAttribute
+from src.modules.core import Bodies, Body, BodyAttribute, BodyQuery
+from src.stars import ANY_SUBCLASS, StarKey
+from src.util import AtmosphereType, StarType, PlanetType, distance_from_parent_ls
 from src.version import TESTING_MODE, TestingMode
+import math
+import msgspec
 
 
-class Species:
+class Species(msgspec.Struct, frozen=True, kw_only=True, forbid_unknown_fields=True):
+    # A [[genera.species]] of the taxonomy file, see there for the rules. src.bios.rules compiles them for the predictions.
+    name: str
+    code: str
     value: int = 0
-    name: str = "UNKNOWN SPECIES"
-    code: str = "N/A"
-    atmosphere_types: list[AtmosphereType] = []
-    min_max_temperature: tuple[int, int] = (0, 0)
-    star_types: list[StarType] = []
-    planet_types: list[PlanetType] = []
+    planet_types: tuple[PlanetType, ...] = ()
+    atmosphere_types: tuple[AtmosphereType, ...] = ()
+    min_temperature: float = -math.inf                      # in K, min_temperature <= int(surface temperature) < max_temperature
+    max_temperature: float = math.inf
+    max_gravity: float | None = None                        # in g, the planet's gravity must be less
+    star_types: tuple[StarType, ...] = ()
+    disallowed_luminosities: tuple[str, ...] = ()           # luminosity classes that keep a star matching star_types from counting
+    volcanism_kinds: tuple[str, ...] = ()                   # the planet must have any of these kinds of volcanism
+    needs_volcanism: bool = False
+    min_distance_from_arrival_ls: float | None = None       # the planet must be further from the arrival star
+    min_distance_from_parent_ls: float | None = None        # the planet must currently be further from its parent
+    needed_planets: tuple[str, ...] = ()                    # names of BodyAttributes, some body in the system must have any of them
+    always_viable_atmospheres: tuple[AtmosphereType, ...] = ()  # with these atmospheres only max_gravity and min_distance_from_arrival_ls apply
 
-    def check_viability(self, star_system: Bodies, planet: dict[str, Any]) -> bool:
-        if self.planet_types:
-            valid_planet: bool = False
-            for planet_type in self.planet_types:
-                if planet_type == PlanetType(planet["PlanetClass"]):
-                    valid_planet = True
-                    break
-            if not valid_planet:
-                if TESTING_MODE == TestingMode.Testing: print(f"Rejected {self.code} because of planet type")
-                return False
-            
-        if self.atmosphere_types:
-            if AtmosphereType.ANY in self.atmosphere_types and AtmosphereType(planet["AtmosphereType"]) != AtmosphereType.NONE:
-                pass
-            else:
-                valid_atmosphere: bool = False
-                for atmosphere in self.atmosphere_types:
-                    if atmosphere == AtmosphereType(planet["AtmosphereType"]):
-                        valid_atmosphere = True
-                        break
-                if not valid_atmosphere:
-                    if TESTING_MODE == TestingMode.Testing: print(f"Rejected {self.code} because of atmosphere type")
-                    return False
-            
-        if self.star_types:
-            valid_star_type: bool = False
-            stars_in_system = star_system.get_bodies_by_attribute(BodyAttribute.star)
-            for star_type in self.star_types:
-                for star in stars_in_system:
-                    if star_type.spectral_class == star["StarType"]:
-                        if star_type.luminosity == star["Luminosity"] or star_type.luminosity == "All":
-                            if star_type.subclass < 0:
-                                if star_type.subclass == star["Subclass"]:
-                                    valid_star_type = True
-                                    break
-                            else:
-                                valid_star_type = True
-                                break
-            if not valid_star_type:
-                if TESTING_MODE == TestingMode.Testing: print(f"Rejected {self.code} because of star type")
-                return False
+    def check_viability(self, star_system: Bodies, planet: Body) -> bool:
+        if self.max_gravity is not None and not planet.gravity_g < self.max_gravity:
+            if TESTING_MODE == TestingMode.Testing: print(f"Rejected {self.code} because of gravity")
+            return False
+        if self.min_distance_from_arrival_ls is not None and not planet.distance_from_arrival_ls > self.min_distance_from_arrival_ls:
+            if TESTING_MODE == TestingMode.Testing: print(f"Rejected {self.code} because of distance from arrival")
+            return False
+        if planet.atmosphere_kind in self.always_viable_atmospheres:
+            return True
+
+        if not self.accepts_planet_type(planet.planet_type):
+            if TESTING_MODE == TestingMode.Testing: print(f"Rejected {self.code} because of planet type")
+            return False
+        if not self.accepts_atmosphere(planet.atmosphere_kind):
+            if TESTING_MODE == TestingMode.Testing: print(f"Rejected {self.code} because of atmosphere type")
+            return False
+        if self.star_types and not star_system.stars_match(planet, self.star_keys(), self.disallowed_luminosities):
+            if TESTING_MODE == TestingMode.Testing: print(f"Rejected {self.code} because of star type")
+            return False
+        if not self.min_temperature <= int(planet.surface_temperature) < self.max_temperature:
+            if TESTING_MODE == TestingMode.Testing: print(f"Rejected {self.code} because of temperature")
+            return False
+
+        if self.volcanism_kinds and not planet.has_volcanism(*self.volcanism_kinds):
+            if TESTING_MODE == TestingMode.Testing: print(f"Rejected {self.code} because of volcanism")
+            return False
+        if self.needs_volcanism and not planet.volcanism:
+            if TESTING_MODE == TestingMode.Testing: print(f"Rejected {self.code} because of no volcanism")
+            return False
+        if self.min_distance_from_parent_ls is not None and not distance_from_parent_ls(planet.semi_major_axis, planet.eccentricity, planet.mean_anomaly) > self.min_distance_from_parent_ls:
+            if TESTING_MODE == TestingMode.Testing: print(f"Rejected {self.code} because of distance from parent")
+            return False
+        if self.needed_planets and not star_system.query(self.needed_planets_query()):
+            if TESTING_MODE == TestingMode.Testing: print(f"Rejected {self.code} because of missing planets in the system")
+            return False
+        return True
 
-        planet_surface_temperature = int(planet["SurfaceTemperature"])
-        min_temperature, max_temperature = self.min_max_temperature
-        if min_temperature == 0 and max_temperature == 0:
+    def accepts_planet_type(self, planet_type: PlanetType) -> bool:
+        return not self.planet_types or planet_type in self.planet_types
+
+    def accepts_atmosphere(self, atmosphere: AtmosphereType) -> bool:
+        if not self.atmosphere_types:
             return True
-        if min_temperature == max_temperature:
-            if min_temperature < 0:
-                if planet_surface_temperature <= abs(min_temperature):
-                    return True
-            else:
-                if planet_surface_temperature >= min_temperature:
-                    return True
-        else:
-            if planet_surface_temperature >= min_temperature and planet_surface_temperature < max_temperature:
-                return True
-        if TESTING_MODE == TestingMode.Testing: print(f"Rejected {self.code} because of temperature")
-        return False
-    
-    def check_if_gravity_less_than(self, planet: dict[str, Any], g: float) -> bool:
-        if (float(planet["SurfaceGravity"]) / 9.8) < g:
+        if AtmosphereType.ANY in self.atmosphere_types and atmosphere != AtmosphereType.NONE:
             return True
-        else:
-            return False
\ No newline at end of file
+        return atmosphere in self.atmosphere_types
+
+    def star_keys(self) -> frozenset[StarKey]:
+        # The star types as the keys of src.stars, a negative subclass allows any
+        return frozenset((star_type.spectral_class, star_type.subclass if star_type.subclass >= 0 else ANY_SUBCLASS, star_type.luminosity) for star_type in self.star_types)
+
+    def needed_planets_query(self) -> BodyQuery:
+        return BodyQuery.any(*(BodyAttribute[name] for name in self.needed_planets))
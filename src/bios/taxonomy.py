@@ -0,0 +1,56 @@
+### Taxonomy
+# The genera and species of taxonomy.toml, decoded and checked once and compiled into the rule table and the system
+# predictor. A Taxonomy never changes, reloading the file makes a new one.
+
+from pathlib import Path
+from src.modules.core import BodyAttribute
+from src.bios.batch import BatchPredictor
+from src.bios.genus import Genus
+from src.bios.rules import RuleTable, compile_taxon
+from src.bios.species import Species
+import msgspec
+
+TAXONOMY_FILE = Path(__file__).with_name("taxonomy.toml")
+
+
+class TaxonomyFile(msgspec.Struct, forbid_unknown_fields=True):
+    genera: tuple[Genus, ...]
+
+
+class Taxonomy:
+    genera: tuple[Genus, ...]
+    genera_by_journal_name: dict[str, Genus]
+    rule_table: RuleTable
+    predictor: BatchPredictor
+
+    def __init__(self, genera: tuple[Genus, ...]) -> None:
+        self.genera = genera
+        self.genera_by_journal_name = {genus.journal_name: genus for genus in genera if genus.journal_name}
+        self.rule_table = compile_taxon(genera)
+        self.predictor = BatchPredictor(self.rule_table)
+
+    def genus_of_sample(self, journal_name: str, localised_name: str = "") -> Genus | None:
+        # The genus of a ScanOrganic event, by its localised name when the file has no such journal_name
+        genus = self.genera_by_journal_name.get(journal_name)
+        if genus is None:
+            genus = next((genus for genus in self.genera if genus.name.replace(" ", "").lower() == localised_name.replace(" ", "").lower()), None)
+        return genus
+
+    @property
+    def species(self) -> tuple[Species, ...]:
+        return tuple(organism for genus in self.genera for organism in genus.species)
+
+
+def load_taxonomy(path: Path = TAXONOMY_FILE) -> Taxonomy:
+    # Raises OSError when the file can not be read and msgspec.ValidationError or msgspec.DecodeError when it is not a valid taxonomy
+    genera = msgspec.toml.decode(path.read_bytes(), type=TaxonomyFile).genera
+    codes: set[str] = set()
+    for genus in genera:
+        for organism in genus.species:
+            if organism.code in codes:
+                raise msgspec.ValidationError(f"Species code {organism.code} is used more than once")
+            codes.add(organism.code)
+            unknown_attributes = [name for name in organism.needed_planets if name not in BodyAttribute.__members__]
+            if unknown_attributes:
+                raise msgspec.ValidationError(f"Unknown needed_planets of {organism.code}: {", ".join(unknown_attributes)}")
+    return Taxonomy(genera)
@@ -0,0 +1,180 @@
+from src.events import JournalEvent, decode_event, decode_typed_event, event_name
+from src.modules.module import Module
+import asyncio
+import time
+import toml
+import traceback
+from typing import Any
+
+config = toml.load("config.toml")
+
+MODULE_QUEUE_SIZE: int = int(config.get("module_queue_size", 256))
+MODULE_QUEUE_FULL_POLICY: str = str(config.get("module_queue_full_policy", "block")).lower()   # "block" or "drop"
+
+
+async def deliver(module: Module, event: JournalEvent | dict[str, Any], tg: asyncio.TaskGroup) -> None:
+    try:
+        if isinstance(event, JournalEvent):
+            await module.process_typed_event(event, tg)
+        else:
+            await module.process_event(event, tg)
+    except Exception:
+        module.print(f"Encountered an unrecoverable error:")
+        print(traceback.format_exc())
+        module.disable()
+
+
+class ModuleQueue:
+    # Bounded queue and worker task of a single module, so a slow module only ever delays itself.
+    module: Module
+    queue: asyncio.Queue[tuple[float, JournalEvent | dict[str, Any]]]
+    worker: asyncio.Task[None] | None
+    processed: int
+    dropped: int
+    last_lag: float     # seconds between an event being queued and the module starting on it
+    max_lag: float
+
+    def __init__(self, module: Module, size: int) -> None:
+        self.module = module
+        self.queue = asyncio.Queue(maxsize=size)
+        self.worker = None
+        self.processed = 0
+        self.dropped = 0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+
+    async def put(self, event: JournalEvent | dict[str, Any], drop_when_full: bool) -> None:
+        if drop_when_full:
+            try:
+                self.queue.put_nowait((time.monotonic(), event))
+            except asyncio.QueueFull:
+                self.dropped += 1
+        else:
+            await self.queue.put((time.monotonic(), event))
+
+    async def work(self, tg: asyncio.TaskGroup) -> None:
+        while True:
+            queued_at, event = await self.queue.get()
+            self.last_lag = time.monotonic() - queued_at
+            self.max_lag = max(self.max_lag, self.last_lag)
+            if self.module.state.enabled:    # the module may have been disabled while the event was waiting
+                await deliver(self.module, event, tg)
+            self.processed += 1
+            self.queue.task_done()
+
+
+class EventDispatcher:
+    # Routes every journal line only to the modules subscribed to its event type.
+    # Routes are built lazily per event type and rebuilt whenever a module changes its subscriptions.
+    # Until caught up every module is handled inline and in order, afterwards modules with QUEUED set get the events through their own queue.
+    modules: list[Module]
+    routes: dict[str, list[tuple[Module, bool]]]    # event type -> (module, wants the typed event)
+    routes_generation: int
+    queues: dict[Module, ModuleQueue]
+    caught_up: bool
+    drop_when_full: bool
+
+    def __init__(self, modules: list[Module], queue_size: int = MODULE_QUEUE_SIZE, full_policy: str = MODULE_QUEUE_FULL_POLICY) -> None:
+        self.modules = modules
+        self.routes = {}
+        self.routes_generation = Module.subscription_generation
+        self.queues = {module: ModuleQueue(module, queue_size) for module in modules if module.QUEUED}
+        self.caught_up = False
+        self.drop_when_full = full_policy == "drop"
+
+    def start(self, tg: asyncio.TaskGroup) -> None:
+        for module_queue in self.queues.values():
+            module_queue.worker = tg.create_task(module_queue.work(tg))
+
+    def stop(self) -> None:
+        for module_queue in self.queues.values():
+            if module_queue.worker is not None:
+                module_queue.worker.cancel()
+
+    def get_route(self, name: str) -> list[tuple[Module, bool]]:
+        if self.routes_generation != Module.subscription_generation:
+            self.routes.clear()
+            self.routes_generation = Module.subscription_generation
+        route = self.routes.get(name)
+        if route is None:
+            route = [(module, name in module.TYPED_EVENTS) for module in self.modules if module.is_subscribed(name)]
+            self.routes[name] = route
+        return route
+
+    def decode(self, line: bytes) -> list[tuple[Module, JournalEvent | dict[str, Any]]]:
+        # Decodes the line once per representation needed by the modules routed to it
+        name = event_name(line)
+        deliveries: list[tuple[Module, JournalEvent | dict[str, Any]]] = []
+        event: dict[str, Any] | None = None
+        typed_event: JournalEvent | dict[str, Any] | None = None
+        for module, typed in self.get_route(name):
+            if module.state.enabled or not module.caught_up:
+                try:
+                    if typed:
+                        if typed_event is None:
+                            typed_event = decode_typed_event(line, name)
+                        if isinstance(typed_event, JournalEvent):
+                            deliveries.append((module, typed_event))
+                            continue
+                    if event is None:
+                        event = decode_event(line)
+                except Exception:
+                    module.print(f"Encountered an unrecoverable error:")
+                    print(traceback.format_exc())
+                    module.disable()
+                    continue
+                deliveries.append((module, event))
+        if name == "CaughtUp":
+            self.caught_up = True
+        return deliveries
+
+    async def dispatch(self, line: bytes, tg: asyncio.TaskGroup) -> None:
+        caught_up = self.caught_up
+        for module, event in self.decode(line):
+            await self.send(module, event, tg, caught_up)
+
+    async def dispatch_batch(self, lines: list[bytes], tg: asyncio.TaskGroup) -> None:
+        # Catch-up: every module gets its share of the slice in one process_event_batch call, in module order.
+        # Lines are only decoded once some module's select_batch keeps them, and then only once per representation.
+        # Events keep their order within a module, but not between modules: the core has folded in the whole slice before the
+        # next module sees its first event, so a module must not read another module's state for a replayed event.
+        names = [event_name(line) for line in lines]
+        routed: dict[Module, list[tuple[int, bool]]] = {module: [] for module in self.modules}
+        for index, name in enumerate(names):
+            for module, typed in self.get_route(name):
+                routed[module].append((index, typed))
+        events: list[dict[str, Any] | None] = [None] * len(lines)
+        typed_events: list[JournalEvent | dict[str, Any] | None] = [None] * len(lines)
+        for module, indices in routed.items():
+            if not indices or not (module.state.enabled or not module.caught_up):
+                continue
+            batch: list[JournalEvent | dict[str, Any]] = []
+            try:
+                for position in module.select_batch([names[index] for index, _ in indices]):
+                    index, typed = indices[position]
+                    if typed:
+                        typed_event = typed_events[index]
+                        if typed_event is None:
+                            typed_event = typed_events[index] = decode_typed_event(lines[index], names[index])
+                        if isinstance(typed_event, JournalEvent):
+                            batch.append(typed_event)
+                            continue
+                    event = events[index]
+                    if event is None:
+                        event = events[index] = decode_event(lines[index])
+                    batch.append(event)
+                if batch:
+                    await module.process_event_batch(batch, tg)
+            except Exception:
+                module.print(f"Encountered an unrecoverable error:")
+                print(traceback.format_exc())
+                module.disable()
+        if "CaughtUp" in names:
+            self.caught_up = True
+
+    async def send(self, module: Module, event: JournalEvent | dict[str, Any], tg: asyncio.TaskGroup, queued: bool) -> None:
+        module_queue = self.queues.get(module)
+        if module_queue is None or not queued:
+            await deliver(module, event, tg)
+        else:
+            await module_queue.put(event, self.drop_when_full)
@@ -0,0 +1,149 @@
+### Typed journal events
+# The hot journal events are decoded straight from the journal line into msgspec structs.
+# Every other event is decoded into a plain dict, exactly as before.
+
+from typing import Any
+import msgspec
+
+JOURNAL_FIELD_NAMES: dict[str, str] = {
+    "timestamp": "timestamp",
+    "event": "event",
+    "body_id": "BodyID",
+    "distance_from_arrival_ls": "DistanceFromArrivalLS",
+    "mass_em": "MassEM",
+    "age_my": "Age_MY",
+    "type_localised": "Type_Localised",
+    "genus_localised": "Genus_Localised",
+}
+
+def journal_field_name(name: str) -> str:   # snake_case attribute -> journal key
+    if name in JOURNAL_FIELD_NAMES:
+        return JOURNAL_FIELD_NAMES[name]
+    return "".join(part.capitalize() for part in name.split("_"))
+
+
+class JournalEvent(msgspec.Struct, kw_only=True, rename=journal_field_name):
+    timestamp: str = ""
+    event: str = ""
+
+class Signal(msgspec.Struct, kw_only=True, rename=journal_field_name):
+    type: str
+    type_localised: str = ""
+    count: int = 0
+
+class Genus(msgspec.Struct, kw_only=True, rename=journal_field_name):
+    genus: str
+    genus_localised: str = ""
+
+class Scan(JournalEvent):
+    scan_type: str = ""
+    body_name: str = ""
+    body_id: int = -1
+    parents: list[dict[str, int]] = []
+    star_system: str = ""
+    system_address: int = 0
+    distance_from_arrival_ls: float = 0.0
+    star_type: str | None = None
+    subclass: int | None = None
+    stellar_mass: float | None = None
+    luminosity: str | None = None
+    age_my: int | None = None
+    absolute_magnitude: float | None = None
+    radius: float | None = None
+    surface_temperature: float | None = None
+    semi_major_axis: float | None = None
+    eccentricity: float | None = None
+    orbital_inclination: float | None = None
+    periapsis: float | None = None
+    orbital_period: float | None = None
+    ascending_node: float | None = None
+    mean_anomaly: float | None = None
+    rotation_period: float | None = None
+    axial_tilt: float | None = None
+    tidal_lock: bool | None = None
+    terraform_state: str | None = None
+    planet_class: str | None = None
+    atmosphere: str | None = None
+    atmosphere_type: str | None = None
+    volcanism: str | None = None
+    mass_em: float | None = None
+    surface_gravity: float | None = None
+    surface_pressure: float | None = None
+    landable: bool | None = None
+    rings: list[dict[str, Any]] | None = None
+    was_discovered: bool = True
+    was_mapped: bool = True
+    was_footfalled: bool | None = None
+
+class SystemArrival(JournalEvent):  # FSDJump, Location and CarrierJump all place the commander in a new system
+    star_system: str = ""
+    system_address: int = 0
+    star_pos: tuple[float, float, float] = (0.0, 0.0, 0.0)
+    body: str = ""
+    body_id: int = -1
+    body_type: str = ""
+
+class FSDJump(SystemArrival):
+    jump_dist: float = 0.0
+    fuel_used: float = 0.0
+    fuel_level: float = 0.0
+
+class Location(SystemArrival):
+    docked: bool = False
+
+class CarrierJump(SystemArrival):
+    docked: bool = False
+
+class FSSBodySignals(JournalEvent):
+    body_name: str = ""
+    body_id: int = -1
+    system_address: int = 0
+    signals: list[Signal] = []
+
+class SAASignalsFound(JournalEvent):
+    body_name: str = ""
+    body_id: int = -1
+    system_address: int = 0
+    signals: list[Signal] = []
+    genuses: list[Genus] = []
+
+class FSSAllBodiesFound(JournalEvent):
+    system_name: str = ""
+    system_address: int = 0
+    count: int = 0
+
+
+EVENT_TYPES: dict[str, type[JournalEvent]] = {
+    "Scan": Scan,
+    "FSDJump": FSDJump,
+    "Location": Location,
+    "CarrierJump": CarrierJump,
+    "FSSBodySignals": FSSBodySignals,
+    "SAASignalsFound": SAASignalsFound,
+    "FSSAllBodiesFound": FSSAllBodiesFound,
+}
+
+_EVENT_NAME_MARKER = b'"event":"'
+_header_decoder = msgspec.json.Decoder(JournalEvent)
+_dict_decoder = msgspec.json.Decoder(dict[str, Any])
+_typed_decoders: dict[str, msgspec.json.Decoder[Any]] = {name: msgspec.json.Decoder(event_type) for name, event_type in EVENT_TYPES.items()}
+
+def event_name(line: bytes) -> str:
+    # The game always writes '"event":"Name"' near the start of the line, so a byte search avoids decoding the line just for its name.
+    start = line.find(_EVENT_NAME_MARKER)
+    if start >= 0:
+        start += len(_EVENT_NAME_MARKER)
+        end = line.find(b'"', start)
+        if end >= 0:
+            return line[start:end].decode()
+    return _header_decoder.decode(line).event
+
+def decode_event(line: bytes) -> dict[str, Any]:
+    return _dict_decoder.decode(line)
+
+def decode_typed_event(line: bytes, name: str | None = None) -> JournalEvent | dict[str, Any]:
+    # Unknown events fall back to a dict
+    decoder = _typed_decoders.get(name if name is not None else event_name(line))
+    if decoder is None:
+        return _dict_decoder.decode(line)
+    return decoder.decode(line)
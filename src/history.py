@@ -0,0 +1,139 @@
+### System history
+# Every visited star system and its bodies, kept in an SQLite database next to the core module state.
+# System coordinates are indexed with an R*Tree, so radius and nearest-neighbour queries stay fast with hundreds of thousands of systems.
+
+from pathlib import Path
+from typing import Any, Iterable
+import math
+import msgspec
+import sqlite3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS systems (
+    address INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    x REAL NOT NULL, y REAL NOT NULL, z REAL NOT NULL,
+    first_visit TEXT NOT NULL,
+    last_visit TEXT NOT NULL,
+    visits INTEGER NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS system_positions USING rtree(address, min_x, max_x, min_y, max_y, min_z, max_z);
+CREATE TABLE IF NOT EXISTS bodies (
+    system_address INTEGER NOT NULL,
+    body_id INTEGER NOT NULL,
+    body TEXT NOT NULL,
+    attributes TEXT NOT NULL,
+    PRIMARY KEY (system_address, body_id)
+) WITHOUT ROWID;
+"""
+
+SYSTEM_COLUMNS = "systems.address, systems.name, systems.x, systems.y, systems.z, systems.first_visit, systems.last_visit, systems.visits"
+SYSTEM_HISTORY_FILE_NAME = "system_history.sqlite"
+NEAREST_START_RADIUS = 25.0     # light years, doubled until enough systems are found
+NEAREST_MAX_RADIUS = 100000.0
+
+
+class VisitedSystem(msgspec.Struct, frozen=True):
+    address: int
+    name: str
+    coordinates: tuple[float, float, float]
+    first_visit: str
+    last_visit: str
+    visits: int
+
+class HistoricBody(msgspec.Struct, frozen=True):
+    body_id: int
+    body: dict[str, Any]
+    attributes: list[str]   # BodyAttribute names
+
+
+def to_visited_system(row: tuple[Any, ...]) -> VisitedSystem:
+    return VisitedSystem(row[0], row[1], (row[2], row[3], row[4]), row[5], row[6], row[7])
+
+
+class SystemHistory:
+    # Written incrementally as events arrive, committed whenever the core module saves its state
+    connection: sqlite3.Connection
+
+    def __init__(self, path: Path | str) -> None:
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(SCHEMA)
+        self.connection.commit()
+
+    def record_system(self, address: int, name: str, coordinates: tuple[float, float, float], timestamp: str) -> None:
+        self.record_systems([(address, name, coordinates, timestamp)])
+
+    def record_systems(self, visits: list[tuple[int, str, tuple[float, float, float], str]]) -> None:
+        # (address, name, coordinates, timestamp) of each visit. A visit only counts once, so replaying a journal that was already recorded does not add visits
+        self.connection.executemany(
+            "INSERT INTO systems VALUES (?, ?, ?, ?, ?, ?, ?, 1) ON CONFLICT (address) DO UPDATE SET "
+            "name = excluded.name, x = excluded.x, y = excluded.y, z = excluded.z, "
+            "visits = visits + (excluded.last_visit > last_visit), "
+            "first_visit = min(first_visit, excluded.first_visit), last_visit = max(last_visit, excluded.last_visit)",
+            [(address, name, x, y, z, timestamp, timestamp) for address, name, (x, y, z), timestamp in visits],
+        )
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO system_positions VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [(address, x, x, y, y, z, z) for address, _, (x, y, z), _ in visits],
+        )
+
+    def record_body(self, address: int, body_id: int, body: msgspec.Struct | dict[str, Any], attributes: list[str]) -> None:
+        self.connection.execute(
+            "INSERT OR REPLACE INTO bodies VALUES (?, ?, ?, ?)",
+            (address, body_id, msgspec.json.encode(body).decode(), msgspec.json.encode(attributes).decode()),
+        )
+
+    def merge_bodies(self, bodies: Iterable[tuple[int, int, str, str]]) -> None:
+        # (address, body_id, body JSON, attributes JSON) rows merged into what is already known about each body:
+        # later fields overwrite earlier ones and the attributes are combined, all inside SQLite.
+        self.connection.executemany(
+            "INSERT INTO bodies VALUES (?, ?, ?, ?) ON CONFLICT (system_address, body_id) DO UPDATE SET "
+            "body = json_patch(body, excluded.body), "
+            "attributes = (SELECT json_group_array(value) FROM (SELECT value FROM json_each(attributes) UNION SELECT value FROM json_each(excluded.attributes)))",
+            bodies,
+        )
+
+    def commit(self) -> None:
+        self.connection.commit()
+
+    def close(self) -> None:
+        self.connection.commit()
+        self.connection.close()
+
+    def count_systems(self) -> int:
+        return self.connection.execute("SELECT count(*) FROM systems").fetchone()[0]
+
+    def count_bodies(self) -> int:
+        return self.connection.execute("SELECT count(*) FROM bodies").fetchone()[0]
+
+    def get_system(self, address: int) -> VisitedSystem | None:
+        row = self.connection.execute(f"SELECT {SYSTEM_COLUMNS} FROM systems WHERE address = ?", (address,)).fetchone()
+        return to_visited_system(row) if row else None
+
+    def get_bodies(self, address: int) -> list[HistoricBody]:
+        rows = self.connection.execute("SELECT body_id, body, attributes FROM bodies WHERE system_address = ? ORDER BY body_id", (address,))
+        return [HistoricBody(body_id, msgspec.json.decode(body), msgspec.json.decode(attributes)) for body_id, body, attributes in rows]
+
+    def systems_within(self, center: tuple[float, float, float], radius: float, limit: int | None = None) -> list[tuple[float, VisitedSystem]]:
+        # The R*Tree narrows the search down to a box around the sphere, the exact distance check is done on the stored coordinates.
+        x, y, z = center
+        rows = self.connection.execute(
+            f"SELECT {SYSTEM_COLUMNS}, (systems.x - ?1) * (systems.x - ?1) + (systems.y - ?2) * (systems.y - ?2) + (systems.z - ?3) * (systems.z - ?3) AS distance_squared "
+            "FROM system_positions JOIN systems ON systems.address = system_positions.address "
+            "WHERE system_positions.max_x >= ?1 - ?4 AND system_positions.min_x <= ?1 + ?4 "
+            "AND system_positions.max_y >= ?2 - ?4 AND system_positions.min_y <= ?2 + ?4 "
+            "AND system_positions.max_z >= ?3 - ?4 AND system_positions.min_z <= ?3 + ?4 "
+            "AND distance_squared <= ?4 * ?4 ORDER BY distance_squared LIMIT ?5",
+            (x, y, z, radius, -1 if limit is None else limit),
+        )
+        return [(math.sqrt(row[8]), to_visited_system(row)) for row in rows]
+
+    def nearest_systems(self, center: tuple[float, float, float], count: int = 1, exclude: int | None = None) -> list[tuple[float, VisitedSystem]]:
+        # Grows the search sphere until it holds enough systems, the closest ones inside it are then the closest overall.
+        wanted = count + (1 if exclude is not None else 0)
+        radius = NEAREST_START_RADIUS
+        while True:
+            found = self.systems_within(center, radius, wanted)
+            if len(found) >= wanted or radius >= NEAREST_MAX_RADIUS:
+                return [(distance, system) for distance, system in found if system.address != exclude][:count]
+            radius *= 2
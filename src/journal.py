@@ -0,0 +1,112 @@
+from collections import deque
+from hashlib import blake2b
+from pathlib import Path
+from typing import BinaryIO, Iterator
+import msgspec
+import time
+
+HEADER_EVENT_MARKER = b'"event":"LoadGame"'     # Commander and game version information lives in the journal header, up to and including LoadGame
+
+
+class JournalCheckpoint(msgspec.Struct):
+    file_name: str = ""
+    offset: int = 0             # byte offset right after the last processed line
+    header_offset: int = 0      # byte offset right after the LoadGame line, replayed on every resume
+    last_line_length: int = 0
+    last_line_hash: str = ""
+
+    def reset(self, file_name: str) -> None:
+        self.file_name = file_name
+        self.offset = 0
+        self.header_offset = 0
+        self.last_line_length = 0
+        self.last_line_hash = ""
+
+    def advance(self, line: bytes) -> None:
+        self.offset += len(line)
+        self.last_line_length = len(line)
+        self.last_line_hash = hash_line(line)
+        if not self.header_offset and HEADER_EVENT_MARKER in line:
+            self.header_offset = self.offset
+
+    def matches(self, path: Path) -> bool:
+        if self.file_name != path.name or self.offset <= 0 or self.last_line_length <= 0:
+            return False
+        try:
+            if self.offset > path.stat().st_size:
+                return False
+            with open(path, "rb") as file:
+                file.seek(self.offset - self.last_line_length)
+                return hash_line(file.read(self.last_line_length)) == self.last_line_hash
+        except OSError:
+            return False
+
+
+def hash_line(line: bytes) -> str:
+    return blake2b(line, digest_size=16).hexdigest()
+
+def replay_journal(path: Path, checkpoint: JournalCheckpoint) -> Iterator[bytes]:
+    # Yields the complete lines of the journal that have not been processed yet, advancing the checkpoint as it goes.
+    # If the checkpoint does not belong to this file, or the file no longer matches it, the whole file is replayed.
+    resuming = checkpoint.matches(path)
+    if not resuming:
+        checkpoint.reset(path.name)
+    with open(path, "rb") as file:
+        if resuming:
+            for line in file.read(checkpoint.header_offset).splitlines(keepends=True):
+                yield line
+            file.seek(checkpoint.offset)
+        for line in file:
+            if not line.endswith(b"\n"):    # the game is still writing this line, the live tail will pick it up
+                break
+            checkpoint.advance(line)
+            yield line
+
+
+class LineFramer:
+    # Frames the live journal tail into complete, newline-terminated lines.
+    # Bytes after the last newline stay in the buffer until the game finishes writing the line.
+    RATE_WINDOW: float = 10.0   # seconds
+    buffer: bytearray
+    total_bytes: int
+    total_lines: int
+    samples: deque[tuple[float, int, int]]
+
+    def __init__(self) -> None:
+        self.buffer = bytearray()
+        self.total_bytes = 0
+        self.total_lines = 0
+        self.samples = deque()
+
+    def reset(self) -> None:
+        self.buffer.clear()
+
+    def read_lines(self, file: BinaryIO) -> Iterator[bytes]:
+        chunk = file.read()
+        if not chunk:
+            return
+        self.buffer += chunk
+        start = 0
+        lines = 0
+        try:
+            while (end := self.buffer.find(b"\n", start)) >= 0:
+                line = bytes(self.buffer[start:end + 1])
+                start = end + 1
+                lines += 1
+                yield line
+        finally:
+            del self.buffer[:start]
+            self.record(len(chunk), lines)
+
+    def record(self, num_bytes: int, num_lines: int) -> None:
+        self.total_bytes += num_bytes
+        self.total_lines += num_lines
+        self.samples.append((time.monotonic(), num_bytes, num_lines))
+
+    def rates(self) -> tuple[float, float]:    # bytes per second, lines per second
+        cutoff = time.monotonic() - self.RATE_WINDOW
+        while self.samples and self.samples[0][0] < cutoff:
+            self.samples.popleft()
+        num_bytes = sum(sample[1] for sample in self.samples)
+        num_lines = sum(sample[2] for sample in self.samples)
+        return (num_bytes / self.RATE_WINDOW, num_lines / self.RATE_WINDOW)
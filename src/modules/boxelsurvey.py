@@ -1,4 +1,5 @@
 from src.modules import module, edsm, core
+from src.events import FSDJump, JournalEvent
 from src.util import text_to_clipboard
 from prompt_toolkit.styles import Style
 import asyncio
@@ -24,6 +25,8 @@ class BoxelSurvey(module.Module):
     MODULE_VERSION: str = "0.1.2"
     EXTRA_ALIASES: set[str] = set(["boxel", "boxels"])
     STATE_TYPE = BoxelSurveyState
+    TYPED_EVENTS: frozenset[str] = frozenset(["FSDJump"])
+    SUBSCRIPTIONS: frozenset[str] = frozenset()
     boxel_log_file_path: Path
     core: core.CoreModule
     edsm: edsm.EDSM
@@ -38,15 +41,19 @@ class BoxelSurvey(module.Module):
     async def process_event(self, event: Any, tg: asyncio.TaskGroup) -> None:
         await super().process_event(event, tg)
         match event["event"]:
-            case "FSDJump":
-                if self.state.survey_ongoing:
-                    self.update_survey(str(event["StarSystem"]))
             case "CaughtUp":
                 if self.state.survey_ongoing:
                     self.print(f"Boxel survey ongoing! Next system: <cyan>{self.state.next_system}</cyan>")
                     text_to_clipboard(self.state.next_system)
             case _: pass
 
+    async def process_typed_event(self, event: JournalEvent, tg: asyncio.TaskGroup) -> None:
+        match event:
+            case FSDJump():
+                if self.state.survey_ongoing:
+                    self.update_survey(event.star_system)
+            case _: pass
+
     async def process_user_input(self, arguments: list[str], tg: asyncio.TaskGroup) -> None:
         await super().process_user_input(arguments, tg)
         if not self.caught_up or not self.state.enabled:
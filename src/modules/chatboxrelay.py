@@ -17,6 +17,8 @@ class ChatboxRelay(module.Module):
     MODULE_VERSION: str = "0.1.2"
     EXTRA_ALIASES: set[str] = set(["chat", "chatrelay", "textrelay", "commsrelay"])
     STATE_TYPE = ChatboxRelayState
+    SUBSCRIPTIONS: frozenset[str] = frozenset(["SendText"])
+    CATCH_UP_EVENTS: frozenset[str] | None = frozenset()  # only acts on new events
     state: ChatboxRelayState
     push_user_input: Callable[[asyncio.TaskGroup, str], Any]
 
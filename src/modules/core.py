@@ -1,11 +1,27 @@
 from enum import Enum, auto
-from src.modules.module import Module, ModuleState
+from functools import cache, cached_property
+from src.modules.module import WILDCARD_SUBSCRIPTION, Module, ModuleState
+from src.journal import JournalCheckpoint, LineFramer
+from src.events import Genus, JournalEvent, Signal, SystemArrival, journal_field_name
+from src.dispatcher import EventDispatcher
+from src.history import SYSTEM_HISTORY_FILE_NAME, SystemHistory
+from src.statelog import StateLog
+from src.orbits import BARYCENTRE, OrbitIndex
+from src.stars import StarKey, StarSummary
+from src.values import SystemValues
+from src.util import AtmosphereType, PlanetType, abbreviate_atmosphere_type, abbreviate_planet_type
 import msgspec
 from prompt_toolkit import print_formatted_text
 from prompt_toolkit.formatted_text import HTML
 from prompt_toolkit.styles import Style
 import asyncio
-from typing import Any
+import toml
+from typing import Any, Callable, Collection, Iterable
+
+config = toml.load("config.toml")
+
+KEEP_RAW_BODY_EVENTS: bool = config.get("keep_raw_body_events", False)
+STANDARD_GRAVITY = 9.8  # m/s², the journal gives surface gravity in m/s²
 
 
 class BodyAttribute(Enum):
@@ -56,38 +72,329 @@ class BodyAttribute(Enum):
     guardians = auto()
     thargoids = auto()
 
-class Bodies(msgspec.Struct):
-    bodies: dict[int, dict[str, Any]] = msgspec.field(default_factory=dict) # pyright: ignore[reportUnknownVariableType]
-    bodies_by_attribute: dict[BodyAttribute, set[int]] = msgspec.field(default_factory=lambda: {attribute: set() for attribute in BodyAttribute})
+    @property
+    def mask(self) -> int:  # the bit of this attribute in a body's attribute mask
+        return 1 << self.value
+
+    def __and__(self, other: "BodyAttribute | BodyQuery") -> "BodyQuery":
+        return BodyQuery.of(self) & other
+
+    def __or__(self, other: "BodyAttribute | BodyQuery") -> "BodyQuery":
+        return BodyQuery.of(self) | other
+
+    def __invert__(self) -> "BodyQuery":
+        return ~BodyQuery.of(self)
+
+
+class BodyQuery:
+    # A boolean combination of body attributes, built with &, | and ~ on BodyAttribute, for example:
+    #   BodyAttribute.landable & BodyAttribute.atmospheric & ~BodyAttribute.first_footfall
+    # Kept in disjunctive normal form: a body matches when for any one term it has every attribute of the term's
+    # required mask and none of its forbidden mask, so matching a body is a few integer operations.
+    __slots__ = ("terms",)
+    terms: frozenset[tuple[int, int]]   # (required mask, forbidden mask)
+
+    def __init__(self, terms: Iterable[tuple[int, int]]) -> None:
+        self.terms = frozenset((required, forbidden) for required, forbidden in terms if not required & forbidden)   # a term that needs and forbids the same attribute never matches
+
+    @staticmethod
+    def of(query: "BodyAttribute | BodyQuery") -> "BodyQuery":
+        return query if isinstance(query, BodyQuery) else attribute_query(query)
 
-    def get_bodies_by_attribute(self, *args: BodyAttribute, sorted: bool = False) -> list[dict[str, Any]]:  # Effectively "OR" operation on attributes
-        query_set: set[int] = set()
-        for attribute in args:
-            query_set = query_set | self.bodies_by_attribute[attribute]
+    @staticmethod
+    def any(*attributes: BodyAttribute) -> "BodyQuery":
+        return BodyQuery((attribute.mask, 0) for attribute in attributes)
 
-        query_list = list(query_set)
-        if sorted: query_list.sort()
-        result: list[dict[str, Any]] = []
-        for bodyID in query_list:
-            result.append(self.bodies[bodyID])
+    def __and__(self, other: "BodyAttribute | BodyQuery") -> "BodyQuery":
+        return BodyQuery((required | other_required, forbidden | other_forbidden) for required, forbidden in self.terms for other_required, other_forbidden in BodyQuery.of(other).terms)
+
+    def __or__(self, other: "BodyAttribute | BodyQuery") -> "BodyQuery":
+        return BodyQuery(self.terms | BodyQuery.of(other).terms)
+
+    def __invert__(self) -> "BodyQuery":
+        # De Morgan: not (A or B) = not A and not B, where not (a and not b) = not a or b
+        result = BodyQuery([(0, 0)])
+        for required, forbidden in self.terms:
+            negated_term = [(0, 1 << bit) for bit in range(required.bit_length()) if required >> bit & 1]
+            negated_term += [(1 << bit, 0) for bit in range(forbidden.bit_length()) if forbidden >> bit & 1]
+            result = result & BodyQuery(negated_term)
         return result
 
-    def get_body_by_id(self, body_id: int) -> dict[str, Any]:
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, BodyQuery) and self.terms == other.terms
+
+    def __hash__(self) -> int:
+        return hash(self.terms)
+
+    def matches(self, mask: int) -> bool:
+        for required, forbidden in self.terms:
+            if mask & required == required and not mask & forbidden:
+                return True
+        return False
+
+PLANET_CLASS_ATTRIBUTES: dict[str, BodyAttribute] = {
+    "Icy body":                         BodyAttribute.icy_body,
+    "Rocky ice body":                   BodyAttribute.rocky_icy_body,
+    "Rocky body":                       BodyAttribute.rocky_body,
+    "Metal rich body":                  BodyAttribute.metal_rich_body,
+    "High metal content body":          BodyAttribute.high_metal_content_body,
+    "Earthlike body":                   BodyAttribute.earth_like_world_body,
+    "Ammonia world":                    BodyAttribute.ammonia_world_body,
+    "Water world":                      BodyAttribute.water_world_body,
+    "Sudarsky class I gas giant":       BodyAttribute.gas_giant_type_I,
+    "Sudarsky class II gas giant":      BodyAttribute.gas_giant_type_II,
+    "Sudarsky class III gas giant":     BodyAttribute.gas_giant_type_III,
+    "Sudarsky class IV gas giant":      BodyAttribute.gas_giant_type_IV,
+    "Sudarsky class V gas giant":       BodyAttribute.gas_giant_type_V,
+    "Water giant":                      BodyAttribute.gas_giant_water,
+    "Gas giant with water based life":  BodyAttribute.gas_giant_water_with_life,
+    "Gas giant with ammonia based life":BodyAttribute.gas_giant_ammonia_with_life,
+    "Helium rich gas giant":            BodyAttribute.gas_giant_helium_rich,
+    "Helium gas giant":                 BodyAttribute.gas_giant_helium,
+}
+
+SIGNAL_TYPE_ATTRIBUTES: dict[str, BodyAttribute] = {
+    "$SAA_SignalType_Biological;":  BodyAttribute.bios,
+    "$SAA_SignalType_Geological;":  BodyAttribute.geos,
+    "$SAA_SignalType_Guardian;":    BodyAttribute.guardians,
+    "$SAA_SignalType_Thargoid;":    BodyAttribute.thargoids,
+}
+
+def scan_attributes(event: dict[str, Any]) -> list[BodyAttribute]:
+    is_star = True if "StarType" in event else False
+    is_cluster = True if "Cluster" in str(event["BodyName"]) else False
+    is_ring = True if "Ring" in event["BodyName"] else False
+    attributes: list[BodyAttribute] = []
+    if event["WasDiscovered"] == False:
+        attributes.append(BodyAttribute.first_discovery)
+        if is_cluster:
+            attributes.append(BodyAttribute.first_discovery_cluster)
+        else:
+            if is_star:
+                attributes.append(BodyAttribute.first_discovery_star)
+            else:
+                attributes.append(BodyAttribute.first_discovery_planet)
+    if event["WasMapped"] == False:
+        attributes.append(BodyAttribute.first_possible_map)
+        if not is_cluster and not is_star:
+            attributes.append(BodyAttribute.first_possible_map_planet)
+    if event["WasFootfalled"] == False:
+        attributes.append(BodyAttribute.first_possible_footfall)
+        if not is_cluster and not is_star:
+            attributes.append(BodyAttribute.first_possible_footfall_planet)
+    if is_ring:
+        attributes.append(BodyAttribute.ring)
+    elif is_cluster:
+        attributes.append(BodyAttribute.cluster)
+    else:
+        if "Rings" in event:
+            attributes.append(BodyAttribute.ringed)
+        if is_star:
+            attributes.append(BodyAttribute.star)
+        else:
+            if "TerraformState" in event:
+                if event["TerraformState"]:
+                    attributes.append(BodyAttribute.terraformable)
+            if "Volcanism" in event:
+                if event["Volcanism"]:
+                    attributes.append(BodyAttribute.volcanic)
+            if "Landable" in event:
+                if event["Landable"]:
+                    attributes.append(BodyAttribute.landable)
+            if "AtmosphereType" in event:
+                if event["AtmosphereType"] != "None":
+                    attributes.append(BodyAttribute.atmospheric)
+            if event["PlanetClass"] in PLANET_CLASS_ATTRIBUTES:
+                attributes.append(PLANET_CLASS_ATTRIBUTES[event["PlanetClass"]])
+            attributes.append(BodyAttribute.planet)
+    return attributes
+
+def body_event_attributes(event: dict[str, Any]) -> list[BodyAttribute]:  # attributes a body gains from one of the body events
+    match event["event"]:
+        case "Scan":
+            return scan_attributes(event)
+        case "FSSBodySignals":
+            return [SIGNAL_TYPE_ATTRIBUTES[signal["Type"]] for signal in event["Signals"] if signal["Type"] in SIGNAL_TYPE_ATTRIBUTES]
+        case "SAAScanComplete":
+            return [BodyAttribute.saa_scan]
+        case "SAASignalsFound":
+            return [BodyAttribute.saa_signal]
+        case _:
+            return []
+
+
+class Body(msgspec.Struct, kw_only=True, omit_defaults=True, rename=journal_field_name, dict=True):
+    # The parts of a body's journal events that the modules read, merged from all events about the body. Stored under the journal field names.
+    body_name: str = ""
+    body_id: int = -1
+    parents: list[dict[str, int]] = []     # [{"Planet": 5}, {"Star": 1}, {"Null": 0}], the parent first
+    distance_from_arrival_ls: float = 0.0
+    star_type: str = ""
+    subclass: int = 0
+    luminosity: str = ""
+    stellar_mass: float = 0.0
+    planet_class: str = ""
+    terraform_state: str = ""
+    mass_em: float = 0.0
+    atmosphere: str = ""
+    atmosphere_type: str = ""
+    volcanism: str = ""
+    surface_temperature: float = 0.0
+    surface_gravity: float = 0.0
+    semi_major_axis: float = 0.0
+    eccentricity: float = 0.0
+    mean_anomaly: float = 0.0
+    landable: bool = False
+    was_discovered: bool = True
+    was_mapped: bool = True
+    was_footfalled: bool = True
+    signals: list[Signal] = []
+    genuses: list[Genus] = []
+    raw: msgspec.Raw = msgspec.Raw()   # the full merged journal payload as JSON, only kept with keep_raw_body_events and only decoded when asked for
+
+    def raw_payload(self) -> dict[str, Any]:
+        return msgspec.json.decode(self.raw) if self.raw else {}
+
+    # Values derived from the fields above. Each is worked out the first time it is read after an event about the body, and is not saved.
+    @cached_property
+    def gravity_g(self) -> float:
+        return self.surface_gravity / STANDARD_GRAVITY
+
+    @cached_property
+    def volcanism_tokens(self) -> frozenset[str]:
+        return frozenset(self.volcanism.lower().split())
+
+    def has_volcanism(self, *kinds: str) -> bool:
+        # Any of the kinds of volcanism, a kind of several words ("carbon dioxide") needs all of them
+        return any(self.volcanism_tokens.issuperset(kind.split()) for kind in kinds)
+
+    @cached_property
+    def planet_type(self) -> PlanetType:
+        return PLANET_TYPES.get(self.planet_class, PlanetType.NONE)
+
+    @cached_property
+    def atmosphere_kind(self) -> AtmosphereType:
+        return ATMOSPHERE_TYPES.get(self.atmosphere_type, AtmosphereType.NONE)
+
+    @cached_property
+    def planet_class_abbreviation(self) -> str:
+        return abbreviate_planet_type(self.planet_class)
+
+    @cached_property
+    def atmosphere_abbreviation(self) -> str:
+        return abbreviate_atmosphere_type(self.atmosphere_type)
+
+BODY_FIELD_NAMES: dict[str, str] = {journal_field_name(name): name for name in Body.__struct_fields__ if name != "raw"}  # journal key -> Body attribute
+PLANET_TYPES: dict[str, PlanetType] = {planet_type.value: planet_type for planet_type in PlanetType}
+ATMOSPHERE_TYPES: dict[str, AtmosphereType] = {atmosphere_type.value: atmosphere_type for atmosphere_type in AtmosphereType}
+_body_decoder = msgspec.json.Decoder(Body)
+
+
+@cache
+def attribute_query(attribute: BodyAttribute) -> BodyQuery:
+    return BodyQuery([(attribute.mask, 0)])
+
+
+class Bodies(msgspec.Struct, dict=True):
+    bodies: dict[int, Body] = msgspec.field(default_factory=dict) # pyright: ignore[reportUnknownVariableType]
+    attribute_masks: dict[int, int] = msgspec.field(default_factory=dict)   # body id -> BodyAttribute masks of the body OR-ed together
+    # query results are memoized in self.__dict__["query_cache"], which is not saved, and cleared whenever a body gains an attribute
+
+    def watch(self, key: object, on_change: Callable[[int], None]) -> None:
+        # on_change is called with the body id whenever a body event changes a body, once per key however often it is watched. Not saved
+        self.__dict__.setdefault("watchers", {})[key] = on_change
+
+    @property
+    def estimated_values(self) -> SystemValues:
+        # Created on first use and then kept up to date by add_body_signal, not saved
+        values = self.__dict__.get("estimated_values")
+        if values is None:
+            values = self.__dict__["estimated_values"] = SystemValues(self)
+        return values
+
+    @property
+    def orbits(self) -> OrbitIndex:
+        # Built from the bodies' Parents on first use and then kept up to date by add_body_signal, not saved
+        orbits = self.__dict__.get("orbits")
+        if orbits is None:
+            orbits = self.__dict__["orbits"] = OrbitIndex(self.bodies.values())
+        return orbits
+
+    @property
+    def star_summary(self) -> StarSummary:
+        # Built from the scanned stars on first use and then kept up to date by add_body_signal, not saved
+        summary = self.__dict__.get("star_summary")
+        if summary is None:
+            summary = self.__dict__["star_summary"] = StarSummary(self.bodies.values())
+        return summary
+
+    def stars_match(self, body: Body, star_types: frozenset[StarKey], disallowed_luminosities: Collection[str]) -> bool:
+        # Whether the star the body orbits, or any star of the system until that is known, is of one of star_types
+        summary = self.star_summary
+        return summary.any_matches(star_types, disallowed_luminosities, summary.scanned(self.orbits.parent_stars(body.body_id)))
+
+    def parent_stars(self, body: Body) -> tuple[Body, ...]:
+        # The scanned stars the body orbits, see OrbitIndex.parent_stars
+        return tuple(self.bodies[star_id] for star_id in self.orbits.parent_stars(body.body_id) if star_id in self.bodies and self.bodies[star_id].star_type)
+
+    def query(self, query: BodyAttribute | BodyQuery) -> tuple[Body, ...]:
+        # The matching bodies in body id order. The result is shared between callers, so it is a tuple
+        query = BodyQuery.of(query)
+        cache: dict[BodyQuery, tuple[Body, ...]] = self.__dict__.setdefault("query_cache", {})
+        result = cache.get(query)
+        if result is None:
+            result = cache[query] = tuple(self.get_body_by_id(body_id) for body_id in sorted(self.attribute_masks) if query.matches(self.attribute_masks[body_id]))
+        return result
+
+    def get_bodies_by_attribute(self, *args: BodyAttribute, sorted: bool = False) -> tuple[Body, ...]:  # Effectively "OR" operation on attributes, always in body id order
+        return self.query(BodyQuery.any(*args))
+
+    def has_attribute(self, body_id: int, attribute: BodyAttribute) -> bool:
+        return bool(self.attribute_masks.get(body_id, 0) & attribute.mask)
+
+    def attributes_of(self, body_id: int) -> list[BodyAttribute]:
+        mask = self.attribute_masks.get(body_id, 0)
+        return [attribute for attribute in BodyAttribute if mask & attribute.mask]
+
+    def get_body_by_id(self, body_id: int) -> Body:
         if body_id not in self.bodies:
-            self.bodies[body_id] = {}
+            self.bodies[body_id] = Body(body_id=body_id)
         return self.bodies[body_id]
 
-    def get_bodies_by_id(self, body_ids: list[int]) -> list[dict[str, Any]]:
-        result: list[dict[str, Any]] = []
+    def get_bodies_by_id(self, body_ids: list[int]) -> list[Body]:
+        result: list[Body] = []
         for id in body_ids:
             result.append(self.get_body_by_id(id))
         return result
 
     def add_body_signal(self, body_event: dict[str, Any]) -> None:
-        self.get_body_by_id(body_event["BodyID"]).update(body_event)
+        # Only the fields present in the event overwrite what is already known about the body
+        update = msgspec.convert(body_event, Body)
+        body = self.get_body_by_id(update.body_id)
+        for key, name in BODY_FIELD_NAMES.items():
+            if key in body_event:
+                setattr(body, name, getattr(update, name))
+        body.__dict__.clear()   # the derived values are worked out again from the updated fields
+        if "estimated_values" in self.__dict__:
+            self.__dict__["estimated_values"].mark_changed(update.body_id)
+        if "orbits" in self.__dict__:
+            self.__dict__["orbits"].add_body(body, BARYCENTRE if body_event.get("event") == "ScanBaryCentre" else "")
+        if "star_summary" in self.__dict__ and body.star_type:
+            self.__dict__["star_summary"].add_star(body)
+        for on_change in self.__dict__.get("watchers", {}).values():
+            on_change(update.body_id)
+        if KEEP_RAW_BODY_EVENTS:
+            raw = body.raw_payload()
+            raw.update(body_event)
+            body.raw = msgspec.Raw(msgspec.json.encode(raw))
 
     def record_attribute(self, attribute: BodyAttribute, bodyID: int) -> None:
-        self.bodies_by_attribute[attribute].add(bodyID)
+        mask = self.attribute_masks.get(bodyID, 0)
+        if not mask & attribute.mask:
+            self.attribute_masks[bodyID] = mask | attribute.mask
+            self.__dict__.pop("query_cache", None)
+            if "estimated_values" in self.__dict__:
+                self.__dict__["estimated_values"].mark_changed(bodyID)     # its rankings by query are out of date
 
 class StarSystem(msgspec.Struct):
     name: str = ""
@@ -97,12 +404,63 @@ class StarSystem(msgspec.Struct):
     num_non_bodies: int = 0
     bodies: Bodies = msgspec.field(default_factory=lambda: Bodies())
 
+    def short_name(self, body: Body) -> str:     # "A 3" of "Synth AB-C d1-1 A 3"
+        return body.body_name.removeprefix(self.name).strip()
+
 
 class CoreModuleState(ModuleState):
     enabled: bool = True # overloaded to set the state to True, usually can be omitted
     event_stream_enabled: bool = False
     current_system: StarSystem = msgspec.field(default_factory=StarSystem)
     previous_system: StarSystem = msgspec.field(default_factory=StarSystem)
+    journal_checkpoint: JournalCheckpoint = msgspec.field(default_factory=JournalCheckpoint)   # saved together with the systems, so a restart only replays what the saved state has not seen
+    log_generation: int = 0     # the state log only applies on top of the snapshot with the same generation
+
+def migrate_body_payloads(state: dict[str, Any]) -> dict[str, Any]:
+    # Schema 0 kept the merged journal payload of every body. Those decode into Body as they are, the payload is kept as the raw one if asked to.
+    if KEEP_RAW_BODY_EVENTS:
+        for system_name in ("current_system", "previous_system"):
+            for body in state.get(system_name, {}).get("bodies", {}).get("bodies", {}).values():
+                body["Raw"] = dict(body)
+    return state
+
+def migrate_attribute_masks(state: dict[str, Any]) -> dict[str, Any]:
+    # Schema 1 kept a set of body ids per attribute, schema 2 keeps an attribute mask per body
+    for system_name in ("current_system", "previous_system"):
+        bodies = state.get(system_name, {}).get("bodies", {})
+        masks: dict[str, int] = {}
+        for attribute_value, body_ids in bodies.pop("bodies_by_attribute", {}).items():
+            for body_id in body_ids:
+                masks[str(body_id)] = masks.get(str(body_id), 0) | 1 << int(attribute_value)
+        bodies["attribute_masks"] = masks
+    return state
+
+### State log records
+# Written to the core state log between snapshots, replayed on top of the snapshot when the module loads.
+class BodyDelta(msgspec.Struct, tag="body", array_like=True):
+    body_id: int
+    fields: dict[str, Any]      # the fields of the body event that Body keeps, merged into the body in the current system
+    attributes: list[str]       # BodyAttribute names the event added
+
+class SystemEntered(msgspec.Struct, tag="system", array_like=True):
+    name: str
+    coordinates: tuple[float, float, float]
+    address: int
+
+class StateCommit(msgspec.Struct, tag="commit", array_like=True):
+    # Marks everything logged before it as saved, records after the last commit are dropped when the log is replayed
+    enabled: bool
+    event_stream_enabled: bool
+    journal_checkpoint: JournalCheckpoint
+
+StateLogRecord = BodyDelta | SystemEntered | StateCommit
+
+
+def body_delta_fields(event: dict[str, Any]) -> dict[str, Any]:
+    # The rest of the event (Materials, Composition, ...) would make the log larger than the snapshot it stands in for
+    if KEEP_RAW_BODY_EVENTS:
+        return event
+    return {key: value for key, value in event.items() if key in BODY_FIELD_NAMES or key == "event"}
 
 
 class CoreModule(Module):
@@ -114,6 +472,16 @@ class CoreModule(Module):
     MODULE_VERSION: str = "0.3.2"
     EXTRA_ALIASES: set[str] = set(["main", "base", "edsst"])
     STATE_TYPE = CoreModuleState
+    SCHEMA_VERSION: int = 2
+    STATE_MIGRATIONS = {0: migrate_body_payloads, 1: migrate_attribute_masks}
+    TYPED_EVENTS: frozenset[str] = frozenset(["FSDJump", "CarrierJump", "Location"])
+    SUBSCRIPTIONS: frozenset[str] = frozenset(["LoadGame", "Scan", "ScanBaryCentre", "FSSBodySignals", "SAAScanComplete", "SAASignalsFound", "FSSAllBodiesFound", "Shutdown"])
+    SYSTEM_ARRIVAL_EVENTS: frozenset[str] = frozenset(["FSDJump", "CarrierJump", "Location"])
+    BODY_EVENTS: frozenset[str] = frozenset(["Scan", "ScanBaryCentre", "FSSBodySignals", "SAAScanComplete", "SAASignalsFound"])
+    QUEUED: bool = False    # other modules read the core state, so it is always updated before they see the event
+    STATE_LOG_FILE_NAME = "core_state_log"
+    COMPACT_AFTER = 1000        # log records before the next save writes a full snapshot instead
+    snapshot_size: int = 0      # bytes of the last snapshot, the next save also writes one once the log has grown larger than that
     commander_greeted = False
     frontier_id: str = ""
     commander_name: str = ""
@@ -122,13 +490,22 @@ class CoreModule(Module):
     is_odyssey: bool = False
     is_horizons: bool = False
     state: CoreModuleState = CoreModuleState() # pyright: ignore[reportIncompatibleVariableOverride]
+    journal_framer: LineFramer
+    dispatcher: EventDispatcher | None = None
+    history: SystemHistory
+    state_log: StateLog | None = None
+    snapshot_needed: bool = True    # the first save after loading always writes a snapshot, which also starts a fresh log
 
     # TODO: separate out different gas giant types
 
     def __init__(self) -> None:
         super().__init__(self.EXTRA_ALIASES)
+        self.journal_framer = LineFramer()
+        self.history = SystemHistory(self.module_dir / SYSTEM_HISTORY_FILE_NAME)
         if not self.state.enabled:
             self.enable()
+        if self.state.event_stream_enabled:
+            self.subscribe(WILDCARD_SUBSCRIPTION)
 
     def disable(self) -> None:
         super().disable()
@@ -146,6 +523,7 @@ class CoreModule(Module):
                             self.print("<yellow>Display of Event Stream already enabled!</yellow>")
                         else:
                             self.state.event_stream_enabled = True
+                            self.subscribe(WILDCARD_SUBSCRIPTION)
                             self.save_state()
                             self.print("Event Stream is now displayed.")
                     case "disable" | "off":
@@ -153,11 +531,50 @@ class CoreModule(Module):
                             self.print("<yellow>Display of Event Stream already disabled!</yellow>")
                         else:
                             self.state.event_stream_enabled = False
+                            self.unsubscribe(WILDCARD_SUBSCRIPTION)
                             self.save_state()
                             self.print("Event Stream is no longer displayed.")
                     case _: pass
+            case "ingest":
+                bytes_per_second, lines_per_second = self.journal_framer.rates()
+                self.print(f"Journal ingest: {bytes_per_second:.0f} B/s, {lines_per_second:.1f} lines/s over the last {self.journal_framer.RATE_WINDOW:.0f}s")
+                self.print(f"Live tail total: {self.journal_framer.total_bytes} bytes, {self.journal_framer.total_lines} lines")
+            case "queues":
+                if self.dispatcher is None:
+                    self.print("<warning>Event dispatcher not running!</warning>")
+                    return
+                policy = "drop" if self.dispatcher.drop_when_full else "block"
+                self.print(f"Module queues (full policy: {policy}):")
+                for module_queue in self.dispatcher.queues.values():
+                    self.print(f"{module_queue.module.MODULE_NAME:24}{module_queue.queue.qsize():>5}/{module_queue.queue.maxsize:<6}processed: {module_queue.processed:<8}dropped: {module_queue.dropped:<6}lag: {module_queue.last_lag * 1000:.0f}ms (max {module_queue.max_lag * 1000:.0f}ms)", prefix="  ")
+            case "history":
+                self.process_history_command(arguments[2:])
             case _: await super().process_user_input(arguments, tg)
 
+    def process_history_command(self, arguments: list[str]) -> None:
+        current = self.state.current_system
+        match arguments:
+            case []:
+                self.print(f"System history: {self.history.count_systems()} systems, {self.history.count_bodies()} bodies")
+            case ["near", radius]:
+                try: found = self.history.systems_within(current.coordinates, float(radius))
+                except ValueError:
+                    self.print("<warning>Radius must be a number of light years!</warning>")
+                    return
+                self.print(f"{len(found)} visited systems within {float(radius):.1f}Ly of {current.name}:")
+                for distance, system in found:
+                    self.print(f"{system.name:40}{distance:9.2f}Ly  visits: {system.visits}", prefix="  ")
+            case ["nearest"] | ["nearest", _]:
+                try: count = int(arguments[1]) if len(arguments) > 1 else 5
+                except ValueError:
+                    self.print("<warning>Count must be a whole number!</warning>")
+                    return
+                self.print(f"Nearest visited systems to {current.name}:")
+                for distance, system in self.history.nearest_systems(current.coordinates, count, exclude=current.address):
+                    self.print(f"{system.name:40}{distance:9.2f}Ly  visits: {system.visits}", prefix="  ")
+            case _:
+                self.print("<warning>Usage: history | history near [radius] | history nearest [count]</warning>")
+
     async def process_event(self, event: Any, tg: asyncio.TaskGroup) -> None:
         await super().process_event(event, tg)
         bodyID = -1
@@ -183,104 +600,131 @@ class CoreModule(Module):
                     print_formatted_text(HTML(f"<module_color>core</module_color>: Welcome, Commander {self.commander_name}!"), style=self.style)
                 self.commander_greeted = True
 
-            case "Scan":
-                is_star = True if "StarType" in event else False
-                is_cluster = True if "Cluster" in str(event["BodyName"]) else False
-                is_ring = True if "Ring" in event["BodyName"] else False
+            case "Scan" | "ScanBaryCentre" | "FSSBodySignals" | "SAAScanComplete" | "SAASignalsFound":
                 self.state.current_system.bodies.add_body_signal(event)
-                if event["WasDiscovered"] == False:
-                    self.state.current_system.bodies.record_attribute(BodyAttribute.first_discovery, bodyID)
-                    if is_cluster:
-                        self.state.current_system.bodies.record_attribute(BodyAttribute.first_discovery_cluster, bodyID)
-                    else:
-                        if is_star:
-                            self.state.current_system.bodies.record_attribute(BodyAttribute.first_discovery_star, bodyID)
-                        else:
-                            self.state.current_system.bodies.record_attribute(BodyAttribute.first_discovery_planet, bodyID)
-                if event["WasMapped"] == False:
-                    self.state.current_system.bodies.record_attribute(BodyAttribute.first_possible_map, bodyID)
-                    if not is_cluster and not is_star:
-                        self.state.current_system.bodies.record_attribute(BodyAttribute.first_possible_map_planet, bodyID)
-                if event["WasFootfalled"] == False:
-                    self.state.current_system.bodies.record_attribute(BodyAttribute.first_possible_footfall, bodyID)
-                    if not is_cluster and not is_star:
-                        self.state.current_system.bodies.record_attribute(BodyAttribute.first_possible_footfall_planet, bodyID)
-                if is_ring:
-                    self.state.current_system.bodies.record_attribute(BodyAttribute.ring, bodyID)
-                elif is_cluster:                              
-                    self.state.current_system.bodies.record_attribute(BodyAttribute.cluster, bodyID)
-                else:
-                    if "Rings" in event:                    
-                        self.state.current_system.bodies.record_attribute(BodyAttribute.ringed, bodyID)
-                    if is_star:                             
-                        self.state.current_system.bodies.record_attribute(BodyAttribute.star, bodyID)
-                    else:
-                        if "TerraformState" in event:
-                            if event["TerraformState"]:       
-                                self.state.current_system.bodies.record_attribute(BodyAttribute.terraformable, bodyID)
-                        if "Volcanism" in event:
-                            if event["Volcanism"]:              
-                                self.state.current_system.bodies.record_attribute(BodyAttribute.volcanic, bodyID)
-                        if "Landable" in event:
-                            if event["Landable"]:               
-                                self.state.current_system.bodies.record_attribute(BodyAttribute.landable, bodyID)
-                        if "AtmosphereType" in event:
-                            if event["AtmosphereType"] != "None":
-                                self.state.current_system.bodies.record_attribute(BodyAttribute.atmospheric, bodyID)
-                        match event["PlanetClass"]:
-                            case "Icy body":                        self.state.current_system.bodies.record_attribute(BodyAttribute.icy_body, bodyID)
-                            case "Rocky ice body":                  self.state.current_system.bodies.record_attribute(BodyAttribute.rocky_icy_body, bodyID)
-                            case "Rocky body":                      self.state.current_system.bodies.record_attribute(BodyAttribute.rocky_body, bodyID)
-                            case "Metal rich body":                 self.state.current_system.bodies.record_attribute(BodyAttribute.metal_rich_body, bodyID)
-                            case "High metal content body":         self.state.current_system.bodies.record_attribute(BodyAttribute.high_metal_content_body, bodyID)
-                            case "Earthlike body":                  self.state.current_system.bodies.record_attribute(BodyAttribute.earth_like_world_body, bodyID)
-                            case "Ammonia world":                   self.state.current_system.bodies.record_attribute(BodyAttribute.ammonia_world_body, bodyID)
-                            case "Water world":                     self.state.current_system.bodies.record_attribute(BodyAttribute.water_world_body, bodyID)
-                            case "Sudarsky class I gas giant":      self.state.current_system.bodies.record_attribute(BodyAttribute.gas_giant_type_I, bodyID)
-                            case "Sudarsky class II gas giant":     self.state.current_system.bodies.record_attribute(BodyAttribute.gas_giant_type_II, bodyID)
-                            case "Sudarsky class III gas giant":    self.state.current_system.bodies.record_attribute(BodyAttribute.gas_giant_type_III, bodyID)
-                            case "Sudarsky class IV gas giant":     self.state.current_system.bodies.record_attribute(BodyAttribute.gas_giant_type_IV, bodyID)
-                            case "Sudarsky class V gas giant":      self.state.current_system.bodies.record_attribute(BodyAttribute.gas_giant_type_V, bodyID)
-                            case "Water giant":                     self.state.current_system.bodies.record_attribute(BodyAttribute.gas_giant_water, bodyID)
-                            case "Gas giant with water based life": self.state.current_system.bodies.record_attribute(BodyAttribute.gas_giant_water_with_life, bodyID)
-                            case "Gas giant with ammonia based life":self.state.current_system.bodies.record_attribute(BodyAttribute.gas_giant_ammonia_with_life, bodyID)
-                            case "Helium rich gas giant":           self.state.current_system.bodies.record_attribute(BodyAttribute.gas_giant_helium_rich, bodyID)
-                            case "Helium gas giant":                self.state.current_system.bodies.record_attribute(BodyAttribute.gas_giant_helium, bodyID)
-                            case _:
-                                self.print(f"Encountered unknown planet type for planet {event["BodyName"]}")
-                        self.state.current_system.bodies.record_attribute(BodyAttribute.planet, bodyID)
-
-            case "FSSBodySignals":
-                self.state.current_system.bodies.add_body_signal(event)
-                for signal in event["Signals"]:
-                    match signal["Type"]:
-                        case "$SAA_SignalType_Biological;": self.state.current_system.bodies.record_attribute(BodyAttribute.bios, bodyID)
-                        case "$SAA_SignalType_Geological;": self.state.current_system.bodies.record_attribute(BodyAttribute.geos, bodyID)
-                        case "$SAA_SignalType_Guardian;":   self.state.current_system.bodies.record_attribute(BodyAttribute.guardians, bodyID)
-                        case "$SAA_SignalType_Thargoid;":   self.state.current_system.bodies.record_attribute(BodyAttribute.thargoids, bodyID)
-                        case _: pass
-
-            case "SAAScanComplete":
-                self.state.current_system.bodies.add_body_signal(event)
-                self.state.current_system.bodies.record_attribute(BodyAttribute.saa_scan, bodyID)
-
-            case "SAASignalsFound":
-                self.state.current_system.bodies.add_body_signal(event)
-                self.state.current_system.bodies.record_attribute(BodyAttribute.saa_signal, bodyID)
+                attributes = body_event_attributes(event)
+                for attribute in attributes:
+                    self.state.current_system.bodies.record_attribute(attribute, bodyID)
+                if BodyAttribute.planet in attributes and event["PlanetClass"] not in PLANET_CLASS_ATTRIBUTES:
+                    self.print(f"Encountered unknown planet type for planet {event["BodyName"]}")
+                if self.caught_up and self.state_log is not None:
+                    self.state_log.append(BodyDelta(bodyID, body_delta_fields(event), [attribute.name for attribute in attributes]))
+                    self.save_state()
 
             case "FSSAllBodiesFound":
                 self.save_state()
 
             case "FSDJump" | "CarrierJump" | "Location":
-                self.state.previous_system = self.state.current_system
-                self.state.current_system = StarSystem()
-                self.state.current_system.name = event["StarSystem"]
-                self.state.current_system.coordinates = (event["StarPos"][0], event["StarPos"][1], event["StarPos"][2])
-                self.state.current_system.address = event["SystemAddress"]
-                self.save_state()
+                self.enter_system(event["StarSystem"], (event["StarPos"][0], event["StarPos"][1], event["StarPos"][2]), event["SystemAddress"], event.get("timestamp", ""))
 
             case "Shutdown":
                 self.save_state()
 
+            case "CaughtUp":
+                self.history.commit()
+                self.save_state()   # snapshots everything the catch-up replay changed
+
+            case _: pass
+        if bodyID >= 0 and event["event"] in self.BODY_EVENTS:
+            self.record_body(bodyID)
+
+    async def process_typed_event(self, event: JournalEvent, tg: asyncio.TaskGroup) -> None:
+        if self.state.event_stream_enabled:
+            self.print(event.event)
+        match event:
+            case SystemArrival():
+                self.enter_system(event.star_system, event.star_pos, event.system_address, event.timestamp)
             case _: pass
 
+    async def process_event_batch(self, events: list[JournalEvent | dict[str, Any]], tg: asyncio.TaskGroup) -> None:
+        # Only the last two system arrivals of a slice end up as the current and previous system, so the body events
+        # before those only go to the system history, instead of being indexed in a system that is thrown away again.
+        arrivals = [index for index, event in enumerate(events) if (event.event if isinstance(event, JournalEvent) else event["event"]) in self.SYSTEM_ARRIVAL_EVENTS]
+        first_kept = arrivals[-2] if len(arrivals) >= 2 else 0
+        historic_bodies: list[tuple[int, int, str, str]] = []
+        for index, event in enumerate(events):
+            if isinstance(event, JournalEvent):
+                await self.process_typed_event(event, tg)
+            elif index < first_kept and event["event"] in self.BODY_EVENTS:
+                if "BodyID" in event:
+                    historic_bodies.append(self.historic_body(event))
+            else:
+                await self.process_event(event, tg)
+        self.history.merge_bodies(historic_bodies)
+
+    def historic_body(self, event: dict[str, Any]) -> tuple[int, int, str, str]:
+        # (address, body_id, body JSON, attributes JSON) of a body event, to be merged into what the history knows about the body
+        fields = {key: value for key, value in event.items() if key in BODY_FIELD_NAMES}
+        attributes = [attribute.name for attribute in body_event_attributes(event)]
+        address = int(event.get("SystemAddress", self.state.current_system.address))
+        return (address, int(event["BodyID"]), msgspec.json.encode(fields).decode(), msgspec.json.encode(attributes).decode())
+
+    def enter_system(self, name: str, coordinates: tuple[float, float, float], address: int, timestamp: str = "") -> None:
+        self.move_to_system(name, coordinates, address)
+        self.history.record_system(address, name, coordinates, timestamp)
+        if self.caught_up and self.state_log is not None:
+            self.state_log.append(SystemEntered(name, coordinates, address))
+        self.save_state()
+
+    def move_to_system(self, name: str, coordinates: tuple[float, float, float], address: int) -> None:
+        self.state.previous_system = self.state.current_system
+        self.state.current_system = StarSystem()
+        self.state.current_system.name = name
+        self.state.current_system.coordinates = coordinates
+        self.state.current_system.address = address
+
+    def record_body(self, body_id: int) -> None:
+        system = self.state.current_system
+        attributes = [attribute.name for attribute in system.bodies.attributes_of(body_id)]
+        self.history.record_body(system.address, body_id, system.bodies.bodies[body_id], attributes)
+
+    def load_system(self, address: int) -> StarSystem | None:
+        # A previously visited system as it was last seen, from the system history
+        visited = self.history.get_system(address)
+        if visited is None:
+            return None
+        system = StarSystem(name=visited.name, coordinates=visited.coordinates, address=visited.address)
+        for historic_body in self.history.get_bodies(address):
+            system.bodies.bodies[historic_body.body_id] = _body_decoder.decode(msgspec.json.encode(historic_body.body))
+            for attribute in historic_body.attributes:
+                system.bodies.record_attribute(BodyAttribute[attribute], historic_body.body_id)
+        return system
+
+    def load_state(self) -> None:
+        super().load_state()
+        self.state_log = StateLog(self.module_dir / self.STATE_LOG_FILE_NAME, StateLogRecord)
+        self.replay_state_log(self.state_log.read(self.state.log_generation))
+
+    def replay_state_log(self, records: list[StateLogRecord]) -> None:
+        # Only records up to the last commit were saved, anything after it is replayed from the journal again
+        last_commit = max((index for index, record in enumerate(records) if isinstance(record, StateCommit)), default=-1)
+        for record in records[:last_commit + 1]:
+            match record:
+                case BodyDelta():
+                    self.state.current_system.bodies.add_body_signal(record.fields)
+                    for attribute in record.attributes:
+                        self.state.current_system.bodies.record_attribute(BodyAttribute[attribute], record.body_id)
+                case SystemEntered():
+                    self.move_to_system(record.name, record.coordinates, record.address)
+                case StateCommit():
+                    self.state.enabled = record.enabled
+                    self.state.event_stream_enabled = record.event_stream_enabled
+                    self.state.journal_checkpoint = record.journal_checkpoint
+
+    def write_state(self) -> None:
+        # Usually only a commit record is appended to the state log. The full state is written as a snapshot when the log
+        # has grown long or larger than the snapshot, and the log then starts over on top of the new snapshot.
+        state_log = self.state_log
+        if state_log is None or self.snapshot_needed or state_log.records >= self.COMPACT_AFTER or state_log.size > self.snapshot_size:
+            self.state.log_generation += 1
+            super().write_state()
+            self.snapshot_size = self.state_file_path.stat().st_size
+            if state_log is not None:
+                state_log.reset(self.state.log_generation)
+                self.snapshot_needed = False
+        else:
+            state_log.append(StateCommit(self.state.enabled, self.state.event_stream_enabled, self.state.journal_checkpoint))
+            state_log.sync()
+        history: SystemHistory | None = getattr(self, "history", None)   # the base class may save before the history is opened
+        if history is not None:
+            history.commit()
@@ -102,6 +102,8 @@ class DensityNavRouteSurvey(module.Module):
     EXTRA_ALIASES: set[str] = set(["dnav", "navd", "densitynav", "navdensity", "navroutedensity"])
     MODULE_NAME: str = "DensityNavRouteSurvey"
     MODULE_VERSION: str = "0.0.2"
+    SUBSCRIPTIONS: frozenset[str] = frozenset(["NavRoute"])
+    CATCH_UP_EVENTS: frozenset[str] | None = frozenset()  # only acts on new events
     navroute_path: Path = Path(LOGS_DIRECTORY / "NavRoute.json")
     saved_navroutes_path: Path
     jump_range: float = 0
@@ -29,6 +29,7 @@ class DW3DensityColumnSurvey(Module):
     survey_data_dir: Path = Path("")
     survey_file_path: Path = Path("")
     STATE_TYPE = DW3DensityColumnSuveyState
+    SUBSCRIPTIONS: frozenset[str] = frozenset(["FSDJump"])
     core: CoreModule
     state: DW3DensityColumnSuveyState = DW3DensityColumnSuveyState()
 
@@ -51,7 +52,8 @@ class DW3DensityColumnSurvey(Module):
         if self.state.survey_ongoing:
             match event["event"]:
                 case "FSDJump":
-                    current_height = self.core.state.current_system.coordinates[1]
+                    # the jump's own coordinates, the core state may already be further ahead when events arrive in batches or through a queue
+                    current_height = event["StarPos"][1] if "StarPos" in event else self.core.state.current_system.coordinates[1]
                     if abs(current_height - self.get_expected_galactic_height()) < self.MAX_HEIGHT_DEVIATION:
                         self.state.valid_system = True
                         self.print("System valid for survey!")
@@ -34,11 +34,19 @@ class EDDN(module.Module):
     MODULE_NAME: str = "EDDN"
     MODULE_VERSION: str = "0.1.0"
     EXTRA_ALIASES: set[str] = set(["eddn", "eddnintegration", "eddnsender"])
+    SUBSCRIPTIONS: frozenset[str] = frozenset(["Docked", "FSDJump", "Scan", "Location", "SAASignalsFound", "CarrierJump", "FSSAllBodiesFound", "FSSBodySignals", "FSSDiscoveryScan", "NavRoute"])
+    CATCH_UP_EVENTS: frozenset[str] | None = frozenset()  # only acts on new events
     error_dump_path: Path
     STATE_TYPE = EDDNState     # If your module has its own state class, then this has to be set to it. 
     state: EDDNState = EDDNState()
     core: core.CoreModule
     schemas_directory: Path = Path("src/modules/eddn/schemas")
+    httpx_client: httpx.AsyncClient | None = None     # opened for the first message, closed when the module is disabled or EDSST shuts down
+    closing: asyncio.Task[None] | None = None
+    # The system EDDN's own events are in. The events wait in EDDN's queue, so the core state can already be in a later system
+    system_name: str | None = None
+    star_pos: tuple[float, float, float] | None = None
+    system_address: int | None = None
 
 
     def __init__(self, coreModule: core.CoreModule) -> None:
@@ -59,7 +67,14 @@ class EDDN(module.Module):
             return
         else:
             match event["event"]:
-                case "Docked" | "FSDJump" | "Scan" | "Location" | "SAASignalsFound" | "CarrierJump":
+                case "CaughtUp":    # delivered inline, so the core state is still where the journal replay left it
+                    current_system = self.core.state.current_system
+                    if current_system.name:
+                        self.set_system(current_system.name, current_system.coordinates, current_system.address)
+                case "FSDJump" | "Location" | "CarrierJump":
+                    self.set_system(event["StarSystem"], (event["StarPos"][0], event["StarPos"][1], event["StarPos"][2]), event["SystemAddress"])
+                    await self.post_journal_v1(event)
+                case "Docked" | "Scan" | "SAASignalsFound":
                     await self.post_journal_v1(event)
                 case "FSSAllBodiesFound":
                     await self.post_fssallbodiesfound(event)
@@ -73,6 +88,24 @@ class EDDN(module.Module):
                 #    await self.post_codexentry(event)
                 case _: pass
         
+    def disable(self) -> None:
+        super().disable()
+        client, self.httpx_client = self.httpx_client, None
+        if client is not None:     # only opened while posting, so there is a running loop
+            self.closing = asyncio.get_running_loop().create_task(client.aclose())
+
+    async def close(self) -> None:
+        client, self.httpx_client = self.httpx_client, None
+        if client is not None:
+            await client.aclose()
+        if self.closing is not None:
+            await self.closing
+
+    def client(self) -> httpx.AsyncClient:
+        if self.httpx_client is None:
+            self.httpx_client = httpx.AsyncClient(timeout=15.0)
+        return self.httpx_client
+
     async def process_user_input(self, arguments: list[str], tg: asyncio.TaskGroup) -> None:
         await super().process_user_input(arguments, tg)
         if self.state.hardlock:
@@ -96,17 +129,18 @@ class EDDN(module.Module):
             "odyssey":          self.core.is_odyssey,
         }
         data.update(route)
-        self.validate_and_post(data, eddn_navroute_schema)
+        await self.validate_and_post(data, eddn_navroute_schema)
 
     async def post_scanbarycentre(self, event: dict[str, Any]) -> None:
+        system = self.system_fields(event)
+        if system is None:
+            return
         data: dict[str, Any] = {
             "timestamp":        event["timestamp"],
             "event":            event["event"],
             "horizons":         self.core.is_horizons,
             "odyssey":          self.core.is_odyssey,
-            "StarSystem":       self.core.state.current_system.name if self.core.state.current_system.name == event["StarSystem"] else None,
-            "StarPos":          [self.core.state.current_system.coordinates[0], self.core.state.current_system.coordinates[1], self.core.state.current_system.coordinates[2]],
-            "SystemAddress":    self.core.state.current_system.address if self.core.state.current_system.address == event["SystemAddress"] else None,
+            **system,
             "BodyID":           event["Progress"],
             "SemiMajorAxis":    event["BodyCount"],
             "Eccentricity":     event["NonBodyCount"],
@@ -116,61 +150,65 @@ class EDDN(module.Module):
             "AscendingNode":    event["AscendingNode"],
             "MeanAnomaly":      event["MeanAnomaly"],
         }
-        self.validate_and_post(data, eddn_fssdiscoveryscan_schema)
+        await self.validate_and_post(data, eddn_fssdiscoveryscan_schema)
 
     async def post_fssdiscoveryscan(self, event: dict[str, Any]) -> None:
+        system = self.system_fields(event, "SystemName")
+        if system is None:
+            return
         data: dict[str, Any] = {
             "timestamp":        event["timestamp"],
             "event":            event["event"],
             "horizons":         self.core.is_horizons,
             "odyssey":          self.core.is_odyssey,
-            "SystemName":       self.core.state.current_system.name if self.core.state.current_system.name == event["SystemName"] else None,
-            "StarPos":          [self.core.state.current_system.coordinates[0], self.core.state.current_system.coordinates[1], self.core.state.current_system.coordinates[2]],
-            "SystemAddress":    self.core.state.current_system.address if self.core.state.current_system.address == event["SystemAddress"] else None,
+            **system,
             "BodyCount":        event["BodyCount"],
             "NonBodyCount":     event["NonBodyCount"],
         }
-        self.validate_and_post(data, eddn_fssdiscoveryscan_schema)
+        await self.validate_and_post(data, eddn_fssdiscoveryscan_schema)
 
     async def post_fssbodysignals(self, event: dict[str, Any]) -> None:
+        system = self.system_fields(event)
+        if system is None:
+            return
         data: dict[str, Any] = {
             "timestamp":        event["timestamp"],
             "event":            event["event"],
             "horizons":         self.core.is_horizons,
             "odyssey":          self.core.is_odyssey,
-            "StarSystem":       self.core.state.current_system.name if event["BodyName"].startswith(self.core.state.current_system.name) else None,
-            "StarPos":          [self.core.state.current_system.coordinates[0], self.core.state.current_system.coordinates[1], self.core.state.current_system.coordinates[2]],
-            "SystemAddress":    self.core.state.current_system.address if self.core.state.current_system.address == event["SystemAddress"] else None,
+            **system,
             "BodyID":           event["BodyID"],
             "BodyName":         event["BodyName"],
             "Signals":          event["Signals"],
         }
         self.remove_localised(data)
-        self.validate_and_post(data, eddn_fssbodysignals_schema)
+        await self.validate_and_post(data, eddn_fssbodysignals_schema)
 
     async def post_fssallbodiesfound(self, event: dict[str, Any]) -> None:
+        system = self.system_fields(event, "SystemName")
+        if system is None:
+            return
         data: dict[str, Any] = {
             "timestamp":        event["timestamp"],
             "event":            event["event"],
             "horizons":         self.core.is_horizons,
             "odyssey":          self.core.is_odyssey,
-            "SystemName":       self.core.state.current_system.name if self.core.state.current_system.name == event["SystemName"] else None,
-            "StarPos":          [self.core.state.current_system.coordinates[0], self.core.state.current_system.coordinates[1], self.core.state.current_system.coordinates[2]],
-            "SystemAddress":    self.core.state.current_system.address if self.core.state.current_system.address == event["SystemAddress"] else None,
+            **system,
             "Count":            event["Count"],
         }
-        self.validate_and_post(data, eddn_fssallbodiesfound_schema)
+        await self.validate_and_post(data, eddn_fssallbodiesfound_schema)
 
     async def post_journal_v1(self, event: dict[str, Any]) -> None:
         event = deepcopy(event)
+        system = self.system_fields(event)
+        if system is None:
+            return
         data: dict[str, Any] = {
             "timestamp":        event["timestamp"],
             "event":            event["event"],
             "horizons":         self.core.is_horizons,
             "odyssey":          self.core.is_odyssey,
-            "StarSystem":       self.core.state.current_system.name if "StarSystem" not in event else self.core.state.current_system.name if self.core.state.current_system.name == event["StarSystem"] else None,
-            "StarPos":          [self.core.state.current_system.coordinates[0], self.core.state.current_system.coordinates[1], self.core.state.current_system.coordinates[2]],
-            "SystemAddress":    self.core.state.current_system.address if self.core.state.current_system.address == event["SystemAddress"] else None,
+            **system,
         }
         event.update(data)
         data = event
@@ -178,18 +216,19 @@ class EDDN(module.Module):
         self.try_remove_keys(data, ["ActiveFine", "CockpitBreach", "BoostUsed", "FuelLevel", "FuelUsed", "JumpDist", "Latitude", "Longitude", "Wanted", "IsNewEntry", "NewTraitsDiscovered", "Traits", "VoucherAmount"])
         if "Factions" in data:
             self.try_remove_keys(data["Factions"], ["HappiestSystem", "HomeSystem", "MyReputation", "SquadronFaction"])
-        self.validate_and_post(data, eddn_journal_schema)
+        await self.validate_and_post(data, eddn_journal_schema)
 
     async def post_codexentry(self, event: dict[str, Any]) -> None:
         event = deepcopy(event)
+        system = self.system_fields(event)
+        if system is None:
+            return
         data: dict[str, Any] = {
             "timestamp":        event["timestamp"],
             "event":            event["event"],
             "horizons":         self.core.is_horizons,
             "odyssey":          self.core.is_odyssey,
-            "StarSystem":       self.core.state.current_system.name if "StarSystem" not in event else self.core.state.current_system.name if self.core.state.current_system.name == event["StarSystem"] else None,
-            "StarPos":          [self.core.state.current_system.coordinates[0], self.core.state.current_system.coordinates[1], self.core.state.current_system.coordinates[2]],
-            "SystemAddress":    self.core.state.current_system.address if self.core.state.current_system.address == event["SystemAddress"] else None,
+            **system,
         }
         if "Name" in event:                 data["Name"] = str(event["Name"])
         if "Region" in event:               data["Region"] = str(event["Region"])
@@ -204,10 +243,22 @@ class EDDN(module.Module):
         if "Traits" in event:               data["Traits"] = event["Traits"]
         if "BodyID" in event:               data["BodyID"] = int(event["BodyID"])
         if "BodyName" in event:             data["BodyName"] = str(event["BodyName"])
-        self.validate_and_post(data, eddn_journal_schema)
+        await self.validate_and_post(data, eddn_journal_schema)
         
 
-    def validate_and_post(self, message_data: dict[str, Any], schema: Any) -> None:
+    def set_system(self, name: str, star_pos: tuple[float, float, float], address: int) -> None:
+        self.system_name = name
+        self.star_pos = star_pos
+        self.system_address = address
+
+    def system_fields(self, event: dict[str, Any], name_key: str = "StarSystem") -> dict[str, Any] | None:
+        # The system fields of a message, None when the event is not from the system EDDN last saw an arrival in,
+        # as the message would then fail the schema or carry the coordinates of another system
+        if self.star_pos is None or event.get("SystemAddress", self.system_address) != self.system_address or event.get(name_key, self.system_name) != self.system_name:
+            return None
+        return {name_key: self.system_name, "StarPos": list(self.star_pos), "SystemAddress": self.system_address}
+
+    async def validate_and_post(self, message_data: dict[str, Any], schema: Any) -> None:
         schema_ref = schema["id"].rstrip("#")
         data: dict[str, Any] = {
             "$schemaRef": schema_ref if TESTING_MODE == TestingMode.Release else f"{schema_ref}/test",
@@ -227,7 +278,8 @@ class EDDN(module.Module):
             self.print(f"{data}\n\nthrew with error:\n{ex}", prefix="")
             self.print("<error>Please contact module maintainer.</error>")
             self.disable()
-        r = httpx.post("https://eddn.edcd.io:4430/upload/", json=data, timeout=15.0)
+            return
+        r = await self.client().post("https://eddn.edcd.io:4430/upload/", json=data)
         if TESTING_MODE == TestingMode.Testing:
             print(r.text)
         r.raise_for_status()
@@ -26,16 +26,22 @@ class EDSM(module.Module):
     MODULE_NAME: str = "EDSM"
     MODULE_VERSION: str = "0.2.0"
     EXTRA_ALIASES: set[str] = set(["edsm", "edsmintegration", "edsmget"])
+    SUBSCRIPTIONS: frozenset[str] = frozenset()  # subscribes to every event once caught up, nothing is posted during catch-up
+    CATCH_UP_EVENTS: frozenset[str] | None = frozenset()  # only acts on new events
     ignore_list: list[str] = []
     responses: list[int] = []
     core: CoreModule
-    httpx_client: httpx.AsyncClient
+    httpx_client: httpx.AsyncClient | None = None     # opened for the first post, closed when the module is disabled or EDSST shuts down
+    closing: asyncio.Task[None] | None = None
+    # The system EDSM's own events are in. The events wait in EDSM's queue, so the core state can already be in a later system
+    system_name: str | None = None
+    star_pos: tuple[float, float, float] | None = None
+    system_address: int | None = None
     
 
     def __init__(self, core: CoreModule):
         super().__init__(self.EXTRA_ALIASES)
         self.core = core
-        self.httpx_client = httpx.AsyncClient(timeout=5.0)
         if api_key is None or edsm_commander_name is None:
             self.print("<warning>EDSM API key or commander name not found in config.toml!</warning>")
         if not self.state.enabled:
@@ -60,7 +66,36 @@ class EDSM(module.Module):
             self.disable()
 
 
-    async def post(self, event: dict[str, Any]) -> None:
+    def disable(self) -> None:
+        super().disable()
+        client, self.httpx_client = self.httpx_client, None
+        if client is not None:     # only opened while posting, so there is a running loop
+            self.closing = asyncio.get_running_loop().create_task(client.aclose())
+
+    async def close(self) -> None:
+        client, self.httpx_client = self.httpx_client, None
+        if client is not None:
+            await client.aclose()
+        if self.closing is not None:
+            await self.closing
+
+    def client(self) -> httpx.AsyncClient:
+        if self.httpx_client is None:
+            self.httpx_client = httpx.AsyncClient(timeout=5.0)
+        return self.httpx_client
+
+    def set_system(self, name: str, star_pos: tuple[float, float, float], address: int) -> None:
+        self.system_name = name
+        self.star_pos = star_pos
+        self.system_address = address
+
+    def system_fields(self, event: dict[str, Any]) -> dict[str, Any]:
+        # EDSM's transient state fields of the event, left empty when the event is not from the system EDSM last saw an arrival in
+        if self.star_pos is None or event.get("SystemAddress", self.system_address) != self.system_address:
+            return {"_systemAddress": None, "_systemName": None, "_systemCoordinates": None}
+        return {"_systemAddress": self.system_address, "_systemName": self.system_name, "_systemCoordinates": list(self.star_pos)}
+
+    async def post(self, event: dict[str, Any], system: dict[str, Any]) -> None:
         if api_key is None or edsm_commander_name is None or api_key == "" or edsm_commander_name == "":
             return
         if not self.state.enabled:
@@ -74,7 +109,6 @@ class EDSM(module.Module):
             if TESTING_MODE == TestingMode.Testing:
                 self.print(f"<warning>Not sending event: {event['event']} to EDSM because it's in the ignore list.</warning>")
             return
-        coordinates = self.core.state.current_system.coordinates
         data: dict[str, Any] = {
             "commanderName": edsm_commander_name,
             "apiKey": api_key,
@@ -83,9 +117,7 @@ class EDSM(module.Module):
             "fromGameVersion": self.core.game_version,
             "fromGameBuild": self.core.game_build,
             "message": json.dumps(event),
-            "_systemAddress": self.core.state.current_system.address,
-            "_systemName": self.core.state.current_system.name,
-            "_systemCoordinates": [coordinates[0], coordinates[1], coordinates[2]],
+            **system,
             "_marketId": None,
             "_stationName": None,
             "_shipId": None
@@ -93,7 +125,7 @@ class EDSM(module.Module):
         try:
             if TESTING_MODE == TestingMode.Testing:
                 self.print(f"Posting event: {event['event']} to EDSM...")
-            r = await self.httpx_client.post(url = f"https://www.edsm.net/api-journal-v1", data=data)
+            r = await self.client().post(url = f"https://www.edsm.net/api-journal-v1", data=data)
         except httpx.TimeoutException:
             self.print(f"<error>Could not POST to EDSM, request timed out.</error>")
             return
@@ -154,11 +186,17 @@ class EDSM(module.Module):
     async def process_event(self, event: Any, tg: asyncio.TaskGroup) -> None: 
         await super().process_event(event, tg)
         match event["event"]:
+            case "CaughtUp":    # delivered inline, so the core state is still where the journal replay left it
+                self.subscribe(module.WILDCARD_SUBSCRIPTION)
+                current_system = self.core.state.current_system
+                if current_system.name:
+                    self.set_system(current_system.name, current_system.coordinates, current_system.address)
             case _: 
                 if self.caught_up:
-                    if event["event"] != "CaughtUp": 
-                        if self.state.enabled:
-                            tg.create_task(self.post(event))
+                    if event["event"] in ("FSDJump", "Location", "CarrierJump"):
+                        self.set_system(event["StarSystem"], (event["StarPos"][0], event["StarPos"][1], event["StarPos"][2]), event["SystemAddress"])
+                    if self.state.enabled:
+                        tg.create_task(self.post(event, self.system_fields(event)))
                 
 
     async def process_user_input(self, arguments: list[str], tg: asyncio.TaskGroup) -> None:
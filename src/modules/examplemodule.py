@@ -16,10 +16,18 @@ class ExampleModule(module.Module):
     #module_dir: Path           Path to the module data directory. This should not be changed unless you know what you are doing...
     #state_file_path: Path      Path to the module state file in the module data directory. This should not be changed unless you know what you are doing...
     #caught_up: bool            flag to know whether the program has processed all the previous lines in the latest journal
+    #TYPED_EVENTS: frozenset[str]  Event types (for example "Scan") that are passed to process_typed_event as src.events structs instead of to process_event as dicts
+    #SUBSCRIPTIONS: frozenset[str] Event types passed to process_event. Defaults to every event ("*"), EDSST events such as "CaughtUp" are always passed.
+    #                              Listing only the events the module handles saves decoding lines nobody reads. Change at runtime with self.subscribe / self.unsubscribe
+    #CATCH_UP_EVENTS: frozenset[str] | None  Subscribed event types still needed while catching up on the journal, None (default) for all of them.
+    #                                        Catch-up events arrive in slices through process_event_batch, which by default calls process_event for each one.
     # ------------ Situationally required variables ------------
     EXTRA_ALIASES: set[str] = set(["moduleAlias", "moduleextraalias", "ThirdAlias"])  # Aliases are case insensitive.
     STATE_TYPE = ExampleModuleState     # If your module has its own state class, then this has to be set to it. 
     state: ExampleModuleState = ExampleModuleState()    # If your module has its own state class, then it has to be initialized here. # pyright: ignore[reportIncompatibleVariableOverride]
+    #SCHEMA_VERSION: int = 1    Bump whenever the state class changes so that state files saved before no longer fit it, and register a migration for the previous version.
+    #STATE_MIGRATIONS = {0: lambda state: {**state, "example_state_entry": state.pop("old_entry_name", "")}}
+    #                           Schema version -> function turning a state dict saved with that version into the next version. Old state files are migrated and saved once on startup.
     # ------------ Required variables ------------
     MODULE_NAME: str = "ExampleModule"
     MODULE_VERSION: str = "?"
@@ -0,0 +1,162 @@
+from src.bios import get_taxonomy
+from src.modules.module import Module
+from src.status import STATUS_FILE_NAME, StatusReader
+from src.util import LOGS_DIRECTORY
+from prompt_toolkit.styles import Style
+import asyncio
+import math
+from typing import Any
+
+SAMPLES_NEEDED = 3
+
+
+def great_circle_distance(a: tuple[float, float], b: tuple[float, float], radius: float) -> float:
+    # Between two (latitude, longitude) in degrees on a sphere of the radius, in the unit of the radius
+    latitude_a, latitude_b = math.radians(a[0]), math.radians(b[0])
+    half_latitude = (latitude_b - latitude_a) / 2
+    half_longitude = math.radians(b[1] - a[1]) / 2
+    haversine = math.sin(half_latitude) ** 2 + math.cos(latitude_a) * math.cos(latitude_b) * math.sin(half_longitude) ** 2
+    return 2 * radius * math.asin(min(1.0, math.sqrt(haversine)))
+
+
+class Sampling:
+    # The samples of one species taken so far on one planet
+    species: str                        # the journal's Species, "$Codex_Ent_Bacterial_12_Name;"
+    species_name: str
+    colony_range: int | None            # m, None when the genus is not in the taxonomy
+    system_address: int
+    body_id: int
+    body_name: str                      # of Status.json when the first sample was taken, "" when it was not known
+    radius: float | None                # m, of Status.json likewise
+    count: int                          # samples taken
+    positions: list[tuple[float, float]]    # (latitude, longitude) of the samples taken where Status.json had a position
+    outside: bool                       # whether the commander was last seen outside the colony range of every sample
+
+    def __init__(self, species: str, species_name: str, colony_range: int | None, system_address: int, body_id: int) -> None:
+        self.species = species
+        self.species_name = species_name
+        self.colony_range = colony_range
+        self.system_address = system_address
+        self.body_id = body_id
+        self.body_name = ""
+        self.radius = None
+        self.count = 0
+        self.positions = []
+        self.outside = False
+
+
+class Exobiology(Module):
+    style = Style.from_dict({
+        "module_color": "#00ff80",
+    })
+
+    MODULE_NAME = "Exobiology"
+    MODULE_VERSION: str = "0.1.0"
+    EXTRA_ALIASES: set[str] = set(["exo", "exobio", "samples"])
+    SUBSCRIPTIONS: frozenset[str] = frozenset(["ScanOrganic", "FSDJump", "CarrierJump"])
+    CATCH_UP_EVENTS: frozenset[str] | None = frozenset()    # the positions come from the live Status.json, so only new samples are followed
+    status_reader: StatusReader
+    sampling: Sampling | None = None
+    tracking: asyncio.Task[None] | None = None
+
+    def __init__(self) -> None:
+        super().__init__(self.EXTRA_ALIASES)
+        self.status_reader = StatusReader(LOGS_DIRECTORY / STATUS_FILE_NAME)
+
+    async def process_event(self, event: Any, tg: asyncio.TaskGroup) -> None:
+        await super().process_event(event, tg)
+        match event["event"]:
+            case "ScanOrganic":
+                self.record_sample(event)
+                if self.sampling is not None and (self.tracking is None or self.tracking.done()):
+                    self.tracking = tg.create_task(self.track())
+            case "FSDJump" | "CarrierJump":
+                self.sampling = None
+            case _: pass
+
+    async def process_user_input(self, arguments: list[str], tg: asyncio.TaskGroup) -> None:
+        await super().process_user_input(arguments, tg)
+        match arguments[1]:
+            case "status":
+                sampling = self.sampling
+                if sampling is None:
+                    self.print("Not sampling any species")
+                else:
+                    distance = self.distance_to_samples(sampling)
+                    self.print(f"Sampling {sampling.species_name}: {sampling.count} / {SAMPLES_NEEDED} samples, colony range {self.format_range(sampling)}"
+                               f"{f", {distance:.0f} m from the closest sample" if distance is not None else ""}")
+                self.print(f"Status.json checked {self.status_reader.checks} times and read {self.status_reader.decodes} times")
+            case _: pass
+
+    def record_sample(self, event: dict[str, Any]) -> None:
+        # ScanOrganic is logged with ScanType Log for the first sample of a species, Sample for the other two, then Analyse
+        species = str(event.get("Species", ""))
+        species_name = str(event.get("Species_Localised", species))
+        scan_type = event.get("ScanType", "")
+        body_id = int(event.get("Body", -1))
+        if scan_type == "Analyse":
+            self.sampling = None
+            self.print(f"<green>{species_name} analysed</green>")
+            return
+        sampling = self.sampling
+        if scan_type == "Log" or sampling is None or sampling.species != species or sampling.body_id != body_id:
+            genus = get_taxonomy().genus_of_sample(str(event.get("Genus", "")), str(event.get("Genus_Localised", "")))
+            sampling = self.sampling = Sampling(species, species_name, genus.colony_range if genus is not None else None, int(event.get("SystemAddress", 0)), body_id)
+            if scan_type != "Log":
+                sampling.count = 1      # started before EDSST was following, where is not known
+        sampling.count += 1
+        self.print(f"Sample {sampling.count} / {SAMPLES_NEEDED} of {sampling.species_name}, colony range {self.format_range(sampling)}")
+        if sampling.count >= SAMPLES_NEEDED:
+            self.sampling = None
+            return
+        sampling.outside = False
+        status = self.status_reader.read(force=True)
+        position = status.position if status is not None else None
+        if status is None or position is None:
+            self.print("<warning>Status.json has no position, the distance to this sample can not be followed</warning>")
+            return
+        if not sampling.positions:
+            sampling.body_name = status.body_name
+            sampling.radius = status.planet_radius
+        if status.body_name == sampling.body_name:
+            sampling.positions.append(position)
+
+    async def track(self) -> None:
+        # Follows the commander's position from Status.json while the species is being sampled on its body. Stops when the
+        # species is done with or the commander has left the body, the next sample of the species follows again.
+        sampling = self.sampling
+        while sampling is not None and self.sampling is sampling and sampling.positions:
+            status = self.status_reader.read()
+            if status is None or status.body_name != sampling.body_name:
+                self.print(f"No longer following the samples of {sampling.species_name}, left {sampling.body_name}")
+                return
+            self.check_position(sampling)
+            await asyncio.sleep(self.status_reader.read_interval)
+
+    def check_position(self, sampling: Sampling) -> None:
+        # Reports when the commander leaves or comes back into the colony range of the samples taken
+        if sampling.colony_range is None:
+            return
+        distance = self.distance_to_samples(sampling)
+        if distance is None:
+            return
+        outside = distance >= sampling.colony_range
+        if outside != sampling.outside:
+            sampling.outside = outside
+            if outside:
+                self.print(f"<green>Far enough for the next sample of {sampling.species_name}</green> ({distance:.0f} m from the closest sample)")
+            else:
+                self.print(f"<yellow>Back within the colony range of a {sampling.species_name} sample</yellow> ({distance:.0f} m of {sampling.colony_range} m)")
+
+    def distance_to_samples(self, sampling: Sampling) -> float | None:
+        # In m from the closest sample, None when it is not known where the commander or the samples are
+        status = self.status_reader.read()
+        if status is None or status.position is None or not sampling.positions or status.body_name != sampling.body_name:
+            return None     # on or above another body, or nowhere near one
+        radius = sampling.radius or status.planet_radius
+        if not radius:
+            return None
+        return min(great_circle_distance(sample, status.position, radius) for sample in sampling.positions)
+
+    def format_range(self, sampling: Sampling) -> str:
+        return f"{sampling.colony_range} m" if sampling.colony_range is not None else "unknown"
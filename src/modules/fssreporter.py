@@ -1,10 +1,88 @@
-from src.modules.core import BodyAttribute, CoreModule
+from src.modules.core import Bodies, Body, BodyAttribute, BodyQuery, CoreModule, StarSystem
 from src.modules.module import Module, ModuleState
-from src.util import abbreviate_planet_type
+from src.values import format_credits
 from prompt_toolkit.styles import Style
 import asyncio
 from typing import Any
-from src.bios import taxon, species
+from src.bios import BioWorth, get_taxonomy, prediction_cache, reload_taxonomy
+import msgspec
+
+VALUABLE_PLANETS = BodyAttribute.terraformable | BodyAttribute.earth_like_world_body | BodyAttribute.water_world_body | BodyAttribute.ammonia_world_body
+FIRST_DISCOVERIES = BodyAttribute.first_discovery_star | BodyAttribute.first_discovery_planet
+MEMBERSHIPS: dict[str, BodyQuery] = {     # the bodies the report counts or lists
+    "stars": BodyQuery.of(BodyAttribute.star),
+    "planets": BodyQuery.of(BodyAttribute.planet),
+    "first_discoveries": BodyQuery.of(FIRST_DISCOVERIES),
+    "valuable": BodyQuery.of(VALUABLE_PLANETS),
+    "biological": BodyQuery.of(BodyAttribute.bios),
+    "geological": BodyQuery.of(BodyAttribute.geos),
+}
+SECTION_TITLES: dict[str, str] = {"valuable": "valuable planets", "biological": "biological signatures", "geological": "geological signatures"}
+
+ReportLine = tuple[str, str]    # (text, prefix) of a FSSReporter.print
+
+def signal_count(body: Body, signal_type: str) -> int:
+    return next((signal.count for signal in reversed(body.signals) if signal.type == signal_type), 0)
+
+class FSSReport:
+    # The scan report of the current system, kept between reports. Body events only note which bodies changed, the next
+    # report updates the bodies counted and listed from those and works out again only the sections they are in. The lines
+    # of each section as last shown are kept, so a partial report can leave out the sections that have not changed since.
+    # The species of a bio planet also depend on other bodies: its stars and whether the system has the needed planets of
+    # a species. Which needed planets the system has is kept, so other planets only make the biological section stale when
+    # that changes. Which planets a star is a parent star of is not followed, so any star scan still makes it stale.
+    address: int
+    changed: set[int]
+    rebuild: bool                       # every body is looked at again, for a new system or after events were missed
+    members: dict[str, set[int]]        # MEMBERSHIPS name -> body ids
+    needed_planets: tuple[bool, ...]    # whether the system has each BatchPredictor.needed_planets
+    stale: set[str]                     # sections to work out again
+    sections: dict[str, list[ReportLine]]
+    shown: dict[str, list[ReportLine]]  # the sections as last shown
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self, address: int = 0) -> None:
+        self.address = address
+        self.changed = set()
+        self.rebuild = True
+        self.members = {name: set() for name in MEMBERSHIPS}
+        self.needed_planets = ()
+        self.stale = set(SECTION_TITLES)
+        self.sections = {}
+        self.shown = {}
+
+    def mark_changed(self, body_id: int) -> None:
+        self.changed.add(body_id)
+
+    def update(self, address: int, bodies: Bodies, needed_planets: list[BodyQuery]) -> None:
+        if address != self.address or self.rebuild:
+            self.reset(address)
+            self.rebuild = False
+            self.changed = set(bodies.attribute_masks)
+        planets_changed = False
+        for body_id in self.changed:
+            mask = bodies.attribute_masks.get(body_id, 0)
+            for name, query in MEMBERSHIPS.items():
+                members = self.members[name]
+                if body_id in members or query.matches(mask):
+                    if name in SECTION_TITLES:
+                        self.stale.add(name)
+                    if query.matches(mask):
+                        members.add(body_id)
+                    else:
+                        members.discard(body_id)
+            if mask & BodyAttribute.star.mask:
+                self.stale.add("biological")
+            planets_changed = planets_changed or bool(mask & BodyAttribute.planet.mask)
+        if planets_changed:
+            needed = tuple(bool(bodies.query(query)) for query in needed_planets)
+            if needed != self.needed_planets:
+                self.needed_planets = needed
+                self.stale.add("biological")
+        self.changed.clear()
+
 
 class FSSReporterState(ModuleState):
     display_verbose: bool = False
@@ -23,139 +101,156 @@ class FSSReporter(Module):
     MODULE_VERSION: str = "0.1.0"
     EXTRA_ALIASES: set[str] = set(["fss", "scanreport"])
     STATE_TYPE = FSSReporterState
+    SUBSCRIPTIONS: frozenset[str] = frozenset(["FSSAllBodiesFound", "FSDJump", "Scan", "FSSBodySignals", "SAASignalsFound"])
+    CATCH_UP_EVENTS: frozenset[str] | None = frozenset(["FSSAllBodiesFound", "FSDJump"])  # the report is worked out anew once caught up
     core: CoreModule
     report_scheduled = False
+    report: FSSReport
     state: FSSReporterState = FSSReporterState()
 
     def __init__(self, core: CoreModule) -> None:
         super().__init__(self.EXTRA_ALIASES)
         self.core = core
+        self.report = FSSReport()
 
-    async def process_report(self, delay: float):
-        await asyncio.sleep(delay)
-        system_name = self.core.state.current_system.name
-        num_stars = str(len(self.core.state.current_system.bodies.get_bodies_by_attribute(BodyAttribute.star)))
-        num_planets = str(len(self.core.state.current_system.bodies.get_bodies_by_attribute(BodyAttribute.planet)))
-        first_discoveries = str(len(self.core.state.current_system.bodies.get_bodies_by_attribute(BodyAttribute.first_discovery_star, BodyAttribute.first_discovery_planet)))
+    def enable(self) -> None:
+        super().enable()
+        self.report.rebuild = True      # body events were not delivered while disabled
+
+    def render_report(self, full: bool) -> None:
+        # A full report shows every section, a partial one only those that changed since the last report of the system
+        system = self.core.state.current_system
+        bodies = system.bodies
+        report = self.report
+        report.update(system.address, bodies, get_taxonomy().predictor.needed_planets)
+        values = bodies.estimated_values
+        total_value = values.total()
+        for name in report.stale:
+            report.sections[name] = self.valuable_lines(system) if name == "valuable" else self.biological_lines(system) if name == "biological" else self.geological_lines(system)
+        report.stale.clear()
         self.print( "╔═══════════════════════════════════════════════════════════════════════════════════</module_color>", prefix="\n<module_color>  ")
-        self.print(f"║\t</module_color>{"<green_bold>Full</green_bold>" if self.report_scheduled else "<yellow_bold>Partial</yellow_bold>"} <module_bold>system scan of {self.core.state.current_system.name} {"complete!" if self.report_scheduled else ""}</module_bold>", prefix="<module_color>  ")
+        self.print(f"║\t</module_color>{"<green_bold>Full</green_bold>" if self.report_scheduled else "<yellow_bold>Partial</yellow_bold>"} <module_bold>system scan of {system.name} {"complete!" if self.report_scheduled else ""}</module_bold>", prefix="<module_color>  ")
         self.print( "╠═══════════════════════════════════════════════════════════════════════════════════</module_color>", prefix="<module_color>  ")
-        self.print(f"║  Stars: {num_stars:5}Planets: {num_planets:5}First discoveries: {first_discoveries}</module_color>", prefix="<module_color>  ")
-        bodies = self.core.state.current_system.bodies
-        valuables = bodies.get_bodies_by_attribute(BodyAttribute.terraformable, BodyAttribute.earth_like_world_body, BodyAttribute.water_world_body, BodyAttribute.ammonia_world_body, sorted = True)
-        if len(valuables) > 0:
-            self.print("<module_color>  ╠══</module_color>", prefix="")
-            self.print(f"  Valuable planets: {len(valuables)}</valuable>", prefix="<valuable>  ║")
-            for planet in valuables:
-                self.print(f"{planet["BodyName"].removeprefix(system_name):13}({abbreviate_planet_type(planet["PlanetClass"])}{" + Terraformable" if planet["TerraformState"] == "Terraformable" else ""})</valuable>", prefix="<valuable>  ║\t")
-
-        biologicals = bodies.get_bodies_by_attribute(BodyAttribute.bios, sorted = True)
-        total_bio_count = 0
-        bio_count: list[int] = []
-        for bio in biologicals:
-            bios = 0
-            for signal in bio["Signals"]:
-                bios: int = int(signal["Count"]) if signal["Type"] == "$SAA_SignalType_Biological;" else bios
-            total_bio_count += bios
-            bio_count.append(bios)
-        if total_bio_count > 0:
+        self.print(f"║  Stars: {len(report.members["stars"]):<5}Planets: {len(report.members["planets"]):<5}First discoveries: {len(report.members["first_discoveries"])}</module_color>", prefix="<module_color>  ")
+        self.print(f"║  Estimated value: {format_credits(total_value.scan)} scanned, {format_credits(total_value.mapped)} with every planet mapped</module_color>", prefix="<module_color>  ")
+        unchanged: list[str] = []
+        for name in SECTION_TITLES:
+            lines = report.sections[name]
+            if not full and lines and lines == report.shown.get(name):
+                unchanged.append(SECTION_TITLES[name])
+                continue
+            for text, prefix in lines:
+                self.print(text, prefix=prefix)
+        if unchanged:
             self.print("<module_color>  ╠══</module_color>", prefix="")
-            self.print(f"  Biological signatures: {len(biologicals)} / {total_bio_count}</biological>", prefix="<biological>  ║")
-            for i, planet in enumerate(biologicals):
-                planet_bio_count: str = f"({bio_count[i]})"
-                surface_temp = int(planet["SurfaceTemperature"])
-                atmosphere_type = str(planet["AtmosphereType"])
-                planet_type = abbreviate_planet_type(planet["PlanetClass"])
-                bios_worth = self.get_estimated_bio_worth(planet, bio_count[i])
-                min_value: float = float(round(bios_worth[0] / 1000000, ndigits=1))
-                max_value: float = float(round(bios_worth[1] / 1000000, ndigits=1))
-                average_value: float = float(round(bios_worth[2] / 1000000, ndigits=1))
-                self.print(f"{planet["BodyName"].removeprefix(system_name):13}{planet_bio_count:7}{f"{min_value}M - {max_value}M | {average_value}M":28}{planet_type:8}{str(str(surface_temp)+"K"):10}{atmosphere_type}</biological>", prefix="<biological>  ║\t")
-                if self.state.display_verbose:
-                    organisms: list[str] = []
-                    for genus in bios_worth[3]:
-                        for species in genus:
-                            organisms.append(f"{species.code} {round(float(species.value / 1000000), ndigits=1)}M")
-                    output: str = ""
-                    for j in range(len(organisms)):
-                        output = f"{output}<bio>{organisms[j]:16}</bio>"
-                        if (j + 1) % 6 == 0 and len(organisms) > (j + 1):
-                            output = str(output + "\n  <biological>║</biological>\t\t")
-                    self.print(f"</biological>{output}", prefix="<biological>  ║\t\t")
-
-        geologicals = bodies.get_bodies_by_attribute(BodyAttribute.geos, sorted = True)
-        total_geo_count = 0
-        geo_count: list[int] = []
-        for geo in geologicals:
-            geos = 0
-            for signal in geo["Signals"]:
-                geos: int = int(signal["Count"]) if signal["Type"] == "$SAA_SignalType_Geological;" else geos
-            total_geo_count += geos
-            geo_count.append(geos)
-        if total_geo_count > 0:
-            self.print("<module_color>  ╠══</module_color>", prefix="")
-            self.print(f"  Geological signatures: {len(geologicals)} / {total_geo_count}</geological>", prefix="<geological>  ║")
-            for i, planet in enumerate(geologicals):
-                self.print(f"{planet["BodyName"].removeprefix(system_name):13}({str(geo_count[i])+")":7}Volcanism type: {planet["Volcanism"]}</geological>", prefix="<geological>  ║\t")
-
+            self.print(f"║  Unchanged since the last report: {", ".join(unchanged)}</module_color>", prefix="<module_color>  ")
         self.print("<module_color>  ╚═══════════════════════════════════════════════════════════════════════════════════</module_color>\n", prefix="")
+        report.shown = dict(report.sections)
+
+    def valuable_lines(self, system: StarSystem) -> list[ReportLine]:
+        values = system.bodies.estimated_values
+        valuables = values.ranked(VALUABLE_PLANETS)
+        if len(valuables) == 0:
+            return []
+        lines: list[ReportLine] = [("<module_color>  ╠══</module_color>", ""), (f"  Valuable planets: {len(valuables)}</valuable>", "<valuable>  ║")]
+        for planet in valuables:
+            lines.append((f"{system.short_name(planet):12}{format_credits(values.value_of(planet.body_id).mapped):7}({planet.planet_class_abbreviation}{" + Terraformable" if planet.terraform_state == "Terraformable" else ""})</valuable>", "<valuable>  ║\t "))
+        return lines
+
+    def biological_lines(self, system: StarSystem) -> list[ReportLine]:
+        biologicals = system.bodies.get_bodies_by_id(sorted(self.report.members["biological"]))
+        bio_count = [signal_count(planet, "$SAA_SignalType_Biological;") for planet in biologicals]
+        total_bio_count = sum(bio_count)
+        if total_bio_count == 0:
+            return []
+        lines: list[ReportLine] = [("<module_color>  ╠══</module_color>", ""), (f"  Biological signatures: {len(biologicals)} / {total_bio_count}</biological>", "<biological>  ║")]
+        bios_worths = self.get_estimated_bio_worths(biologicals, bio_count)
+        for i, planet in enumerate(biologicals):
+            planet_bio_count: str = f"({bio_count[i]})"
+            surface_temp = int(planet.surface_temperature)
+            atmosphere_type = str(planet.atmosphere_type)
+            planet_type = planet.planet_class_abbreviation
+            bios_worth = bios_worths[i]
+            min_value: float = float(round(bios_worth[0] / 1000000, ndigits=1))
+            max_value: float = float(round(bios_worth[1] / 1000000, ndigits=1))
+            average_value: float = float(round(bios_worth[2] / 1000000, ndigits=1))
+            lines.append((f"{system.short_name(planet):12}{planet_bio_count:7}{f"{min_value}M - {max_value}M | {average_value}M":28}{planet_type:8}{str(str(surface_temp)+"K"):10}{atmosphere_type}</biological>", "<biological>  ║\t "))
+            if self.state.display_verbose:
+                organisms: list[str] = []
+                for genus in bios_worth[3]:
+                    for species in genus:
+                        organisms.append(f"{species.code} {round(float(species.value / 1000000), ndigits=1)}M")
+                output: str = ""
+                for j in range(len(organisms)):
+                    output = f"{output}<bio>{organisms[j]:16}</bio>"
+                    if (j + 1) % 6 == 0 and len(organisms) > (j + 1):
+                        output = str(output + "\n  <biological>║</biological>\t\t")
+                lines.append((f"</biological>{output}", "<biological>  ║\t\t"))
+        return lines
+
+    def geological_lines(self, system: StarSystem) -> list[ReportLine]:
+        geologicals = system.bodies.get_bodies_by_id(sorted(self.report.members["geological"]))
+        geo_count = [signal_count(planet, "$SAA_SignalType_Geological;") for planet in geologicals]
+        if sum(geo_count) == 0:
+            return []
+        lines: list[ReportLine] = [("<module_color>  ╠══</module_color>", ""), (f"  Geological signatures: {len(geologicals)} / {sum(geo_count)}</geological>", "<geological>  ║")]
+        for i, planet in enumerate(geologicals):
+            lines.append((f"{system.short_name(planet):12}({str(geo_count[i])+")":7}Volcanism type: {planet.volcanism}</geological>", "<geological>  ║\t "))
+        return lines
 
     async def process_event(self, event: Any, tg: asyncio.TaskGroup) -> None:
         await super().process_event(event, tg)
         match event["event"]:
+            case "Scan" | "FSSBodySignals" | "SAASignalsFound":
+                self.report.mark_changed(int(event["BodyID"]))
             case "FSSAllBodiesFound":
-                if not self.report_scheduled:
+                # Queued, so the core can already be in the next system, whose report this would not be
+                if not self.report_scheduled and event["SystemAddress"] == self.core.state.current_system.address:
                     self.report_scheduled = True
-                    task = tg.create_task(self.process_report(1))
-                    if not self.caught_up: task.cancel()
+                    if self.caught_up: self.render_report(full=True)
             case "FSDJump":
                 self.report_scheduled = False
+            case "CaughtUp":
+                self.report.rebuild = True      # the body events of the catch-up were skipped
             case _: pass
 
     async def process_user_input(self, arguments: list[str], tg: asyncio.TaskGroup) -> None:
         await super().process_user_input(arguments, tg)
         match arguments[1]:
             case "report":
-                await self.process_report(0.01)
+                self.render_report(full=len(arguments) > 2 and arguments[2] == "full")
+            case "reload":
+                try:
+                    taxonomy = reload_taxonomy()
+                except (OSError, msgspec.DecodeError, msgspec.ValidationError) as error:
+                    self.print(f"<error>Could not reload the taxonomy, keeping the current one: {error}</error>")
+                else:
+                    self.print(f"Reloaded {len(taxonomy.genera)} genera and {len(taxonomy.species)} species from the taxonomy file")
+                    self.report.stale.add("biological")
+            case "cache":
+                lookups = prediction_cache.hits + prediction_cache.misses
+                self.print(f"Bio prediction cache: {len(prediction_cache)} / {prediction_cache.capacity} planets, {prediction_cache.hits} hits, {prediction_cache.misses} misses"
+                           f"{f" ({prediction_cache.hits / lookups:.0%} hit rate)" if lookups else ""}, {prediction_cache.invalidations} dropped as their planet or system changed")
             case "more":
                 if arguments[2]:
                     if arguments[2] == "verbose":
                         self.state.display_verbose = True
+                        self.report.stale.add("biological")
                         self.print("Reports are now <yellow>more</yellow> verbose!")
                         self.save_state()
             case "less":
                 if arguments[2]:
                     if arguments[2] == "verbose":
                         self.state.display_verbose = False
+                        self.report.stale.add("biological")
                         self.print("Reports are now <yellow>less</yellow> verbose!")
                         self.save_state()
             case _: pass
 
-    def get_estimated_bio_worth(self, planet: dict[str, Any], num_signatures: int) -> tuple[int, int, int, list[list[species.Species]]]:
-        valid_species: list[list[species.Species]] = []
-        maximum_values: list[int] = []
-        minimum_values: list[int] = []
-        average_values: list[int] = []
-        for genus in taxon:
-            valid_species_in_genus = genus.list_possible_species(self.core.state.current_system.bodies, planet)
-            if valid_species_in_genus:
-                valid_species.append(valid_species_in_genus)
-        for genus in valid_species:
-            max_value = 0
-            min_value = genus[0].value
-            average_value = 0
-            for species in genus:
-                if species.value > max_value: max_value = species.value
-                if species.value < min_value: min_value = species.value
-                average_value += species.value
-            average_value = int(average_value / len(genus))
-            maximum_values.append(max_value)
-            minimum_values.append(min_value)
-            average_values.append(average_value)
-        maximum_values.sort(reverse=True)
-        minimum_values.sort()
-        total_minimum_value = sum(minimum_values[:num_signatures])
-        total_maximum_value = sum(maximum_values[:num_signatures])
-        total_average_value = int(sum(average_values) / len(average_values))
-        
-        return (total_minimum_value, total_maximum_value, total_average_value, valid_species)
\ No newline at end of file
+    def get_estimated_bio_worth(self, planet: Body, num_signatures: int) -> BioWorth:
+        return self.get_estimated_bio_worths([planet], [num_signatures])[0]
+
+    def get_estimated_bio_worths(self, planets: list[Body], num_signatures: list[int]) -> list[BioWorth]:
+        # The (minimum, maximum, average, possible species of each genus) of every planet, worked out together
+        system = self.core.state.current_system
+        return prediction_cache.estimate_worth(get_taxonomy().predictor, system.address, system.bodies, planets, num_signatures)
\ No newline at end of file
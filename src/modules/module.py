@@ -1,16 +1,19 @@
 from html import escape
-from src.version import MODULE_VERSIONS_PATH
+from src.version import module_versions
+from src.events import JournalEvent
+from src.util import EDSST_EVENTS, write_atomic
 import msgspec
 from prompt_toolkit import print_formatted_text
 from prompt_toolkit.formatted_text import HTML
 from prompt_toolkit.styles import Style
 import asyncio
-import json
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable
 
 MODULES_DATA_PATH = Path("modules_data")
 
+WILDCARD_SUBSCRIPTION = "*"
+
 global_style = Style.from_dict({
     "edsst_color": "#ff8000",
     "error": "#ff4040",
@@ -55,6 +58,7 @@ global_style = Style.from_dict({
 
 class ModuleState(msgspec.Struct):
     enabled: bool = False
+    schema_version: int = 0     # the SCHEMA_VERSION of the module that saved the state
 
 
 class Module():
@@ -64,61 +68,43 @@ class Module():
     MODULE_NAME: str = "UNNAMED_MODULE"
     MODULE_VERSION: str = "?"
     STATE_TYPE = ModuleState
+    SCHEMA_VERSION: int = 0     # bumped whenever STATE_TYPE changes so that older state files need a migration
+    STATE_MIGRATIONS: dict[int, Callable[[dict[str, Any]], dict[str, Any]]] = {}    # schema version -> function turning a state dict of that version into the next version
+    TYPED_EVENTS: frozenset[str] = frozenset()   # event types delivered to process_typed_event as src.events structs instead of dicts
+    SUBSCRIPTIONS: frozenset[str] = frozenset([WILDCARD_SUBSCRIPTION])   # event types delivered to process_event, EDSST events are always delivered
+    CATCH_UP_EVENTS: frozenset[str] | None = None   # subscribed event types still needed while catching up, None for all of them
+    QUEUED: bool = True     # once caught up, events reach the module through its own queue and worker task instead of inline
+    subscription_generation: int = 0    # bumped on every subscription change so the dispatcher knows to rebuild its routes
+    subscriptions: set[str]
+    SAVE_DELAY: float = 2.0     # seconds to wait for more changes before the state is written, saves in between are coalesced into one write
+    state_dirty: bool = False
+    save_handle: asyncio.TimerHandle | None = None
     module_dir: Path
     state_file_path: Path
     caught_up: bool = True
     state: ModuleState
+    state_migrated: bool = False
     aliases: set[str]
 
     def __init__(self, extra_aliases: set[str]) -> None:
         self.aliases = set([f"{self.MODULE_NAME.lower()}"])
         for alias in extra_aliases: self.aliases.add(alias.lower())
-        self.state = self.STATE_TYPE()
-        module_versions: list[dict[str, str]] = []
-        first_boot = True
-        version_changed = False
-        previous_version: str = "N/A"
+        self.subscriptions = set(self.SUBSCRIPTIONS) | set(self.TYPED_EVENTS)
+        self.state = self.new_state()
         self.style = Style(self.style.style_rules + global_style.style_rules)
         self.module_dir = MODULES_DATA_PATH / Path(self.MODULE_NAME.lower())
         if not self.module_dir.exists():
             self.module_dir.mkdir()
         self.state_file_path = self.module_dir / Path(self.MODULE_NAME.lower() + "_state")
-        if not MODULE_VERSIONS_PATH.exists():
-            self.print("<error>Could not find versions file!</error> Attempting to make one.")
-            module_versions.append({"module_name": self.MODULE_NAME, "version": self.MODULE_VERSION})
-            first_boot = False
-            try: 
-                json.dump(module_versions, MODULE_VERSIONS_PATH.open("w"))
-                self.print("<warning>New versions file successfully created!</warning>")
-            except:
-                self.print("<error>Could not create versions file!</error>")
-        else:    
-            try:
-                module_versions = json.load(MODULE_VERSIONS_PATH.open())
-            except:
-                self.print("<error>Could not open versions file!</error>")
-            for module in module_versions:
-                if module["module_name"] == self.MODULE_NAME:
-                    first_boot = False
-                    previous_version = module["version"]
-                    if previous_version != self.MODULE_VERSION:
-                        module["version"] = self.MODULE_VERSION
-                        version_changed = True
-                        self.print("<warning>New module versions detected!</warning> ")
-                        self.print(previous_version + " -> " + self.MODULE_VERSION)
-                    try:    json.dump(module_versions, MODULE_VERSIONS_PATH.open("w"))
-                    except: self.print("<error>Could not update versions file!</error>")
-                    break
-            if first_boot: module_versions.append({"module_name": self.MODULE_NAME, "version": self.MODULE_VERSION})
-        if first_boot: self.print("<warning>First boot of module detected!</warning>")
-        if version_changed:
-            self.print("<warning>Initializing a new state file...</warning>")
-            self.save_state()
-        try:
-            json.dump(module_versions, MODULE_VERSIONS_PATH.open("w"))
-        except:
-            self.print("<error>Could not update versions file!</error>")
+        previous_version = module_versions.record(self.MODULE_NAME, self.MODULE_VERSION)   # the versions file is written once all modules are created
+        if previous_version is None:
+            self.print("<warning>First boot of module detected!</warning>")
+        elif previous_version != self.MODULE_VERSION:
+            self.print("<warning>New module versions detected!</warning> ")
+            self.print(previous_version + " -> " + self.MODULE_VERSION)
         self.load_state()
+        if self.state_migrated:
+            self.save_state(immediately=True)
         self.print(f"Loaded module version {self.MODULE_VERSION}")
         if self.state.enabled:
             self.print("Module currently <green>enabled</green>")
@@ -137,18 +123,108 @@ class Module():
             self.save_state()
         self.print("<red>Disabled!</red>")
 
-    def save_state(self) -> None:
+    async def close(self) -> None:
+        # Called once when EDSST shuts down, override to release what the module holds open, such as network clients
+        pass
+
+    def is_subscribed(self, event_type: str) -> bool:
+        return event_type in self.subscriptions or WILDCARD_SUBSCRIPTION in self.subscriptions or event_type in EDSST_EVENTS
+
+    def subscribe(self, *event_types: str) -> None:
+        self.subscriptions.update(event_types)
+        Module.subscription_generation += 1
+
+    def unsubscribe(self, *event_types: str) -> None:
+        self.subscriptions.difference_update(event_types)
+        Module.subscription_generation += 1
+
+    def save_state(self, immediately: bool = False) -> None:
+        # Marks the state as changed, it is written SAVE_DELAY seconds later together with any other changes made by then
         if not self.caught_up: return
-        self.state_file_path.write_bytes(msgspec.json.encode(self.state))
+        self.state_dirty = True
+        if not immediately:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                pass
+            else:
+                if self.save_handle is None:
+                    self.save_handle = loop.call_later(self.SAVE_DELAY, self.flush_state)
+                return
+        self.flush_state()
+
+    def flush_state(self) -> None:
+        if self.save_handle is not None:
+            self.save_handle.cancel()
+            self.save_handle = None
+        if self.state_dirty:
+            self.state_dirty = False
+            self.write_state()
+
+    def write_state(self) -> None:
+        write_atomic(self.state_file_path, msgspec.json.encode(self.state))
+
+    def new_state(self) -> Any:
+        return self.STATE_TYPE(schema_version=self.SCHEMA_VERSION)
 
     def load_state(self) -> None:
-        if self.state_file_path.exists():
-            self.state = msgspec.json.decode(self.state_file_path.read_bytes(), type = self.STATE_TYPE)
+        if not self.state_file_path.exists():
+            return
+        data = self.state_file_path.read_bytes()
+        try:
+            state = msgspec.json.decode(data, type = self.STATE_TYPE)
+            if state.schema_version == self.SCHEMA_VERSION:
+                self.state = state
+                return
+        except msgspec.ValidationError:
+            pass    # saved with an older schema that no longer decodes into STATE_TYPE
+        self.state = self.migrate_state(msgspec.json.decode(data))
+        self.state_migrated = True
+
+    def migrate_state(self, state: dict[str, Any]) -> Any:
+        # Runs the registered migrations one schema version at a time on the decoded state, then decodes the result as usual
+        schema_version: int = state.get("schema_version", 0)
+        try:
+            if schema_version > self.SCHEMA_VERSION:
+                raise ValueError(f"saved by a newer schema version {schema_version}")
+            while schema_version < self.SCHEMA_VERSION:
+                if schema_version not in self.STATE_MIGRATIONS:
+                    raise ValueError(f"no migration from schema version {schema_version}")
+                state = self.STATE_MIGRATIONS[schema_version](state)
+                schema_version += 1
+                state["schema_version"] = schema_version
+            migrated_state = msgspec.json.decode(msgspec.json.encode(state), type = self.STATE_TYPE)
+        except (msgspec.ValidationError, KeyError, TypeError, ValueError) as error:
+            self.print(f"<error>Could not migrate the state: {escape(str(error))}</error>")
+        else:
+            self.print(f"<warning>State migrated to schema version {self.SCHEMA_VERSION}</warning>")
+            return migrated_state
+        self.print("<warning>Initializing a new state file...</warning>")
+        return self.new_state()
 
     async def process_event(self, event: Any, tg: asyncio.TaskGroup) -> None:
         if event["event"] == "CaughtUp":
             self.caught_up = True
 
+    async def process_typed_event(self, event: JournalEvent, tg: asyncio.TaskGroup) -> None:
+        pass
+
+    def select_batch(self, names: list[str]) -> Iterable[int]:
+        # Positions of the events in a catch-up slice (given by event type) to decode and pass to process_event_batch
+        if self.CATCH_UP_EVENTS is None:
+            return range(len(names))
+        return [index for index, name in enumerate(names) if name in self.CATCH_UP_EVENTS or name in EDSST_EVENTS]
+
+    async def process_event_batch(self, events: list[JournalEvent | dict[str, Any]], tg: asyncio.TaskGroup) -> None:
+        # Catch-up hands over the replayed events in large slices. Override to fold a whole slice at once.
+        # The other modules get the slice before or after this one, so their state (the core's current system included) is
+        # not that of the event being handled. Take what is needed from the events themselves.
+        for event in events:
+            if isinstance(event, JournalEvent):
+                await self.process_typed_event(event, tg)
+            else:
+                await self.process_event(event, tg)
+
     async def process_user_input(self, arguments: list[str], tg: asyncio.TaskGroup) -> None:
         if len(arguments) < 2:
             self.print("<warning>Received no commands!</warning>")
@@ -0,0 +1,50 @@
+### Module registry
+# Creates the modules at startup, timing each one, and writes the module versions file once they all exist.
+
+from src.modules.module import Module, global_style
+from src.version import ModuleVersions, module_versions
+from prompt_toolkit import print_formatted_text
+from prompt_toolkit.formatted_text import HTML
+from typing import Any, Callable, TypeVar
+import time
+
+ModuleType = TypeVar("ModuleType", bound=Module)
+
+
+class ModuleRegistry:
+    modules: list[Module]
+    timings: list[tuple[str, float]]    # (module name, seconds it took to create)
+    versions: ModuleVersions
+
+    def __init__(self, versions: ModuleVersions = module_versions) -> None:
+        self.modules = []
+        self.timings = []
+        self.versions = versions
+
+    def add(self, module_type: Callable[..., ModuleType], *args: Any) -> ModuleType:
+        start = time.perf_counter()
+        module = module_type(*args)
+        self.timings.append((module.MODULE_NAME, time.perf_counter() - start))
+        self.modules.append(module)
+        return module
+
+    def finish_startup(self, print_timings: bool = False) -> None:
+        if self.versions.file_missing:
+            self.print("<error>Could not find versions file!</error> Creating a new one.")
+        elif self.versions.file_unreadable:
+            self.print("<error>Could not open versions file!</error> Creating a new one.")
+        try:
+            self.versions.save()
+        except OSError:
+            self.print("<error>Could not update versions file!</error>")
+        if print_timings:
+            self.print_timings()
+
+    def print_timings(self) -> None:
+        width = max((len(name) for name, _ in self.timings), default=0)
+        for name, seconds in self.timings:
+            self.print(f"{name:<{width}} {seconds * 1000:8.1f} ms")
+        self.print(f"{"total":<{width}} {sum(seconds for _, seconds in self.timings) * 1000:8.1f} ms")
+
+    def print(self, text: str) -> None:
+        print_formatted_text(HTML(f"<edsst_color>EDSST</edsst_color>: {text}"), style=global_style)
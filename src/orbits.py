@@ -0,0 +1,83 @@
+### Orbital hierarchy
+# Which body orbits which, from the Parents chains of Scan events. A chain names the body's parent, the parent's parent and so on
+# up to the main star or barycentre of the system, so a single scan links the body all the way up before its parents are scanned.
+
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+if TYPE_CHECKING:
+    from src.modules.core import Body
+
+BARYCENTRE = "Null"     # the kinds of parent the journal names in Parents
+STAR = "Star"
+PLANET = "Planet"
+RING = "Ring"
+
+
+class OrbitIndex:
+    parents: dict[int, int]             # body id -> id of the body or barycentre it orbits
+    children: dict[int, list[int]]      # body id -> ids of the bodies orbiting it, in the order they became known
+    kinds: dict[int, str]               # body id -> one of the kinds above, for the bodies that are known
+
+    def __init__(self, bodies: Iterable["Body"] = ()) -> None:
+        self.parents = {}
+        self.children = {}
+        self.kinds = {}
+        for body in bodies:
+            self.add_body(body)
+
+    def add_body(self, body: "Body", kind: str = "") -> None:
+        # Links the body and every parent in its chain, stopping where the chain is already known
+        if kind or body.star_type or body.planet_class:
+            self.kinds[body.body_id] = kind or (STAR if body.star_type else PLANET)
+        child = body.body_id
+        for parent in body.parents:
+            for parent_kind, parent_id in parent.items():
+                self.kinds[parent_id] = parent_kind
+                if self.parents.get(child) == parent_id:
+                    return
+                self.link(child, parent_id)
+                child = parent_id
+
+    def link(self, child: int, parent: int) -> None:
+        previous_parent = self.parents.get(child)
+        if previous_parent is not None:
+            self.children[previous_parent].remove(child)
+        self.parents[child] = parent
+        self.children.setdefault(parent, []).append(child)
+
+    def parent(self, body_id: int) -> int | None:
+        return self.parents.get(body_id)
+
+    def kind(self, body_id: int) -> str:
+        return self.kinds.get(body_id, "")
+
+    def ancestors(self, body_id: int) -> Iterator[int]:
+        # Parent first, up to the root of the system
+        parent = self.parents.get(body_id)
+        while parent is not None:
+            yield parent
+            parent = self.parents.get(parent)
+
+    def children_of(self, body_id: int) -> tuple[int, ...]:
+        return tuple(self.children.get(body_id, ()))
+
+    def descendants(self, body_id: int) -> Iterator[int]:
+        # Everything orbiting the body, directly or not, depth first
+        pending = list(reversed(self.children.get(body_id, ())))
+        while pending:
+            child = pending.pop()
+            yield child
+            pending.extend(reversed(self.children.get(child, ())))
+
+    def parent_stars(self, body_id: int) -> list[int]:
+        # The star the body orbits, the nearest one up its chain. When that is a barycentre of stars, as for a planet
+        # around a binary pair, the stars orbiting the barycentre.
+        for ancestor in self.ancestors(body_id):
+            kind = self.kinds.get(ancestor)
+            if kind == STAR:
+                return [ancestor]
+            if kind == BARYCENTRE:
+                stars = [child for child in self.children.get(ancestor, ()) if self.kinds.get(child) == STAR]
+                if stars:
+                    return stars
+        return []
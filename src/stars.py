@@ -0,0 +1,60 @@
+### Star summary
+# The scanned stars of a system as the star types they match, for the species that only live around some kinds of star.
+# A star matches the keys (spectral class, subclass, luminosity class) of its own class with its subclass or ANY_SUBCLASS and
+# its luminosity class or ANY_LUMINOSITY, so whether it is of any of a species' star types is one set intersection.
+
+from src.util import luminosity_class
+from typing import TYPE_CHECKING, Collection, Iterable
+
+if TYPE_CHECKING:
+    from src.modules.core import Body
+
+ANY_SUBCLASS = -1
+ANY_LUMINOSITY = "All"
+
+StarKey = tuple[str, int, str]  # (spectral class, subclass, luminosity class)
+
+
+def star_keys(spectral_class: str, subclass: int, luminosity: str) -> frozenset[StarKey]:
+    return frozenset((spectral_class, star_subclass, star_luminosity) for star_subclass in (subclass, ANY_SUBCLASS) for star_luminosity in (luminosity, ANY_LUMINOSITY))
+
+
+class StarSummary:
+    luminosities: dict[int, str]                    # star id -> luminosity class
+    keys: dict[int, frozenset[StarKey]]             # star id -> every key the star matches
+    keys_by_luminosity: dict[str, frozenset[StarKey]]  # luminosity class -> every key the stars of the class match
+
+    def __init__(self, bodies: Iterable["Body"] = ()) -> None:
+        self.luminosities = {}
+        self.keys = {}
+        self.keys_by_luminosity = {}
+        for body in bodies:
+            if body.star_type:
+                self.set_star(body)
+        self.group()
+
+    def add_star(self, star: "Body") -> None:
+        # Also when a known star is scanned again
+        self.set_star(star)
+        self.group()
+
+    def set_star(self, star: "Body") -> None:
+        luminosity = luminosity_class(star.luminosity)
+        self.luminosities[star.body_id] = luminosity
+        self.keys[star.body_id] = star_keys(star.star_type, star.subclass, luminosity)
+
+    def group(self) -> None:
+        groups: dict[str, set[StarKey]] = {}
+        for star_id, luminosity in self.luminosities.items():
+            groups.setdefault(luminosity, set()).update(self.keys[star_id])
+        self.keys_by_luminosity = {luminosity: frozenset(keys) for luminosity, keys in groups.items()}
+
+    def scanned(self, star_ids: Iterable[int]) -> list[int]:
+        return [star_id for star_id in star_ids if star_id in self.keys]
+
+    def any_matches(self, star_types: frozenset[StarKey], disallowed_luminosities: Collection[str], star_ids: list[int]) -> bool:
+        # Whether any of the scanned stars, or any star of the system when there are none, is of one of star_types
+        # and not of a disallowed luminosity class
+        if star_ids:
+            return any(self.luminosities[star_id] not in disallowed_luminosities and not self.keys[star_id].isdisjoint(star_types) for star_id in star_ids)
+        return any(luminosity not in disallowed_luminosities and not keys.isdisjoint(star_types) for luminosity, keys in self.keys_by_luminosity.items())
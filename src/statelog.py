@@ -0,0 +1,77 @@
+### Append-only state log
+# A module appends small change records here instead of rewriting its whole state file for every change,
+# and now and then compacts them into a new state file (snapshot). Every log starts with the generation of the
+# snapshot it builds on, so a log left over from an older snapshot is never replayed onto a newer one.
+
+from pathlib import Path
+from typing import Any, Union
+import msgspec
+import os
+
+
+class LogStart(msgspec.Struct, tag="start", array_like=True):
+    generation: int
+
+
+class StateLog:
+    path: Path
+    file: Any
+    records: int    # records appended since the last snapshot
+    size: int       # bytes of those records
+    encoder: msgspec.json.Encoder
+    decoder: msgspec.json.Decoder[Any]
+
+    def __init__(self, path: Path, record_type: Any) -> None:
+        # record_type is a tagged msgspec Struct, or a union of them
+        self.path = path
+        self.records = 0
+        self.size = 0
+        self.encoder = msgspec.json.Encoder()
+        self.decoder = msgspec.json.Decoder(Union[LogStart, record_type])   # pyright: ignore[reportArgumentType]
+        self.file = open(path, "ab")
+
+    def read(self, generation: int) -> list[Any]:
+        # The records written on top of snapshot `generation`. Reading stops at a torn last line left by a crash.
+        records: list[Any] = []
+        if not self.path.exists():
+            return records
+        lines = self.path.read_bytes().splitlines()
+        if not lines:
+            return records
+        try:
+            start = self.decoder.decode(lines[0])
+        except msgspec.DecodeError:
+            return records
+        if not isinstance(start, LogStart) or start.generation != generation:
+            return records
+        for line in lines[1:]:
+            try:
+                records.append(self.decoder.decode(line))
+            except msgspec.DecodeError:
+                break
+            self.size += len(line) + 1
+        self.records = len(records)
+        return records
+
+    def append(self, record: Any) -> None:     # buffered, reaches the disk with the next sync
+        line = self.encoder.encode(record) + b"\n"
+        self.file.write(line)
+        self.records += 1
+        self.size += len(line)
+
+    def sync(self) -> None:
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def reset(self, generation: int) -> None:  # after a new snapshot has been written
+        self.file.close()
+        self.file = open(self.path, "wb")
+        self.file.write(self.encoder.encode(LogStart(generation)) + b"\n")
+        self.sync()
+        self.file.close()
+        self.file = open(self.path, "ab")
+        self.records = 0
+        self.size = 0
+
+    def close(self) -> None:
+        self.file.close()
@@ -0,0 +1,78 @@
+### Status.json
+# The game rewrites Status.json in the journal folder several times a second with the live state of the ship or commander,
+# including the position on a planet. StatusReader only decodes the file again when its modification time or size changed,
+# and checks for that at most once every read_interval seconds however often it is asked.
+
+from src.events import journal_field_name
+from pathlib import Path
+import msgspec
+import time
+import toml
+
+config = toml.load("config.toml")
+
+STATUS_FILE_NAME = "Status.json"
+STATUS_READ_INTERVAL: float = float(config.get("status_read_interval", 0.5))    # seconds
+
+
+class Status(msgspec.Struct, kw_only=True, rename=journal_field_name):
+    # The fields EDSST reads, the position ones are only there near or on a planet
+    timestamp: str = ""
+    flags: int = 0
+    flags2: int = 0
+    latitude: float | None = None       # degrees
+    longitude: float | None = None
+    altitude: float | None = None       # m
+    heading: int | None = None
+    body_name: str = ""
+    planet_radius: float | None = None  # m
+
+    @property
+    def position(self) -> tuple[float, float] | None:   # (latitude, longitude)
+        if self.latitude is None or self.longitude is None:
+            return None
+        return (self.latitude, self.longitude)
+
+_status_decoder = msgspec.json.Decoder(Status)
+
+
+class StatusReader:
+    path: Path
+    read_interval: float
+    status: Status | None           # the last status decoded
+    signature: tuple[int, int]      # (modification time in ns, size) of the file when it was last decoded
+    checked_at: float               # time.monotonic() of the last check
+    checks: int
+    decodes: int
+
+    def __init__(self, path: Path, read_interval: float = STATUS_READ_INTERVAL) -> None:
+        self.path = path
+        self.read_interval = read_interval
+        self.status = None
+        self.signature = (0, 0)
+        self.checked_at = -read_interval
+        self.checks = 0
+        self.decodes = 0
+
+    def read(self, force: bool = False) -> Status | None:
+        # The latest status, None until the file could be read once. force checks the file even within read_interval.
+        now = time.monotonic()
+        if not force and now - self.checked_at < self.read_interval:
+            return self.status
+        self.checked_at = now
+        self.checks += 1
+        try:
+            stat = self.path.stat()
+            signature = (stat.st_mtime_ns, stat.st_size)
+            if signature == self.signature:
+                return self.status
+            data = self.path.read_bytes()
+        except OSError:
+            return self.status
+        try:
+            self.status = _status_decoder.decode(data)
+        except msgspec.DecodeError:
+            return self.status      # caught the game half way through writing it, the next check reads it again
+        self.signature = signature
+        self.decodes += 1
+        return self.status
@@ -4,6 +4,8 @@ import pyperclip
 import toml
 from enum import Enum#, auto
 import math
+import os
+import msgspec
 
 
 config = toml.load("config.toml")
@@ -62,15 +64,13 @@ class PlanetType(Enum):
     NONE = ""
 
 
-class StarType():
+class StarType(msgspec.Struct, frozen=True, array_like=True):  # ["A", -1, "All"] in the taxonomy file
     spectral_class: str
     subclass: int
     luminosity: str
 
-    def __init__(self, spectral_class: str, subclass: int, luminosity: str):
-        self.spectral_class = spectral_class
-        self.subclass = subclass
-        self.luminosity = luminosity
+def luminosity_class(luminosity: str) -> str:  # "V" of the journal's "Vab", "I" of "Iab", "0" stays "0"
+    return luminosity.rstrip("0abz") or luminosity
 
 def get_distance(a: tuple[float, float, float], b:tuple[float, float, float]):
     return math.sqrt((a[0]-b[0])**2+(a[1]-b[1])**2+(a[2]-b[2])**2)
@@ -88,6 +88,14 @@ def read_file_by_lines(file: Path) -> list[str]:
 def reserialize_file(path: Path, contents: list[str]) -> None:
     open(path, "w").write("\n".join(contents))
 
+def write_atomic(path: Path, data: bytes) -> None:   # a crash mid-write leaves the previous file in place instead of a truncated one
+    temporary_path = path.with_name(path.name + ".tmp")
+    with open(temporary_path, "wb") as file:
+        file.write(data)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary_path, path)
+
 def distance_from_parent_ls(semi_major_axis: float, eccentricity: float, mean_anomaly_deg: float) -> float:
     # Thank you, AI overlords...
     # Convert mean anomaly to radians
@@ -0,0 +1,132 @@
+### Cartographic values
+# Estimated Universal Cartographics payouts of the bodies in a system, after the exploration value formulae worked out by MattG
+# (https://forums.frontier.co.uk/threads/exploration-value-formulae.232000/) with the Odyssey mapping bonus.
+# SystemValues keeps the values of all bodies of one system, only bodies changed by new events are worked out again.
+
+from typing import TYPE_CHECKING
+import msgspec
+
+if TYPE_CHECKING:
+    from src.modules.core import Bodies, Body, BodyAttribute, BodyQuery
+
+MASS_FACTOR = 0.56591828
+MINIMUM_VALUE = 500
+FIRST_DISCOVERY_MULTIPLIER = 2.6
+EFFICIENT_MAPPING_MULTIPLIER = 1.25     # the estimates assume the body is mapped with no more probes than the target
+MAPPING_BONUS_SHARE = 0.3               # Odyssey adds 30% of the mapped value, but at least MAPPING_BONUS_MINIMUM
+MAPPING_BONUS_MINIMUM = 555
+FIRST_DISCOVERY_MAP_MULTIPLIER = 3.699622554    # first to discover and first to map the body
+FIRST_MAP_MULTIPLIER = 8.0956                   # first to map a body someone else discovered
+MAP_MULTIPLIER = 3.3333333333
+STAR_MASS_DIVISOR = 66.25
+
+STAR_K: dict[str, float] = {
+    "N": 22628,
+    "H": 22628,
+    "SupermassiveBlackHole": 22628,
+}
+WHITE_DWARF_K = 14057   # every star type starting with a D
+DEFAULT_STAR_K = 1200
+
+PLANET_K: dict[str, tuple[float, float]] = {   # planet class -> (k, added when terraformable)
+    "Metal rich body":              (21790, 0),
+    "Ammonia world":                (96932, 0),
+    "Sudarsky class I gas giant":   (1656, 0),
+    "Sudarsky class II gas giant":  (9654, 100677),
+    "High metal content body":      (9654, 100677),
+    "Water world":                  (64831, 116295),
+    "Earthlike body":               (64831 + 116295, 0),  # earth-likes are always paid as if terraformable
+}
+DEFAULT_PLANET_K = (300, 93328)
+
+
+class BodyValue(msgspec.Struct, frozen=True):
+    scan: int = 0                   # paid for the FSS scan alone
+    mapped: int = 0                 # paid once the body is also mapped, for stars the same as scan
+    first_discovery_bonus: int = 0  # the part of mapped that is only paid for a first discovery
+
+def star_k(star_type: str) -> float:
+    if star_type.startswith("D"):
+        return WHITE_DWARF_K
+    return STAR_K.get(star_type, DEFAULT_STAR_K)
+
+def planet_k(planet_class: str, terraformable: bool) -> float:
+    k, terraformable_k = PLANET_K.get(planet_class, DEFAULT_PLANET_K)
+    return k + terraformable_k if terraformable else k
+
+def estimate_value(body: "Body") -> BodyValue:
+    if body.star_type:
+        k = star_k(body.star_type)
+        scan = mapped = k + body.stellar_mass * k / STAR_MASS_DIVISOR
+    elif body.planet_class:
+        k = planet_k(body.planet_class, bool(body.terraform_state))
+        scan = k + k * MASS_FACTOR * body.mass_em ** 0.2
+        if body.was_mapped:
+            map_multiplier = MAP_MULTIPLIER
+        else:
+            map_multiplier = FIRST_MAP_MULTIPLIER if body.was_discovered else FIRST_DISCOVERY_MAP_MULTIPLIER
+        mapped = scan * map_multiplier * EFFICIENT_MAPPING_MULTIPLIER
+        mapped += max(mapped * MAPPING_BONUS_SHARE, MAPPING_BONUS_MINIMUM)
+    else:
+        return BodyValue()  # belt clusters, rings and bodies only known from signals are worth nothing on their own
+    scan, mapped = max(scan, MINIMUM_VALUE), max(mapped, MINIMUM_VALUE)
+    if body.was_discovered:
+        return BodyValue(round(scan), round(mapped))
+    mapped_value = round(mapped * FIRST_DISCOVERY_MULTIPLIER)
+    return BodyValue(round(scan * FIRST_DISCOVERY_MULTIPLIER), mapped_value, mapped_value - round(mapped))
+
+def format_credits(credits: int) -> str:
+    if credits >= 1000000:
+        return f"{credits / 1000000:.1f}M"
+    if credits >= 1000:
+        return f"{credits / 1000:.0f}k"
+    return str(credits)
+
+
+class SystemValues:
+    # Values of the bodies of one Bodies. Bodies marks the bodies that change or gain attributes,
+    # only those are worked out again the next time the values are read.
+    bodies: "Bodies"
+    values: dict[int, BodyValue]    # body id -> value
+    changed: set[int]               # body ids whose values are out of date or missing
+    rankings: dict["BodyAttribute | BodyQuery | None", tuple["Body", ...]]  # ranked() results since the last update
+
+    def __init__(self, bodies: "Bodies") -> None:
+        self.bodies = bodies
+        self.values = {}
+        self.changed = set(bodies.bodies)
+        self.rankings = {}
+
+    def mark_changed(self, body_id: int) -> None:
+        self.changed.add(body_id)
+
+    def update(self) -> None:
+        if not self.changed:
+            return
+        for body_id in self.changed:
+            self.values[body_id] = estimate_value(self.bodies.get_body_by_id(body_id))
+        self.changed.clear()
+        self.rankings.clear()
+
+    def value_of(self, body_id: int) -> BodyValue:
+        self.update()
+        return self.values.get(body_id, BodyValue())
+
+    def total(self) -> BodyValue:
+        self.update()
+        return BodyValue(sum(value.scan for value in self.values.values()), sum(value.mapped for value in self.values.values()),
+                         sum(value.first_discovery_bonus for value in self.values.values()))
+
+    def ranked(self, query: "BodyAttribute | BodyQuery | None" = None) -> tuple["Body", ...]:
+        # Bodies with a value, most valuable once mapped first, optionally only those matching a body query
+        self.update()
+        ranking = self.rankings.get(query)
+        if ranking is None:
+            if query is None:
+                order = sorted((-value.mapped, body_id) for body_id, value in self.values.items() if value.mapped > 0)
+                ranking = tuple(self.bodies.get_body_by_id(body_id) for _, body_id in order)
+            else:
+                matching = {body.body_id for body in self.bodies.query(query)}
+                ranking = tuple(body for body in self.ranked() if body.body_id in matching)
+            self.rankings[query] = ranking
+        return ranking
@@ -1,6 +1,8 @@
 from pathlib import Path
 from enum import Enum, auto
+import json
 import toml
+from src.util import write_atomic
 
 EDSST_VERSION = "v0.1.4"
 
@@ -12,4 +14,47 @@ class TestingMode(Enum):
     Testing = auto()
     Release = auto()
 
-TESTING_MODE: TestingMode = TestingMode.Testing if config.get("testing_mode", False) else TestingMode.Release
\ No newline at end of file
+TESTING_MODE: TestingMode = TestingMode.Testing if config.get("testing_mode", False) else TestingMode.Release
+
+class ModuleVersions:
+    # The module versions recorded in the versions file. It is read once when the first module asks for its version
+    # and written once after every module has been created, instead of by each module separately.
+    path: Path
+    versions: dict[str, str] | None = None  # module name -> version
+    file_missing: bool = False
+    file_unreadable: bool = False
+    changed: bool = False
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def load(self) -> dict[str, str]:
+        if self.versions is None:
+            self.versions = {}
+            if not self.path.exists():
+                self.file_missing = True
+                self.changed = True
+            else:
+                try:
+                    self.versions = {module["module_name"]: module["version"] for module in json.loads(self.path.read_text())}
+                except (OSError, ValueError, KeyError, TypeError):
+                    self.file_unreadable = True
+                    self.changed = True
+        return self.versions
+
+    def record(self, module_name: str, version: str) -> str | None:
+        # Returns the previously recorded version of the module, None on its first boot
+        versions = self.load()
+        previous_version = versions.get(module_name)
+        if previous_version != version:
+            versions[module_name] = version
+            self.changed = True
+        return previous_version
+
+    def save(self) -> None:
+        if not self.changed:
+            return
+        write_atomic(self.path, json.dumps([{"module_name": name, "version": version} for name, version in self.load().items()]).encode())
+        self.changed = False
+
+module_versions = ModuleVersions(MODULE_VERSIONS_PATH)
@@ -0,0 +1,27 @@
+### Tests
+# Run from the EDSST root folder: uv run python -m unittest
+# EDSST reads config.toml and keeps its module data relative to the working folder, so the tests run in a temporary
+# folder of their own, with the default config, an empty journal folder and a link to src for the data files the modules
+# read from it, before any of src is imported.
+
+from pathlib import Path
+import atexit
+import os
+import shutil
+import sys
+import tempfile
+import toml
+
+ROOT = Path(__file__).resolve().parent.parent
+WORK_DIRECTORY = Path(tempfile.mkdtemp(prefix="edsst_tests_"))
+JOURNAL_DIRECTORY = WORK_DIRECTORY / "journal"
+
+config = toml.load(ROOT / "config.default.toml")
+config["elite_dangerous_journal_path"] = str(JOURNAL_DIRECTORY)
+JOURNAL_DIRECTORY.mkdir()
+(WORK_DIRECTORY / "config.toml").write_text(toml.dumps(config))
+(WORK_DIRECTORY / "modules_data").mkdir()
+(WORK_DIRECTORY / "src").symlink_to(ROOT / "src")
+os.chdir(WORK_DIRECTORY)
+sys.path.insert(0, str(ROOT))
+atexit.register(shutil.rmtree, WORK_DIRECTORY, ignore_errors=True)
@@ -0,0 +1,106 @@
+### Journal events for the tests
+# Small fixed events with the fields EDSST reads, so a test states the bodies it needs and never depends on the benchmarks.
+
+from src.modules.core import Bodies, BodyAttribute, body_event_attributes
+from src.util import AtmosphereType, PlanetType
+from typing import Any
+import json
+
+TIMESTAMP = "2026-01-01T00:00:00Z"
+# Every planet type with every atmosphere type, the planets of bio_system take turns at them
+COMBINATIONS: list[tuple[str, str]] = [(planet_type.value, atmosphere.value) for planet_type in PlanetType if planet_type != PlanetType.NONE
+                                       for atmosphere in AtmosphereType if atmosphere != AtmosphereType.ANY]
+BIO_TEMPERATURES: list[float] = [45.0, 150.0, 165.0, 180.0, 195.0, 240.0, 400.0]
+VOLCANISMS: list[str] = ["", "minor water geysers volcanism", "carbon dioxide geysers volcanism", "minor rocky magma volcanism", "nitrogen magma volcanism"]
+
+
+def system_name(address: int) -> str:
+    return f"Test AB-C d{address}-0"
+
+def fsd_jump(address: int, star_pos: tuple[float, float, float] = (0.0, 0.0, 0.0)) -> dict[str, Any]:
+    return {
+        "timestamp": TIMESTAMP, "event": "FSDJump", "StarSystem": system_name(address), "SystemAddress": address, "StarPos": list(star_pos),
+        "SystemAllegiance": "", "SystemEconomy": "$economy_None;", "SystemSecondEconomy": "$economy_None;", "SystemGovernment": "$government_None;",
+        "SystemSecurity": "$GAlAXY_MAP_INFO_state_anarchy;", "Population": 0, "Body": f"{system_name(address)} A", "BodyID": 1, "BodyType": "Star",
+        "JumpDist": 20.0, "FuelUsed": 2.0, "FuelLevel": 30.0,
+    }
+
+def star_scan(address: int, body_id: int, star_type: str = "K", luminosity: str = "Va", subclass: int = 4) -> dict[str, Any]:
+    return {
+        "timestamp": TIMESTAMP, "event": "Scan", "ScanType": "AutoScan", "BodyName": f"{system_name(address)} {chr(64 + body_id)}", "BodyID": body_id,
+        "Parents": [{"Null": 0}], "StarSystem": system_name(address), "SystemAddress": address, "DistanceFromArrivalLS": 0.0 if body_id == 1 else 2000.0 * body_id,
+        "StarType": star_type, "Subclass": subclass, "StellarMass": 0.8, "Radius": 5e8, "AbsoluteMagnitude": 6.0, "Age_MY": 4000,
+        "SurfaceTemperature": 4500.0, "Luminosity": luminosity, "RotationPeriod": 2e6, "AxialTilt": 0.0,
+        "WasDiscovered": False, "WasMapped": False, "WasFootfalled": False,
+    }
+
+def planet_scan(address: int, body_id: int, parent_id: int, planet_class: str = "Rocky body", atmosphere_type: str = "None", **fields: Any) -> dict[str, Any]:
+    # A landable planet orbiting star parent_id, fields overrides any of the event's fields
+    event: dict[str, Any] = {
+        "timestamp": TIMESTAMP, "event": "Scan", "ScanType": "Detailed", "BodyName": f"{system_name(address)} {chr(64 + parent_id)} {body_id}", "BodyID": body_id,
+        "Parents": [{"Star": parent_id}, {"Null": 0}], "StarSystem": system_name(address), "SystemAddress": address, "DistanceFromArrivalLS": 500.0,
+        "TidalLock": True, "TerraformState": "", "PlanetClass": planet_class,
+        "Atmosphere": "" if atmosphere_type == "None" else f"thin {atmosphere_type.lower()} atmosphere", "AtmosphereType": atmosphere_type,
+        "AtmosphereComposition": [] if atmosphere_type == "None" else [{"Name": atmosphere_type, "Percent": 100.0}],
+        "Volcanism": "", "MassEM": 0.1, "Radius": 2.5e6, "SurfaceGravity": 1.5, "SurfaceTemperature": 180.0, "SurfacePressure": 0.0 if atmosphere_type == "None" else 1000.0,
+        "Landable": True, "Materials": [{"Name": "iron", "Percent": 20.0}, {"Name": "nickel", "Percent": 15.0}],
+        "Composition": {"Ice": 0.0, "Rock": 0.7, "Metal": 0.3},
+        "SemiMajorAxis": 1e11, "Eccentricity": 0.01, "OrbitalInclination": 0.0, "Periapsis": 0.0, "OrbitalPeriod": 3e7, "AscendingNode": 0.0,
+        "MeanAnomaly": 90.0, "RotationPeriod": 3e7, "AxialTilt": 0.1, "WasDiscovered": False, "WasMapped": False, "WasFootfalled": False,
+    }
+    event.update(fields)
+    return event
+
+def body_signals(address: int, body_id: int, biological: int, geological: int, parent_id: int = 1) -> dict[str, Any]:
+    signals: list[dict[str, Any]] = []
+    if biological:
+        signals.append({"Type": "$SAA_SignalType_Biological;", "Type_Localised": "Biological", "Count": biological})
+    if geological:
+        signals.append({"Type": "$SAA_SignalType_Geological;", "Type_Localised": "Geological", "Count": geological})
+    return {"timestamp": TIMESTAMP, "event": "FSSBodySignals", "BodyName": f"{system_name(address)} {chr(64 + parent_id)} {body_id}", "BodyID": body_id,
+            "SystemAddress": address, "Signals": signals}
+
+def bio_system_events(address: int, star_types: list[tuple[str, str]], first_planet: int, num_planets: int) -> list[dict[str, Any]]:
+    # The stars, then num_planets bio planets orbiting them in turn, taking turns at COMBINATIONS from first_planet on
+    events = [star_scan(address, body_id, star_type, luminosity) for body_id, (star_type, luminosity) in enumerate(star_types, 1)]
+    for i in range(num_planets):
+        body_id = len(star_types) + 1 + i
+        parent_id = 1 + i % len(star_types)
+        planet_class, atmosphere_type = COMBINATIONS[(first_planet + i) % len(COMBINATIONS)]
+        events.append(planet_scan(address, body_id, parent_id, planet_class, atmosphere_type, SurfaceTemperature=BIO_TEMPERATURES[i % len(BIO_TEMPERATURES)],
+                                  SurfaceGravity=0.5 + i % 5, Volcanism=VOLCANISMS[i % len(VOLCANISMS)], DistanceFromArrivalLS=100.0 + 300.0 * i))
+        events.append(body_signals(address, body_id, 1 + i % 4, 0, parent_id))
+    return events
+
+def bodies_of(events: list[dict[str, Any]]) -> Bodies:
+    # The bodies the core keeps of the events
+    bodies = Bodies()
+    for event in events:
+        bodies.add_body_signal(event)
+        for attribute in body_event_attributes(event):
+            bodies.record_attribute(attribute, event["BodyID"])
+    return bodies
+
+def bio_planets(bodies: Bodies) -> tuple[list[Any], list[int]]:
+    # The planets with biological signals and the number of signals of each
+    planets = list(bodies.query(BodyAttribute.bios))
+    return planets, [sum(signal.count for signal in planet.signals if signal.type == "$SAA_SignalType_Biological;") for planet in planets]
+
+def journal_events(num_systems: int, bodies_per_system: int = 20) -> list[dict[str, Any]]:
+    # An exploration session: a jump and a fully scanned system, again and again
+    events: list[dict[str, Any]] = [
+        {"timestamp": TIMESTAMP, "event": "Fileheader", "part": 1, "language": "English/UK", "Odyssey": True, "gameversion": "4.0.0.1904", "build": "r308767/r0 "},
+        {"timestamp": TIMESTAMP, "event": "LoadGame", "FID": "F0000000", "Commander": "Test", "Horizons": True, "Odyssey": True, "gameversion": "4.0.0.1904", "build": "r308767/r0 "},
+    ]
+    for address in range(1001, 1001 + num_systems):
+        events.append(fsd_jump(address, (float(address), 0.0, 0.0)))
+        events.append({"timestamp": TIMESTAMP, "event": "Music", "MusicTrack": "Exploration"})
+        events += [star_scan(address, body_id) for body_id in (1, 2)]
+        for body_id in range(3, bodies_per_system + 1):
+            events.append(planet_scan(address, body_id, 1 + body_id % 2))
+            if body_id % 5 == 0:
+                events.append(body_signals(address, body_id, body_id % 3, 1, 1 + body_id % 2))
+    return events
+
+def journal_line(event: dict[str, Any]) -> bytes:    # formatted the way the game writes its journal lines
+    return b"{ " + json.dumps(event, separators=(", ", ":")).encode()[1:-1] + b" }\r\n"
@@ -0,0 +1,106 @@
+import src.bios
+from src.bios import BioWorth, get_taxonomy, prediction_cache, reload_taxonomy
+from src.bios.batch import planet_worth
+from src.bios.cache import PredictionCache
+from src.bios.taxonomy import Taxonomy
+from tests.fixtures import COMBINATIONS, bio_planets, bio_system_events, bodies_of, planet_scan, star_scan
+from src.modules.core import BodyAttribute
+import types
+import unittest
+
+
+class TaxonomyTest(unittest.TestCase):
+    def test_taxonomy_names_the_module(self) -> None:
+        self.assertIsInstance(src.bios.taxonomy, types.ModuleType)
+        self.assertIs(src.bios.taxonomy.Taxonomy, Taxonomy)
+
+    def test_reload_replaces_the_current_taxonomy(self) -> None:
+        before = get_taxonomy()
+        reloaded = reload_taxonomy()
+        self.assertIsNot(reloaded, before)
+        self.assertIs(get_taxonomy(), reloaded)
+        self.assertEqual(len(prediction_cache.entries), 0)
+        self.assertEqual(len(reloaded.genera), len(before.genera))
+        self.assertEqual(len(reloaded.species), len(before.species))
+        self.assertIsInstance(src.bios.taxonomy, types.ModuleType)
+
+
+class PredictorTest(unittest.TestCase):
+    def test_predictor_matches_the_genera(self) -> None:
+        taxonomy = get_taxonomy()
+        star_types = [("K", "Va"), ("B", "IV"), ("M", "V"), ("DA", "VII"), ("N", "VII")]
+        predicted = 0
+        for address in range(1, len(COMBINATIONS) // 8 + 2):
+            bodies = bodies_of(bio_system_events(address, star_types[:1 + address % 3] if address % 2 else star_types[address % 5:], 8 * address, 8))
+            planets, counts = bio_planets(bodies)
+            expected = [planet_worth([possible for possible in (genus.list_possible_species(bodies, planet) for genus in taxonomy.genera) if possible], count)
+                        for planet, count in zip(planets, counts)]
+            self.assertEqual(taxonomy.predictor.estimate_worth(bodies, planets, counts), expected)
+            predicted += sum(1 for _, _, _, possible in expected if possible)
+        self.assertGreater(predicted, 20)
+
+    def test_worth_of_the_cheapest_and_dearest_genera(self) -> None:
+        first, second, third = sorted(get_taxonomy().species, key=lambda organism: organism.value)[:3]
+        possible = [[first, third], [second]]
+        self.assertEqual(planet_worth(possible, 1), (first.value, max(third.value, second.value), int((int((first.value + third.value) / 2) + second.value) / 2), possible))
+        self.assertEqual(planet_worth(possible, 2)[:2], (first.value + second.value, third.value + second.value))
+        self.assertEqual(planet_worth([], 3), (0, 0, 0, []))
+
+
+class PredictionCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.predictor = get_taxonomy().predictor
+        self.cache = PredictionCache(64)
+        self.bodies = bodies_of(bio_system_events(7, [("K", "Va")], 0, 6))
+        self.planets, self.counts = bio_planets(self.bodies)
+
+    def estimate(self) -> list[BioWorth]:
+        return self.cache.estimate_worth(self.predictor, 7, self.bodies, self.planets, self.counts)
+
+    def test_repeated_report_hits(self) -> None:
+        first = self.estimate()
+        self.assertEqual(first, self.predictor.estimate_worth(self.bodies, self.planets, self.counts))
+        self.assertEqual(self.estimate(), first)
+        self.assertEqual((self.cache.hits, self.cache.misses, len(self.cache)), (6, 6, 6))
+        self.assertEqual(set(self.cache.entries), {(7, planet.body_id) for planet in self.planets})
+
+    def test_entry_only_answers_for_the_planet_it_was_made_from(self) -> None:
+        self.estimate()
+        planet = self.planets[0]
+        planet.surface_temperature += 300       # not through a body event, so the entry is still there
+        self.assertEqual(self.estimate(), self.predictor.estimate_worth(self.bodies, self.planets, self.counts))
+        self.assertEqual(self.cache.misses, 7)
+        self.assertEqual(len(self.cache), 6)
+
+    def test_body_event_drops_the_planets_entry(self) -> None:
+        self.estimate()
+        planet = self.planets[2]
+        self.bodies.add_body_signal(planet_scan(7, planet.body_id, 1, planet.planet_class, planet.atmosphere_type, SurfaceTemperature=500.0))
+        self.assertNotIn((7, planet.body_id), self.cache.entries)
+        self.assertEqual((self.cache.invalidations, len(self.cache)), (1, 5))
+        self.assertEqual(self.estimate(), self.predictor.estimate_worth(self.bodies, self.planets, self.counts))
+
+    def test_new_star_drops_the_system(self) -> None:
+        self.estimate()
+        self.bodies.add_body_signal(star_scan(7, 2, "B", "IV"))
+        self.bodies.record_attribute(BodyAttribute.star, 2)
+        self.assertEqual(self.estimate(), self.predictor.estimate_worth(self.bodies, self.planets, self.counts))
+        self.assertEqual(self.cache.invalidations, 6)
+        self.assertEqual(self.cache.misses, 12)
+
+    def test_least_recently_used_planets_are_evicted(self) -> None:
+        self.cache.capacity = 4
+        self.assertEqual(self.estimate(), self.predictor.estimate_worth(self.bodies, self.planets, self.counts))
+        self.assertEqual(list(self.cache.entries), [(7, planet.body_id) for planet in self.planets[2:]])
+        other = bodies_of(bio_system_events(8, [("B", "IV")], 8, 3))
+        planets, counts = bio_planets(other)
+        self.cache.estimate_worth(self.predictor, 8, other, planets, counts)
+        self.assertEqual(list(self.cache.entries), [(7, self.planets[5].body_id)] + [(8, planet.body_id) for planet in planets])
+        self.assertEqual(self.cache.systems[7][1], {(7, self.planets[5].body_id)})
+        self.cache.estimate_worth(self.predictor, 9, other, planets[:1], counts[:1])
+        self.assertNotIn(7, self.cache.systems)
+        self.assertEqual(len(self.cache), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
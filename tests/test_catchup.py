@@ -0,0 +1,46 @@
+from tests import WORK_DIRECTORY
+from tests.fixtures import journal_events, journal_line
+from src.dispatcher import EventDispatcher
+from src.modules.core import CoreModule
+import asyncio
+import shutil
+import unittest
+
+CAUGHT_UP_LINE = b'{"event":"CaughtUp"}'
+
+
+class CatchUpHistoryTest(unittest.TestCase):
+    def setUp(self) -> None:
+        shutil.rmtree(WORK_DIRECTORY / "modules_data" / "core", ignore_errors=True)
+
+    def test_replayed_systems_have_their_bodies_in_the_history(self) -> None:
+        events = journal_events(200)
+        lines = [journal_line(event) for event in events]
+        expected: dict[int, set[int]] = {}
+        for event in events:
+            if event["event"] in CoreModule.BODY_EVENTS:
+                expected.setdefault(event["SystemAddress"], set()).add(event["BodyID"])
+        self.assertGreater(len(expected), 10)
+
+        core = CoreModule()
+        core.caught_up = False
+        dispatcher = EventDispatcher([core])
+        async def replay() -> None:
+            async with asyncio.TaskGroup() as tg:
+                for index in range(0, len(lines), 2048):   # several systems in every slice
+                    await dispatcher.dispatch_batch(lines[index:index + 2048], tg)
+                await dispatcher.dispatch_batch([CAUGHT_UP_LINE], tg)
+        asyncio.run(replay())
+
+        for address, body_ids in expected.items():
+            historic_bodies = core.history.get_bodies(address)
+            self.assertEqual({body.body_id for body in historic_bodies}, body_ids)
+            self.assertTrue(all(body.body["BodyName"] and body.attributes for body in historic_bodies))
+        self.assertEqual(core.history.count_systems(), len(expected))
+        core.history.close()
+        if core.state_log is not None:
+            core.state_log.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+from tests import WORK_DIRECTORY
+from tests.fixtures import body_signals, fsd_jump, planet_scan, star_scan
+from src.modules.core import CoreModule
+from src.modules.module import WILDCARD_SUBSCRIPTION
+import asyncio
+import msgspec
+import shutil
+import unittest
+from typing import Any
+
+
+def run_command(core: CoreModule, *arguments: str) -> None:
+    async def run() -> None:
+        async with asyncio.TaskGroup() as tg:
+            await core.process_user_input(["core", *arguments], tg)
+    asyncio.run(run())
+
+def run_events(core: CoreModule, events: list[dict[str, Any]]) -> None:
+    async def run() -> None:
+        async with asyncio.TaskGroup() as tg:
+            for event in events:
+                await core.process_event(event, tg)
+    asyncio.run(run())
+
+def close(core: CoreModule) -> None:
+    core.history.close()
+    if core.state_log is not None:
+        core.state_log.close()
+
+
+class EventStreamTest(unittest.TestCase):
+    def setUp(self) -> None:
+        shutil.rmtree(WORK_DIRECTORY / "modules_data" / "core", ignore_errors=True)
+
+    def test_eventstream_on_and_off(self) -> None:
+        core = CoreModule()
+        self.assertFalse(core.is_subscribed("Music"))
+        run_command(core, "eventstream", "on")
+        self.assertTrue(core.state.event_stream_enabled)
+        self.assertIn(WILDCARD_SUBSCRIPTION, core.subscriptions)
+        self.assertTrue(core.is_subscribed("Music"))
+        run_command(core, "eventstream", "off")
+        self.assertFalse(core.state.event_stream_enabled)
+        self.assertFalse(core.is_subscribed("Music"))
+        close(core)
+
+    def test_eventstream_restored_from_saved_state(self) -> None:
+        core = CoreModule()
+        run_command(core, "eventstream", "on")
+        core.flush_state()
+        close(core)
+        restored = CoreModule()
+        self.assertTrue(restored.state.event_stream_enabled)
+        self.assertTrue(restored.is_subscribed("Music"))
+        close(restored)
+
+
+
+class StateLogTest(unittest.TestCase):
+    def setUp(self) -> None:
+        shutil.rmtree(WORK_DIRECTORY / "modules_data" / "core", ignore_errors=True)
+
+    def scan_system(self, core: CoreModule) -> None:
+        events = [star_scan(1001, 1)] + [planet_scan(1001, body_id, 1) for body_id in range(2, 12)] + [body_signals(1001, 3, 2, 1)]
+        run_events(core, events)
+        core.flush_state()
+
+    def restore(self, core: CoreModule) -> None:
+        close(core)
+        restored = CoreModule()
+        self.assertEqual(msgspec.json.encode(restored.state.current_system), msgspec.json.encode(core.state.current_system))
+        self.assertEqual(len(restored.state.current_system.bodies.bodies), 11)
+        close(restored)
+
+    def test_body_events_replayed_from_the_log(self) -> None:
+        core = CoreModule()
+        run_events(core, [fsd_jump(1001)])
+        core.flush_state()      # the first save is a snapshot, the body events after it only go to the log
+        core.snapshot_size = 1 << 20
+        self.scan_system(core)
+        log = (WORK_DIRECTORY / "modules_data" / "core" / CoreModule.STATE_LOG_FILE_NAME).read_bytes()
+        self.assertEqual(log.count(b'["body"'), 12)
+        self.assertNotIn(b"Materials", log)
+        self.assertNotIn(b"AtmosphereComposition", log)
+        self.restore(core)
+
+    def test_log_compacted_once_larger_than_the_snapshot(self) -> None:
+        core = CoreModule()
+        run_events(core, [fsd_jump(1001)])
+        core.flush_state()
+        self.scan_system(core)
+        assert core.state_log is not None
+        self.assertLess(core.state_log.size, core.snapshot_size)
+        self.restore(core)
+
+
+class StarSystemTest(unittest.TestCase):
+    def setUp(self) -> None:
+        shutil.rmtree(WORK_DIRECTORY / "modules_data" / "core", ignore_errors=True)
+
+    def test_short_name_of_a_body_only_known_from_its_signals(self) -> None:
+        core = CoreModule()
+        run_events(core, [fsd_jump(1001), body_signals(1001, 3, 2, 0)])
+        system = core.state.current_system
+        self.assertEqual(system.short_name(system.bodies.bodies[3]), "A 3")
+        close(core)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+from tests import WORK_DIRECTORY
+from tests.fixtures import fsd_jump, planet_scan
+from src.modules.core import CoreModule
+from src.modules.eddn.eddn import EDDN
+import asyncio
+import shutil
+import unittest
+from typing import Any
+
+
+class QueuedEDDNTest(unittest.TestCase):
+    # EDDN gets its events through its own queue, so the core can already be in the next system
+    def setUp(self) -> None:
+        for module_name in ["core", "eddn"]:
+            shutil.rmtree(WORK_DIRECTORY / "modules_data" / module_name, ignore_errors=True)
+        self.core = CoreModule()
+        self.eddn = EDDN(self.core)
+        self.posted: list[dict[str, Any]] = []
+        async def post(message_data: dict[str, Any], schema: Any) -> None:
+            self.posted.append(message_data)
+        self.eddn.validate_and_post = post
+
+    def tearDown(self) -> None:
+        self.core.history.close()
+        if self.core.state_log is not None:
+            self.core.state_log.close()
+
+    def send(self, *events: dict[str, Any]) -> None:
+        async def run() -> None:
+            async with asyncio.TaskGroup() as tg:
+                for event in events:
+                    await self.eddn.process_event(event, tg)
+        asyncio.run(run())
+
+    def test_system_fields_come_from_the_events_own_system(self) -> None:
+        first_jump, second_jump = fsd_jump(1001, (10.0, 0.0, 0.0)), fsd_jump(1002, (20.0, 0.0, 0.0))
+        self.core.enter_system(second_jump["StarSystem"], tuple(second_jump["StarPos"]), second_jump["SystemAddress"])
+        self.send(first_jump, planet_scan(1001, 3, 1))
+        self.assertEqual(len(self.posted), 2)
+        for message in self.posted:
+            self.assertEqual(message["StarSystem"], first_jump["StarSystem"])
+            self.assertEqual(message["SystemAddress"], 1001)
+            self.assertEqual(message["StarPos"], first_jump["StarPos"])
+
+    def test_events_of_an_unknown_system_are_not_posted(self) -> None:
+        self.send(fsd_jump(1001, (10.0, 0.0, 0.0)), planet_scan(1002, 3, 1))
+        self.assertEqual([message["event"] for message in self.posted], ["FSDJump"])
+
+    def test_caught_up_starts_from_the_core_system(self) -> None:
+        jump = fsd_jump(1001, (10.0, 0.0, 0.0))
+        self.core.enter_system(jump["StarSystem"], tuple(jump["StarPos"]), jump["SystemAddress"])
+        self.eddn.caught_up = False
+        self.send({"event": "CaughtUp"}, planet_scan(1001, 3, 1))
+        self.assertEqual(len(self.posted), 1)
+        self.assertEqual(self.posted[0]["StarPos"], jump["StarPos"])
+
+    def test_client_closed_when_disabled_or_shut_down(self) -> None:
+        async def run() -> None:
+            client = self.eddn.client()
+            self.eddn.disable()
+            self.assertIsNone(self.eddn.httpx_client)
+            await self.eddn.close()
+            self.assertTrue(client.is_closed)
+            self.eddn.enable()
+            client = self.eddn.client()
+            await self.eddn.close()
+            self.assertTrue(client.is_closed)
+        asyncio.run(run())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+from tests import WORK_DIRECTORY
+from tests.test_status import write_status
+from src.modules.exobiology import SAMPLES_NEEDED, Exobiology, great_circle_distance
+from src.status import StatusReader
+import asyncio
+import math
+import shutil
+import unittest
+from typing import Any
+
+MOON_RADIUS = 1737.4e3      # m
+BODY_NAME = "Test AB-C d7-0 A 3"
+
+
+def scan_organic(scan_type: str, body_id: int = 3, species: str = "$Codex_Ent_Bacterial_12_Name;") -> dict[str, Any]:
+    return {"timestamp": "2026-01-01T00:00:00Z", "event": "ScanOrganic", "ScanType": scan_type, "Genus": "$Codex_Ent_Bacterial_Genus_Name;",
+            "Genus_Localised": "Bacterium", "Species": species, "Species_Localised": "Bacterium Cerbrus", "SystemAddress": 7, "Body": body_id}
+
+
+class GreatCircleDistanceTest(unittest.TestCase):
+    def test_known_distances(self) -> None:
+        self.assertEqual(great_circle_distance((12.5, 40.0), (12.5, 40.0), MOON_RADIUS), 0.0)
+        self.assertAlmostEqual(great_circle_distance((0.0, 0.0), (0.0, 90.0), 1.0), math.pi / 2)
+        self.assertAlmostEqual(great_circle_distance((90.0, 0.0), (-90.0, 0.0), 1.0), math.pi)
+        self.assertAlmostEqual(great_circle_distance((0.0, 179.5), (0.0, -179.5), 1.0), math.radians(1.0))
+        # One degree of latitude on the Moon is about 30.3 km, Paris to London about 343.5 km on a 6371 km Earth
+        self.assertAlmostEqual(great_circle_distance((0.0, 10.0), (1.0, 10.0), MOON_RADIUS), 30323.35, delta=0.01)
+        self.assertAlmostEqual(great_circle_distance((48.8566, 2.3522), (51.5074, -0.1278), 6371e3) / 1e3, 343.5, delta=0.1)
+
+
+class SamplingTest(unittest.TestCase):
+    def setUp(self) -> None:
+        shutil.rmtree(WORK_DIRECTORY / "modules_data" / "exobiology", ignore_errors=True)
+        self.status_path = WORK_DIRECTORY / "journal" / "Status.json"
+        self.mtime_ns = 10**18
+        self.exobiology = Exobiology()
+        self.exobiology.status_reader = StatusReader(self.status_path, read_interval=0.0)
+
+    def move_to(self, latitude: float, longitude: float, body_name: str = BODY_NAME) -> None:
+        self.mtime_ns += 1
+        write_status(self.status_path, self.mtime_ns, Latitude=latitude, Longitude=longitude, BodyName=body_name, PlanetRadius=MOON_RADIUS)
+
+    def test_log_sample_analyse(self) -> None:
+        self.move_to(0.0, 0.0)
+        self.exobiology.record_sample(scan_organic("Log"))
+        sampling = self.exobiology.sampling
+        assert sampling is not None
+        self.assertEqual((sampling.count, sampling.colony_range, sampling.body_name, sampling.positions), (1, 500, BODY_NAME, [(0.0, 0.0)]))
+        self.move_to(0.0, 0.01)
+        self.assertAlmostEqual(self.exobiology.distance_to_samples(sampling) or 0.0, 303.2, places=1)
+        self.move_to(0.0, 0.02)
+        self.exobiology.record_sample(scan_organic("Sample"))
+        self.assertIs(self.exobiology.sampling, sampling)
+        self.assertEqual((sampling.count, len(sampling.positions)), (2, 2))
+        self.exobiology.record_sample(scan_organic("Sample"))
+        self.assertEqual(sampling.count, SAMPLES_NEEDED)
+        self.assertIsNone(self.exobiology.sampling)
+        self.exobiology.record_sample(scan_organic("Analyse"))
+        self.assertIsNone(self.exobiology.sampling)
+
+    def test_started_mid_species(self) -> None:
+        self.move_to(0.0, 0.0)
+        self.exobiology.record_sample(scan_organic("Sample"))
+        sampling = self.exobiology.sampling
+        assert sampling is not None
+        self.assertEqual((sampling.count, len(sampling.positions)), (2, 1))
+        self.exobiology.record_sample(scan_organic("Sample", species="$Codex_Ent_Bacterial_01_Name;"))
+        self.assertIsNot(self.exobiology.sampling, sampling)     # another species starts over
+        self.exobiology.record_sample(scan_organic("Sample", species="$Codex_Ent_Bacterial_01_Name;"))
+        self.assertIsNone(self.exobiology.sampling)
+
+    def test_tracking_stops_on_leaving_the_body(self) -> None:
+        self.move_to(0.0, 0.0)
+        self.exobiology.record_sample(scan_organic("Log"))
+        sampling = self.exobiology.sampling
+        assert sampling is not None
+        async def track() -> None:
+            tracking = asyncio.create_task(self.exobiology.track())
+            self.move_to(0.0, 0.1)
+            await asyncio.sleep(0.01)
+            self.assertFalse(tracking.done())
+            self.assertTrue(sampling.outside)
+            self.move_to(0.0, 0.1, body_name="Test AB-C d7-0 A 4")
+            await asyncio.wait_for(tracking, 1.0)
+        asyncio.run(track())
+        self.assertIsNone(self.exobiology.distance_to_samples(sampling))
+        self.assertIs(self.exobiology.sampling, sampling)   # the next sample of the species follows again
+
+    def test_tracking_stops_once_sampled(self) -> None:
+        self.move_to(0.0, 0.0)
+        self.exobiology.record_sample(scan_organic("Log"))
+        async def track() -> None:
+            tracking = asyncio.create_task(self.exobiology.track())
+            await asyncio.sleep(0.01)
+            self.exobiology.record_sample(scan_organic("Analyse"))
+            await asyncio.wait_for(tracking, 1.0)
+        asyncio.run(track())
+
+
+if __name__ == "__main__":
+    unittest.main()
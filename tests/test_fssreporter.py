@@ -0,0 +1,114 @@
+from tests import WORK_DIRECTORY
+from tests.fixtures import body_signals, fsd_jump, planet_scan, star_scan
+from tests.test_core import close, run_events
+from src.modules.core import CoreModule
+from src.modules.fssreporter import FSSReporter
+import asyncio
+import shutil
+import unittest
+from typing import Any
+
+UNCHANGED_LINE = "Unchanged since the last report: valuable planets, biological signatures, geological signatures"
+
+
+class ReportTest(unittest.TestCase):
+    def setUp(self) -> None:
+        for module_name in ["core", "fssreporter"]:
+            shutil.rmtree(WORK_DIRECTORY / "modules_data" / module_name, ignore_errors=True)
+        self.core = CoreModule()
+        self.reporter = self.new_reporter()
+        self.send(fsd_jump(7), star_scan(7, 1, "A", "V"),
+                  planet_scan(7, 2, 1, "Water world", "Water", TerraformState="Terraformable"),
+                  planet_scan(7, 3, 1, "Rocky body", "None", SurfaceTemperature=180.0), body_signals(7, 3, 2, 0),
+                  planet_scan(7, 4, 1, "Rocky body", "None", Volcanism="minor rocky magma volcanism"), body_signals(7, 4, 0, 2))
+
+    def tearDown(self) -> None:
+        close(self.core)
+
+    def new_reporter(self) -> FSSReporter:
+        # Prints into self.printed, counts how often the biological section is worked out in self.predictions
+        reporter = FSSReporter(self.core)
+        self.printed: list[str] = []
+        self.predictions = 0
+        def print_line(*values: str, sep: str = " ", end: str = "\n", prefix: str | None = None) -> None:
+            self.printed.append(sep.join(values))
+        biological_lines = reporter.biological_lines
+        def counted_biological_lines(*arguments: Any) -> Any:
+            self.predictions += 1
+            return biological_lines(*arguments)
+        reporter.print = print_line
+        reporter.biological_lines = counted_biological_lines
+        return reporter
+
+    def send(self, *events: dict[str, Any]) -> None:
+        run_events(self.core, list(events))
+        async def run() -> None:
+            async with asyncio.TaskGroup() as tg:
+                for event in events:
+                    await self.reporter.process_event(event, tg)
+        asyncio.run(run())
+
+    def render(self, full: bool = False) -> str:
+        self.printed.clear()
+        self.reporter.render_report(full)
+        return "\n".join(self.printed)
+
+    def test_partial_report_leaves_out_unchanged_sections(self) -> None:
+        first = self.render()
+        self.assertIn("Valuable planets: 1", first)
+        self.assertIn("Biological signatures", first)
+        self.assertNotIn("Unchanged", first)
+        self.send(planet_scan(7, 5, 1, "Rocky body", "None"))
+        partial = self.render()
+        self.assertIn("Planets: 4", partial)
+        self.assertIn(UNCHANGED_LINE, partial)
+        self.assertNotIn("Valuable planets: 1", partial)
+        self.assertEqual(self.predictions, 1)
+        full = self.render(full=True)
+        self.assertNotIn("Unchanged", full)
+        self.assertEqual(full.split("\n")[5:], first.split("\n")[5:])   # below the counts and the value
+        self.assertEqual(self.predictions, 1)
+
+    def test_section_shown_again_once_changed(self) -> None:
+        self.render()
+        self.send(body_signals(7, 5, 0, 1), planet_scan(7, 5, 1, "Rocky body", "None", Volcanism="minor rocky magma volcanism"))
+        partial = self.render()
+        self.assertIn("Geological signatures", partial)
+        self.assertIn("Unchanged since the last report: valuable planets, biological signatures", partial)
+        self.assertEqual(self.predictions, 1)
+
+    def test_biological_section_follows_the_bodies_its_species_depend_on(self) -> None:
+        self.render()
+        self.send(planet_scan(7, 6, 1, "Earthlike body", "Nitrogen"))    # a needed planet of Amphora Plant
+        self.render()
+        self.assertEqual(self.predictions, 2)
+        self.send(planet_scan(7, 7, 1, "Earthlike body", "Nitrogen"))    # the system already had one
+        self.render()
+        self.assertEqual(self.predictions, 2)
+        self.send(star_scan(7, 8, "M", "V"))
+        self.render()
+        self.assertEqual(self.predictions, 3)
+
+    def test_incremental_report_matches_a_fresh_one(self) -> None:
+        self.render()
+        for events in [(planet_scan(7, 6, 1, "Earthlike body", "Nitrogen"),), (star_scan(7, 8, "M", "V"),),
+                       (planet_scan(7, 9, 8, "Rocky body", "None", SurfaceTemperature=160.0), body_signals(7, 9, 3, 0, 8)),
+                       (body_signals(7, 3, 1, 0),)]:
+            self.send(*events)
+            self.render()
+            sections = dict(self.reporter.report.sections)
+            self.reporter = self.new_reporter()
+            self.render(full=True)
+            self.assertEqual(self.reporter.report.sections, sections)
+
+    def test_all_bodies_found_of_an_earlier_system(self) -> None:
+        self.send({"timestamp": "2026-01-01T00:00:00Z", "event": "FSSAllBodiesFound", "SystemName": "Old", "SystemAddress": 6, "Count": 3})
+        self.assertEqual(self.printed, [])
+        self.assertFalse(self.reporter.report_scheduled)
+        self.send({"timestamp": "2026-01-01T00:00:00Z", "event": "FSSAllBodiesFound", "SystemName": "Test", "SystemAddress": 7, "Count": 4})
+        self.assertTrue(self.reporter.report_scheduled)
+        self.assertIn("Full", "\n".join(self.printed))
+
+
+if __name__ == "__main__":
+    unittest.main()
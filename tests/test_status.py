@@ -0,0 +1,69 @@
+from tests import WORK_DIRECTORY
+from src.status import StatusReader
+import json
+import os
+import unittest
+from typing import Any
+
+
+def write_status(path: os.PathLike[str], mtime_ns: int, **fields: Any) -> None:
+    # The file as the game writes it, with the modification time set so that rewrites within one clock tick still differ
+    with open(path, "w") as file:
+        file.write(json.dumps({"timestamp": "2026-01-01T00:00:00Z", "event": "Status", "Flags": 0, **fields}))
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class StatusReaderTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.path = WORK_DIRECTORY / "journal" / "Status.json"
+        self.path.unlink(missing_ok=True)
+
+    def test_no_status_until_the_file_is_there(self) -> None:
+        reader = StatusReader(self.path, read_interval=0.0)
+        self.assertIsNone(reader.read())
+        write_status(self.path, 10**18, Latitude=1.5, Longitude=-2.5, BodyName="Test A 1", PlanetRadius=2e6)
+        status = reader.read()
+        assert status is not None
+        self.assertEqual((status.position, status.body_name, status.planet_radius), ((1.5, -2.5), "Test A 1", 2e6))
+
+    def test_decoded_only_when_the_file_changes(self) -> None:
+        reader = StatusReader(self.path, read_interval=0.0)
+        write_status(self.path, 10**18, Latitude=1.0, Longitude=1.0)
+        first = reader.read()
+        self.assertIs(reader.read(), first)
+        self.assertEqual((reader.checks, reader.decodes), (2, 1))
+        write_status(self.path, 10**18 + 1, Latitude=1.0, Longitude=1.0)     # same size, newer
+        self.assertIsNot(reader.read(), first)
+        write_status(self.path, 10**18 + 1, Latitude=1.25, Longitude=1.0)    # same time, other size
+        status = reader.read()
+        assert status is not None
+        self.assertEqual(status.latitude, 1.25)
+        self.assertEqual((reader.checks, reader.decodes), (4, 3))
+
+    def test_checked_at_most_once_per_interval(self) -> None:
+        reader = StatusReader(self.path, read_interval=3600.0)
+        write_status(self.path, 10**18, Latitude=1.0, Longitude=1.0)
+        first = reader.read()
+        write_status(self.path, 10**18 + 1, Latitude=2.0, Longitude=1.0)
+        self.assertIs(reader.read(), first)
+        self.assertEqual(reader.checks, 1)
+        status = reader.read(force=True)
+        assert status is not None
+        self.assertEqual(status.latitude, 2.0)
+        self.assertEqual((reader.checks, reader.decodes), (2, 2))
+
+    def test_half_written_file_keeps_the_previous_status(self) -> None:
+        reader = StatusReader(self.path, read_interval=0.0)
+        write_status(self.path, 10**18, Latitude=1.0, Longitude=1.0)
+        first = reader.read()
+        self.path.write_text('{"timestamp": "2026-01-01T00:00:00Z", "event": "Sta')
+        self.assertIs(reader.read(), first)
+        self.assertEqual(reader.decodes, 1)
+        write_status(self.path, 10**18 + 2, Latitude=3.0, Longitude=1.0)
+        status = reader.read()
+        assert status is not None
+        self.assertEqual((status.latitude, reader.decodes), (3.0, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()